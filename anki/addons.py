@@ -10,8 +10,10 @@ digits.
 
 import io
 import json
+import logging
 import os
 import re
+import time
 import traceback
 import zipfile
 from collections import defaultdict
@@ -24,14 +26,29 @@ from jsonschema.exceptions import ValidationError
 from send2trash import send2trash
 
 from anki.consts import appShared
+from anki.hooks import addHookLoader
 from anki.incorporatedAddons import addonsNotToLoad
 from anki.lang import _
+from anki.profiler import startupProfiler
 from anki.sync import AnkiRequestsClient
 from anki.utils import intTime
 
+log = logging.getLogger(__name__)
+
 
 class AddonManager:
-    """pm -- some anki.profiles.ProfileManager. Used to get the base folder."""
+    """pm -- some anki.profiles.ProfileManager. Used to get the base folder.
+    loadTimes -- for each add-on imported, the seconds its import took.
+    deferred -- the deferred add-ons, not yet loaded.
+
+    The meta of an add-on may set "loading" to:
+    -- "startup", the default: the add-on is loaded by loadAddons,
+    -- "deferred": the add-on is loaded by loadDeferredAddons, once the main
+    window is shown,
+    -- "lazy": the add-on is loaded when one of the hooks listed in
+    "loadOnHooks" is first run. Without such hooks, it is deferred.
+    In each case, add-ons are loaded in the order of allAddons.
+    """
     ext = ".ankiaddon"
     _manifest_schema = {
         "type": "object",
@@ -43,6 +60,16 @@ class AddonManager:
                 "type": "array",
                 "items": {"type": "string"},
                 "meta": True
+            },
+            "loading": {
+                "type": "string",
+                "enum": ["startup", "deferred", "lazy"],
+                "meta": True
+            },
+            "loadOnHooks": {
+                "type": "array",
+                "items": {"type": "string"},
+                "meta": True
             }
         },
         "required": ["package", "name"]
@@ -51,6 +78,8 @@ class AddonManager:
     def __init__(self, pm):
         self.dirty = False
         self.pm = pm
+        self.loadTimes = {}
+        self.deferred = []
 
     def allAddons(self):
         """List of installed add-ons' folder name
@@ -98,7 +127,8 @@ class AddonManager:
 
 
     def loadAddons(self):
-        """List of errors due to add-on loading"""
+        """List of errors due to add-on loading, as pairs (traceback,
+        meta). Deferred and lazy add-ons are not loaded yet."""
         errors = []
         for dir in self.allAddons():
             meta = self.addonMeta(dir)
@@ -106,12 +136,68 @@ class AddonManager:
                 continue
             if self.isIncorporated(dir):
                 continue
-            self.dirty = True
+            loading = meta.get("loading", "startup")
+            if loading == "lazy" and meta.get("loadOnHooks"):
+                for hook in meta["loadOnHooks"]:
+                    addHookLoader(hook, lambda dir=dir: self._loadLazyAddon(dir))
+            elif loading in ("lazy", "deferred"):
+                self.deferred.append(dir)
+            else:
+                error = self.loadAddon(dir)
+                if error:
+                    errors.append(error)
+        return errors
+
+    def loadDeferredAddons(self):
+        """Load the deferred add-ons. List of errors, as in loadAddons."""
+        deferred, self.deferred = self.deferred, []
+        errors = []
+        for dir in deferred:
+            error = self.loadAddon(dir)
+            if error:
+                errors.append(error)
+        return errors
+
+    def _loadLazyAddon(self, dir):
+        error = self.loadAddon(dir)
+        if error:
+            self.reportErrors([error])
+
+    def loadAddon(self, dir):
+        """Import add-on dir, unless it is already, and record the time it
+        took. The pair (traceback, meta) if it failed, None otherwise."""
+        if dir in self.loadTimes:
+            return None
+        self.dirty = True
+        start = time.perf_counter()
+        error = None
+        with startupProfiler.phase("add-on " + dir):
             try:
                 __import__(dir)
             except:
-                errors.append((traceback.format_exc(), meta))
-        return errors
+                meta = self.addonMeta(dir)
+                meta.setdefault("name", dir)
+                error = (traceback.format_exc(), meta)
+        self.loadTimes[dir] = time.perf_counter() - start
+        return error
+
+    def reportErrors(self, errors):
+        """Tell the user about errors, as returned by loadAddons. Here
+        they are logged; the GUI shows them."""
+        for tb, meta in errors:
+            log.error("When loading '%s':\n%s", meta["name"], tb)
+
+    def loadingDescription(self, dir):
+        """How add-on dir was loaded, and how long it took. None if it is
+        not to be loaded."""
+        if dir in self.loadTimes:
+            return _("loaded in %d ms") % (self.loadTimes[dir] * 1000)
+        if dir in self.deferred:
+            return _("deferred")
+        meta = self.addonMeta(dir)
+        if meta.get("loading") == "lazy" and not meta.get("disabled"):
+            return _("lazy, not used yet")
+        return None
 
     def isIncorporated(self, dir):
         return dir in addonsNotToLoad or (re.match(r"^\d+$", dir) and int(dir) in addonsNotToLoad)
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+# Copyright: Ankitects Pty Ltd and contributors
+# License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
+
+"""
+Backups of a collection.
+
+A backup is usually a .colpkg file, compressed by BackupThread from a
+snapshot of the collection. The files of the daily, monthly and yearly
+backups made at the same time are links to this file.
+
+Incremental backups are an alternative. The collection file is cut in
+blocks of blockSize bytes, a multiple of sqlite's page size. Each
+block is saved once, compressed, in the folder "blocks" of the backup
+folder, under the sha1 of its content. A backup is a manifest, a json
+file listing the hashes of the blocks of the collection. Thus a backup
+only costs the blocks which changed since the other backups, and
+deleting a backup consists in deleting its manifest and then pruning
+the blocks no manifest refers to.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+import zipfile
+import zlib
+from threading import Thread
+
+from anki.db import DB
+from anki.utils import tmpfile
+
+log = logging.getLogger(__name__)
+
+
+def snapshot(colPath):
+    """A temporary copy of the collection at colPath, consistent even if
+    the collection is open."""
+    path = tmpfile(suffix=".anki2")
+    db = DB(colPath)
+    try:
+        db.backupTo(path)
+    finally:
+        db.close()
+    return path
+
+
+class BackupThread(Thread):
+    """Compress a snapshot of the collection into path, and give the
+    same content to the files links.
+
+    snapshot -- a copy of the collection, deleted once compressed
+    metrics -- dict in which compression time and sizes are recorded
+    """
+    def __init__(self, path, snapshot, links, metrics):
+        Thread.__init__(self)
+        self.path = path
+        self.snapshot = snapshot
+        self.links = links
+        self.metrics = metrics
+        # create the compressed file in the calling thread, so that a
+        # backup started before this one ends doesn't write it too. The
+        # links are created after it is written.
+        open(self.path, "wb").close()
+
+    def run(self):
+        startTime = time.time()
+        zip = zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED)
+        # read from disk while compressed
+        zip.write(self.snapshot, "collection.anki2")
+        zip.writestr("media", "{}")
+        zip.close()
+        os.unlink(self.snapshot)
+        self.metrics['compressSeconds'] = time.time() - startTime
+        self.metrics['backupBytes'] = os.path.getsize(self.path)
+        # the other backups are identical, no need to compress again
+        self.metrics['linked'] = 0
+        for link in self.links:
+            if os.path.exists(link):
+                continue
+            try:
+                os.link(self.path, link)
+                self.metrics['linked'] += 1
+            except OSError:
+                # file system without hard links
+                shutil.copyfile(self.path, link)
+        log.info("backup %s: %s", os.path.basename(self.path), self.metrics)
+
+
+class IncrementalBackups:
+
+    """
+    folder -- the folder containing the manifests
+    blocksFolder -- the folder containing the blocks
+    """
+
+    # 16 pages of 4096 bytes
+    blockSize = 65536
+    extension = ".colinc"
+    version = 1
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.blocksFolder = os.path.join(folder, "blocks")
+
+    # Saving
+    ######################################################################
+
+    def save(self, colPath, paths):
+        """Save a backup of the collection at colPath, with a manifest at
+        each path of paths. Return a dict of metrics: the size of the
+        collection, the number of blocks, and the number and size of
+        the blocks which were not already saved."""
+        copy = snapshot(colPath)
+        try:
+            return self.saveSnapshot(copy, paths)
+        finally:
+            os.unlink(copy)
+
+    def saveSnapshot(self, snapshot, paths):
+        """Save a backup of the copy of the collection snapshot, as
+        save."""
+        manifest, metrics = self._saveBlocks(snapshot)
+        for path in paths:
+            self._writeAtomically(path, json.dumps(manifest).encode("utf8"))
+        return metrics
+
+    def _saveBlocks(self, path):
+        """The manifest of the file at path, and the metrics of save. The
+        missing blocks are saved."""
+        blocks = []
+        newBlocks = 0
+        newBytes = 0
+        whole = hashlib.sha1()
+        with open(path, "rb") as file:
+            while True:
+                block = file.read(self.blockSize)
+                if not block:
+                    break
+                whole.update(block)
+                digest = hashlib.sha1(block).hexdigest()
+                blocks.append(digest)
+                blockPath = self._blockPath(digest)
+                if not os.path.exists(blockPath):
+                    data = zlib.compress(block)
+                    os.makedirs(os.path.dirname(blockPath), exist_ok=True)
+                    self._writeAtomically(blockPath, data)
+                    newBlocks += 1
+                    newBytes += len(data)
+        size = os.path.getsize(path)
+        manifest = dict(version=self.version, blockSize=self.blockSize,
+                        size=size, sha1=whole.hexdigest(), blocks=blocks)
+        metrics = dict(collectionBytes=size, blocks=len(blocks),
+                       newBlocks=newBlocks, newBytes=newBytes)
+        return manifest, metrics
+
+    def _writeAtomically(self, path, data):
+        "Write data at path, so that path is never partially written."
+        tmpPath = path + ".tmp"
+        with open(tmpPath, "wb") as file:
+            file.write(data)
+        os.replace(tmpPath, path)
+
+    def _blockPath(self, digest):
+        return os.path.join(self.blocksFolder, digest[:2], digest)
+
+    # Restoring
+    ######################################################################
+
+    def restore(self, manifestPath, path):
+        """Write at path the collection saved in the manifest. Raise an
+        exception if a block is missing or corrupt."""
+        manifest = self._manifest(manifestPath)
+        whole = hashlib.sha1()
+        with open(path, "wb") as file:
+            for digest in manifest['blocks']:
+                block = self._block(digest)
+                whole.update(block)
+                file.write(block)
+        if whole.hexdigest() != manifest['sha1']:
+            raise Exception("Backup %s is corrupt" % manifestPath)
+
+    def _manifest(self, manifestPath):
+        with open(manifestPath, "rb") as file:
+            manifest = json.loads(file.read().decode("utf8"))
+        if manifest.get('version') != self.version:
+            raise Exception("Unknown backup format in %s" % manifestPath)
+        return manifest
+
+    def _block(self, digest):
+        "The content of the block digest, checked against its hash."
+        with open(self._blockPath(digest), "rb") as file:
+            block = zlib.decompress(file.read())
+        if hashlib.sha1(block).hexdigest() != digest:
+            raise Exception("Block %s is corrupt" % digest)
+        return block
+
+    # Checking and pruning
+    ######################################################################
+
+    def manifests(self):
+        "The paths of the manifests of the folder."
+        return sorted(os.path.join(self.folder, file)
+                      for file in os.listdir(self.folder)
+                      if file.endswith(self.extension))
+
+    def verify(self):
+        """Check that each block of each manifest exists and matches its
+        hash. Return the list of problems found."""
+        problems = []
+        checked = {}
+        for manifestPath in self.manifests():
+            name = os.path.basename(manifestPath)
+            try:
+                manifest = self._manifest(manifestPath)
+            except Exception as e:
+                problems.append("%s: %s" % (name, e))
+                continue
+            bad = 0
+            for digest in manifest['blocks']:
+                if digest not in checked:
+                    try:
+                        self._block(digest)
+                        checked[digest] = True
+                    except Exception:
+                        checked[digest] = False
+                bad += not checked[digest]
+            if bad:
+                problems.append("%s: %d missing or corrupt blocks" % (name, bad))
+        return problems
+
+    def prune(self):
+        """Delete the blocks no manifest refers to. Return the number of
+        blocks deleted. Nothing is deleted while a manifest is unreadable,
+        as it may be partly written, or from a newer version."""
+        if not os.path.exists(self.blocksFolder):
+            return 0
+        used = set()
+        for manifestPath in self.manifests():
+            try:
+                used.update(self._manifest(manifestPath)['blocks'])
+            except Exception:
+                log.error("not pruning the backups, %s is unreadable",
+                          manifestPath, exc_info=True)
+                return 0
+        removed = 0
+        for subfolder in os.listdir(self.blocksFolder):
+            subfolderPath = os.path.join(self.blocksFolder, subfolder)
+            for digest in os.listdir(subfolderPath):
+                if digest not in used:
+                    os.unlink(os.path.join(subfolderPath, digest))
+                    removed += 1
+        return removed
+
+
+class IncrementalBackupThread(Thread):
+    """Save a snapshot of the collection as an incremental backup, then
+    delete the blocks no backup refers to anymore.
+
+    backups -- the IncrementalBackups of the backup folder
+    snapshot -- a copy of the collection, deleted once saved
+    paths -- the paths of the manifests to write
+    metrics -- dict in which the metrics of save and the time taken are
+    recorded
+    """
+    def __init__(self, backups, snapshot, paths, metrics):
+        Thread.__init__(self)
+        self.backups = backups
+        self.snapshot = snapshot
+        self.paths = paths
+        self.metrics = metrics
+
+    def run(self):
+        startTime = time.time()
+        try:
+            self.metrics.update(self.backups.saveSnapshot(
+                self.snapshot, self.paths))
+        finally:
+            os.unlink(self.snapshot)
+        self.metrics['saveSeconds'] = time.time() - startTime
+        # pruning while blocks are saved could delete them, so it is done
+        # here
+        self.metrics['prunedBlocks'] = self.backups.prune()
+        log.info("incremental backup %s: %s",
+                 os.path.basename(self.paths[0]), self.metrics)
@@ -2,7 +2,6 @@
 # Copyright: Ankitects Pty Ltd and contributors
 # License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
 
-import copy
 import datetime
 import json
 import os
@@ -12,6 +11,7 @@ import re
 import sys
 import time
 import traceback
+from contextlib import contextmanager
 
 import anki.cards
 import anki.decks
@@ -19,15 +19,19 @@ import anki.find
 import anki.latex  # sets up hook
 import anki.notes
 import anki.template
+from anki import registry
 from anki.consts import *
 from anki.errors import AnkiError
 from anki.fixing import FixingManager
 from anki.hooks import runFilter, runHook
+from anki.indexadvisor import indexAdvisor
 from anki.lang import _
 from anki.media import MediaManager
 from anki.models import ModelManager
+from anki.profiler import startupProfiler
 from anki.sound import stripSounds
 from anki.tags import TagManager
+from anki.undo import UndoJournal
 from anki.utils import (devMode, fieldChecksum, ids2str, intTime, joinFields,
                         maxID, nthField, splitFields, stripHTMLMedia)
 
@@ -64,7 +68,7 @@ class _Collection:
     This object is usually denoted col
 
     _lastSave -- time of the last save. Initially time of creation.
-    _undo -- An undo object. See below
+    _undo -- the UndoJournal of the changes, to undo and redo them
 
     The collection is an object composed of:
     id -- arbitrary number since there is only one row
@@ -131,32 +135,34 @@ class _Collection:
     "
     """
 
-    """An undo object is of the form
-    [type, undoName, data]
-    Here, type is 1 for review, 2 for checkpoint.
-    undoName is the name of the action to undo. Used in the edit menu,
-    and in tooltip stating that undo was done.
-
+    """
     server -- Whether to pretend to be the server. Only set to true during anki.sync.Syncer.remove; i.e. while removing what the server says to remove. When set to true:
     * the usn returned by self.usn is self._usn, otherwise -1.
     * media manager does not connect nor close database connexion (I've no idea why)
+    objectTables -- Whether the models, decks and deck options are stored
+    one row per object, see setObjectTables.
+    dbProfile -- the performance profile of the connection, applied again
+    by reopen. See anki.db.dbProfiles.
+    latex -- the LatexBuilder generating the images of the LaTeX, and
+    remembering the failures
     """
     def __init__(self, db, server=False, log=False, DeckManager=None):
         self._debugLog = log
         self.db = db
         self.path = db._path
+        self.dbProfile = db.profile
         self._openLog()
         self.log(self.path, anki.version)
         self.server = server
         self._lastSave = time.time()
-        self.clearUndo()
+        self._undo = UndoJournal(self.db)
         self.media = MediaManager(self, server)
         self.models = ModelManager(self)
         DeckManager = DeckManager or anki.decks.DeckManager
         self.decks = DeckManager(self)
         self.tags = TagManager(self)
+        self.latex = anki.latex.LatexBuilder(self)
         self.load()
-        self.buggedLatex ={} # Ensure that the same image is never compiled twice with the same compiler
         if not self.crt:
             dt = datetime.datetime.today()
             dt -= datetime.timedelta(hours=4)
@@ -221,24 +227,45 @@ class _Collection:
     ##########################################################################
 
     def load(self):
-        (self.crt,
-         self.mod,
-         self.scm,
-         self.dty, # no longer used
-         self._usn,
-         self.ls,
-         self.conf,
-         models,
-         decks,
-         dconf,
-         tags) = self.db.first("""
+        """Load the collection's variables and registries. The time taken
+        by each step is in loadTimes, and in the startup profile."""
+        self.loadTimes = {}
+        with self._loadStep("read"):
+            (self.crt,
+             self.mod,
+             self.scm,
+             self.dty, # no longer used
+             self._usn,
+             self.ls,
+             self.conf,
+             models,
+             decks,
+             dconf,
+             tags) = self.db.first("""
 select crt, mod, scm, dty, usn, ls,
 conf, models, decks, dconf, tags from col""")
-        self.conf = json.loads(self.conf)
-        self.models.load(models)
-        self.decks.load(decks, dconf)
-        self.tags.load(tags)
+            self.conf = json.loads(self.conf)
+            self.objectTables = registry.hasObjectTables(self.db)
+            if self.objectTables:
+                models = registry.loadBlob(self.db, "models", models)
+                decks = registry.loadBlob(self.db, "decks", decks)
+                dconf = registry.loadBlob(self.db, "dconf", dconf)
+        with self._loadStep("models"):
+            self.models.load(models)
+        with self._loadStep("decks"):
+            self.decks.load(decks, dconf)
+        with self._loadStep("tags"):
+            self.tags.load(tags)
+            self.tags.loadIndex()
         self.loadSqlFns()
+        self.log("load times", self.loadTimes)
+
+    @contextmanager
+    def _loadStep(self, name):
+        start = time.perf_counter()
+        with startupProfiler.phase("collection: " + name):
+            yield
+        self.loadTimes[name] = time.perf_counter() - start
 
     def loadSqlFns(self):
         """Add some function to the database. E.g. it can be used to sort
@@ -265,26 +292,44 @@ is only necessary if you modify properties of this object or the conf dict."""
 crt=?, mod=?, scm=?, dty=?, usn=?, ls=?, conf=?""",
             self.crt, self.mod, self.scm, self.dty,
             self._usn, self.ls, json.dumps(self.conf))
+        self.tags.setIndexMod(self.mod)
 
     def save(self, name=None, mod=None):
         """
         Flush, commit DB, and take out another write lock.
 
-        name --
+        name -- if set, the changes from now on can be undone as the
+        action name, see checkpoint
         """
-        # let the managers conditionally flush
-        self.models.flush()
-        self.decks.flush()
-        self.tags.flush()
-        # and flush deck + bump mod if db has been changed
+        self._flushAll(mod=mod)
         if self.db.mod:
-            self.flush(mod=mod)
+            self._undo.prune()
             self.db.commit()
             self.lock()
             self.db.mod = False
         self._markOp(name)
         self._lastSave = time.time()
 
+    def checkpoint(self, name):
+        """The changes from now on can be undone as the action name. Unlike
+        save, nothing is committed."""
+        self._flushAll()
+        self._markOp(name)
+
+    def _flushAll(self, mod=None):
+        self._flushManagers()
+        # and flush deck + bump mod if db has been changed
+        if self.db.mod:
+            self.flush(mod=mod)
+
+    def _flushManagers(self, decks=True):
+        # let the managers conditionally flush
+        self.models.flush()
+        if decks:
+            self.decks.flush()
+        self.tags.flush()
+        self.latex.flush()
+
     def autosave(self):
         "Save if 5 minutes has passed since last save. True if saved."
         if time.time() - self._lastSave > 300:
@@ -302,8 +347,15 @@ crt=?, mod=?, scm=?, dty=?, usn=?, ls=?, conf=?""",
         Close collection's db, media's db and log.
         """
         if self.db:
+            self.latex.shutdown()
             if save:
                 self.save()
+                if self.objectTables:
+                    # for older clients, full syncs and exports
+                    registry.writeBlobs(self.db)
+                # rows which don't change the collection, e.g. the LaTeX
+                # errors, are not committed by save
+                self.db.commit()
             else:
                 self.db.rollback()
             if not self.server:
@@ -314,17 +366,40 @@ crt=?, mod=?, scm=?, dty=?, usn=?, ls=?, conf=?""",
             self.db = None
             self.media.close()
             self._closeLog()
+            indexAdvisor.writeReport()
 
     def reopen(self):
         "Reconnect to DB (after changing threads, etc)."
         import anki.db
         if not self.db:
             self.db = anki.db.DB(self.path)
+            self.db.applyProfile(self.dbProfile)
+            self._undo = UndoJournal(self.db)
             self.media.connect()
             self._openLog()
 
+    def setObjectTables(self, enabled):
+        """Whether each model, deck and deck option is stored in a row of
+        its own table, so that saving one doesn't rewrite the others. See
+        anki/registry.py."""
+        if enabled == self.objectTables:
+            return
+        self._flushManagers()
+        if enabled:
+            registry.createObjectTables(self.db, dict(
+                models=self.models.models, decks=self.decks.decks,
+                dconf=self.decks.dconf))
+        else:
+            registry.dropObjectTables(self.db)
+        self.objectTables = enabled
+        # the journal must follow the tables
+        self._undo = UndoJournal(self.db)
+        self.setMod()
+
     def rollback(self):
         self.db.rollback()
+        self.latex.rollback()
+        self.clearUndo()
         self.load()
         self.lock()
 
@@ -475,6 +550,7 @@ crt=?, mod=?, scm=?, dty=?, usn=?, ls=?, conf=?""",
         runHook("remNotes", self, ids)
         self._logRem(ids, REM_NOTE)
         self.db.execute("delete from notes where id in %s" % strids)
+        self.tags.unindexNotes(ids)
 
     # Card creation
     ##########################################################################
@@ -493,10 +569,13 @@ crt=?, mod=?, scm=?, dty=?, usn=?, ls=?, conf=?""",
     def isCardNew(self, id):
         return self.db.scalar(f"select id from cards where id = ? and type = {CARD_NEW}", id)
 
-    def genCards(self, nids):
+    def genCards(self, nids, ords=None):
         """Ids of cards which needs to be removed.
 
         Generate missing cards of a note with id in nids.
+
+        ords -- if set, only the cards of the card types of these
+        ordinals are generated or removed. Ignored for cloze.
         """
         # build map of (nid,ord) so we don't create dupes
         snids = ids2str(nids)
@@ -537,7 +616,7 @@ crt=?, mod=?, scm=?, dty=?, usn=?, ls=?, conf=?""",
             "select id, mid, flds from notes where id in "+snids):
             model = self.models.get(mid, orNone=False)
             assert(model)
-            avail = model.availOrds(flds)
+            avail = model.availOrds(flds, ords)
             did = dids.get(nid) or model['did']
             due = dues.get(nid)
             # add any missing cards
@@ -562,6 +641,8 @@ crt=?, mod=?, scm=?, dty=?, usn=?, ls=?, conf=?""",
                 for ord, id in list(have[nid].items()):
                     if ord in avail:
                         continue
+                    if ords is not None and ord not in ords and not model.isCloze():
+                        continue
                     if not (removeSeenCard or self.isCardNew(id)):
                         continue
                     rem.append(id)
@@ -667,6 +748,7 @@ insert into cards values (?,?,?,?,?,?,0,0,?,0,0,0,0,0,0,0,0,"")""",
             return
         sids = ids2str(ids)
         nids = self.db.list("select nid from cards where id in "+sids)
+        self._basicCheckNotes(nids)
         # remove cards
         self._logRem(ids, REM_CARD)
         self.db.execute("delete from cards where id in "+sids)
@@ -921,12 +1003,12 @@ where card.nid == note.id
 
     # Undo
     ##########################################################################
-    # [type, undoName, data]
-    # type 1 = review; type 2 = checkpoint
+    # See anki/undo.py. Each checkpoint and each review starts a step of
+    # the journal, which can be undone, and then redone.
 
     def clearUndo(self):
         """Erase all undo information from the collection."""
-        self._undo = None
+        self._undo.clear()
 
     def undoName(self):
         """The name of the action which could potentially be undone.
@@ -934,73 +1016,89 @@ where card.nid == note.id
         None if nothing can be undone. This let test whether something
         can be undone.
         """
-        if not self._undo:
-            return None
-        return self._undo[1]
+        return self._undo.name()
+
+    def redoName(self):
+        "The name of the action which could be redone, or None."
+        return self._undo.redoName()
 
     def undo(self):
-        """Undo the last operation.
+        """Undo the last operation. Return the id of the card if it was a
+        review.
 
         Assuming an undo object exists."""
-        if self._undo[0] == 1:
-            return self._undoReview()
-        else:
-            self._undoOp()
+        # changes still in memory belong to the last step
+        self._flushManagers()
+        step, nids = self._undo.undo(self._restoreCounts)
+        self._reloadAfterUndo(nids)
+        if step.cid:
+            self.sched.reps -= 1
+        return step.cid
+
+    def redo(self):
+        """Redo the last operation undone. Return the id of the card if it
+        was a review."""
+        self._flushManagers()
+        step, nids = self._undo.redo()
+        self._reloadAfterUndo(nids)
+        if step.cid:
+            self.sched.reps += 1
+        return step.cid
+
+    def _reloadAfterUndo(self, nids):
+        self.tags.updateIndex(nids)
+        # the collection is back at an earlier mod, with an index up to date
+        self.tags.setIndexMod(self.db.scalar("select mod from col"))
+        self.load()
+
+    # the daily counts of a deck a review may change
+    dailyCounts = ("newToday", "revToday", "lrnToday", "timeToday")
 
     def markReview(self, card):
-        old = []
-        if self._undo:
-            if self._undo[0] == 1:
-                old = self._undo[2]
-            self.clearUndo()
-        wasLeech = card.note().hasTag("leech") or False#The or is probably useless.
-        self._undo = [1, _("Review"), old + [copy.copy(card)], wasLeech]
-
-    def _undoReview(self):
-        data = self._undo[2]
-        wasLeech = self._undo[3]
-        card = data.pop()# pytype: disable=attribute-error
-        if not data:
-            self.clearUndo()
-        # remove leech tag if it didn't have it before
-        if not wasLeech and card.note().hasTag("leech"):
-            card.note().delTag("leech")
-            card.note().flush()
-        # write old data
-        card.flush()
-        # and delete revlog entry
-        last = self.db.scalar(
-            "select id from revlog where cid = ? "
-            "order by id desc limit 1", card.id)
-        self.db.execute("delete from revlog where id = ?", last)
-        # restore any siblings
-        self.db.execute(
-            "update cards set queue=type,mod=?,usn=? where queue=-2 and nid=?",
-            intTime(), self.usn(), card.nid)
-        # and finally, update daily counts
-        index = 1 if card.queue == 3 else card.queue
-        type = ("new", "lrn", "rev")[index]
-        self.sched._updateStats(card, type, -1)
-        self.sched.reps -= 1
-        return card.id
+        """The changes from now on can be undone as the review of card.
+        Saving the decks for each review would log all of them: the daily
+        counts the review may change are kept with the step instead."""
+        self._flushManagers(decks=False)
+        counts = {}
+        # the card may leave its filtered deck
+        for did in {card.did, card.odid} - {0}:
+            for deck in self.decks.get(did).getAncestors(includeSelf=True):
+                counts[deck.getId()] = {key: list(deck[key])
+                                        for key in self.dailyCounts}
+        self._undo.startStep(_("Review"), card.id, counts)
+
+    def _restoreCounts(self, step):
+        """Set back the daily counts of the decks before the review step,
+        keeping the decks' other changes."""
+        if not step.counts:
+            return
+        for did, counts in step.counts.items():
+            deck = self.decks.get(did, default=False)
+            if deck:
+                deck.update(counts)
+                deck.save()
+        self.decks.flush()
 
     def _markOp(self, name):
-        "Call via .save()"
+        "Call via .save() or .checkpoint()"
         if name:
-            self._undo = [2, name]
-        else:
-            # saving disables old checkpoint, but not review undo
-            if self._undo and self._undo[0] == 2:
-                self.clearUndo()
+            self._undo.startStep(name)
 
-    def _undoOp(self):
-        self.rollback()
-        self.clearUndo()
+    @contextmanager
+    def withoutUndo(self):
+        """Don't journal the changes made in the block, for bulk operations
+        which can't be undone. Nothing done before can be undone after."""
+        self._flushManagers()
+        with self._undo.suspended():
+            yield
 
     # DB maintenance
     ##########################################################################
 
-    def basicCheck(self, syncer=None):
+    # a full basic check is done at least this often, in seconds
+    basicCheckInterval = 7 * 86400
+
+    def basicCheck(self, syncer=None, full=None):
         """True if basic integrity is meet.
         Otherwise an explanation of the error
 
@@ -1012,16 +1110,30 @@ where card.nid == note.id
         * each note has a card
         * each card's ord is valid according to the note model.
 
+        Only the cards and notes changed since the last successful check
+        are tested, see _basicCheckLimits. The check is full if there was
+        no successful check yet, if the schema changed since, or if the
+        last full check is older than basicCheckInterval. Both kinds of
+        check run the same queries, so they find the same errors on the
+        rows changed.
+
         syncer -- the Syncer object used for sync requesting this check
+        full -- whether to test every card and note. By default, as
+        explained above.
         """
+        mark = self.conf.get('basicCheck')
+        if full is None:
+            full = self._basicCheckIsFull(mark)
+        now = intTime()
+        cards, notes, nids = self._basicCheckLimits(None if full else mark)
         checks = [
-            ("select id, nid from cards where nid not in (select id from notes)",
+            (f"select id, nid from cards where {cards} and nid not in (select id from notes)",
              "Card {} belongs to note {} which does not exists"),
-            ("select id, flds, tags, mid from notes where id not in (select distinct nid from cards)",
+            (f"select id, flds, tags, mid from notes where {notes} and not exists (select 1 from cards where nid = notes.id)",
              """Note {} has no cards. Fields: «{}», tags:«{}», mid:«{}»"""),
-            ("""select id, flds, tags, mid from notes where mid not in %s""" % ids2str(self.models.ids()),
+            (f"""select id, flds, tags, mid from notes where {notes} and mid not in %s""" % ids2str(self.models.ids()),
              """Note {} has an unexisting note type. Fields: «{}», tags:«{}», mid:{}"""),
-            ("""select nid, ord, count(*), GROUP_CONCAT(id) from cards group by ord, nid having count(*)>1""",
+            (f"""select nid, ord, count(*), GROUP_CONCAT(id) from cards where {nids} group by ord, nid having count(*)>1""",
              """Note {} has card at ord {} repeated {} times. Card ids are {}"""
             )
         ]
@@ -1030,8 +1142,8 @@ where card.nid == note.id
             mid = model['id']
             if model.isCloze():
                 continue
-            checks.append((f"""select id, ord, nid from cards where ord <0 or ord>{len(model['tmpls'])} and nid in (select id from notes where mid = {mid})""",
-                           "Card {}'s ord {} of note {} does not exists in model {mid}"))
+            checks.append((f"""select id, ord, nid from cards where {cards} and (ord <0 or ord>{len(model['tmpls'])}) and nid in (select id from notes where mid = {mid})""",
+                           f"Card {{}}'s ord {{}} of note {{}} does not exists in model {mid}"))
         errorMessages = list()
         for query,msg in checks:
             l = self.db.all(query)
@@ -1044,18 +1156,71 @@ where card.nid == note.id
             if syncer:
                 syncer.errorMessages = "\n".join(errorMessages)
             return
+        self._setBasicCheckMark(dict(
+            usn=self._usn, mod=now, scm=self.scm,
+            full=now if full else mark['full']))
         return True
 
+    def _basicCheckIsFull(self, mark):
+        return (not mark or
+                mark['scm'] != self.scm or
+                intTime() - mark['full'] >= self.basicCheckInterval)
+
+    def _basicCheckLimits(self, mark):
+        """The conditions restricting the basic check to the cards, to the
+        notes, and to the cards of the notes, changed since mark. They
+        are always true if mark is None.
+
+        A row changed if it was not synced yet, was synced since mark, or
+        its mod is not older than mark. The cards of the notes deleted
+        since mark also changed, and so did the notes whose cards were
+        deleted since, as recorded in mark's nids."""
+        if mark is None:
+            return "1", "1", "1"
+        changed = "(usn = -1 or usn >= %d or mod >= %d)" % (mark['usn'], mark['mod'])
+        cards = f"""({changed} or nid in (select oid from graves where type = {REM_NOTE}
+and (usn = -1 or usn >= {int(mark['usn'])})))"""
+        notes = f"({changed} or id in {ids2str(mark.get('nids', []))})"
+        nids = f"nid in (select id from notes where {notes} union select nid from cards where {cards})"
+        return cards, notes, nids
+
+    def _basicCheckNotes(self, nids):
+        """Record in the basic check's mark that the notes nids lose cards,
+        so that the next check tests them. The graves only have the ids
+        of the cards. Saved with the deletion."""
+        mark = self.conf.get('basicCheck')
+        if mark and nids:
+            mark['nids'] = sorted(set(mark.get('nids', [])) | set(nids))
+
+    def _setBasicCheckMark(self, mark):
+        """Record mark in the configuration. This is not a change of the
+        collection, so it doesn't change its mod, and is saved with the
+        next change."""
+        self.conf['basicCheck'] = mark
+        mod = self.db.mod
+        self.db.execute("update col set conf = ?", json.dumps(self.conf))
+        self.db.mod = mod
+
+    # the part of the pages which must be free to vacuum the database
+    vacuumFreeRatio = 0.1
+
     def fixIntegrity(self):
         return FixingManager(self).run()
 
     def optimize(self):
-        """Tell sqlite to optimize the db"""
+        """Tell sqlite to optimize the db. The file is only rebuilt when at
+        least vacuumFreeRatio of its pages are free, since vacuum
+        rewrites all of it. Return whether it was rebuilt."""
+        pages = self.db.scalar("pragma page_count")
+        free = self.db.scalar("pragma freelist_count")
+        vacuum = bool(pages) and free / pages >= self.vacuumFreeRatio
         self.db.setAutocommit(True)
-        self.db.execute("vacuum")
+        if vacuum:
+            self.db.execute("vacuum")
         self.db.execute("analyze")
         self.db.setAutocommit(False)
         self.lock()
+        return vacuum
 
     # Logging
     ##########################################################################
@@ -47,6 +47,9 @@ STARTING_FACTOR = 2500
 
 # deck schema & syncing vars
 SCHEMA_VERSION = 11
+# version of the indices, kept in the collection's user_version; unlike
+# the schema version, older clients can open a collection with more indices
+INDEX_VERSION = 1
 SYNC_ZIP_SIZE = int(2.5*1024*1024)
 SYNC_ZIP_COUNT = 25
 SYNC_BASE = "https://sync%s.ankiweb.net/"
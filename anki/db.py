@@ -3,20 +3,70 @@
 # License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
 
 import os
+import shutil
 import sys
 import time
+import urllib.request
 from sqlite3 import Cursor, OperationalError, ProgrammingError
 from sqlite3 import dbapi2 as sqlite
 
+from anki.indexadvisor import indexAdvisor
+from anki.utils import isWin
+
 DBError = sqlite.Error
 
+# The performance profiles of the connections to the collection, the
+# media database and the profiles database, by name. A profile sets:
+#
+# cache_size -- the page cache of the connection, in KiB
+# mmap_size -- how many bytes of the file are read through memory
+# mapping, saving a copy of each page read. An I/O error while reading
+# then crashes the process instead of raising an exception.
+# temp_store -- where the temporary tables and indices of sorts and
+# group by are built
+# journal_mode -- "wal" lets readers, such as the statistics' read-only
+# connections, run during a write, and commits only append to the -wal
+# file. The -wal and -shm files must stay with the database, and WAL
+# doesn't work on network file systems. It is never used on Windows,
+# and the collection is switched back to "delete" when closed, so that
+# its file can be copied alone.
+# synchronous -- "full" waits for the disk at each commit: nothing
+# committed is lost on power failure. "normal" with WAL only waits at
+# checkpoints: the last commits may be lost on power failure, but the
+# database stays consistent. Without WAL, "normal" may corrupt the
+# database on power failure, so "full" is used instead.
+dbProfiles = {
+    # sqlite's defaults: least memory, nothing committed can be lost
+    "safe": dict(cache_size=2000, mmap_size=0, temp_store="default",
+                 journal_mode="delete", synchronous="full"),
+    # the settings of the collection before profiles existed
+    "default": dict(cache_size=40000, mmap_size=0, temp_store="memory",
+                    journal_mode="wal", synchronous="full"),
+    # for big collections: more memory, and the last commits may be lost
+    # on power failure
+    "fast": dict(cache_size=65536, mmap_size=256*1024*1024,
+                 temp_store="memory", journal_mode="wal",
+                 synchronous="normal"),
+}
+defaultDbProfile = "default"
+
 class DB:
-    def __init__(self, path, timeout=0):
-        self._db = sqlite.connect(path, timeout=timeout)
+    def __init__(self, path, timeout=0, readOnly=False):
+        """A connection to the database at path.
+
+        readOnly -- open the file in read-only mode. Such a connection
+        never takes a write lock, so it can be used from another thread
+        while the main connection is in use."""
+        if readOnly:
+            uri = "file:%s?mode=ro" % urllib.request.pathname2url(path)
+            self._db = sqlite.connect(uri, timeout=timeout, uri=True)
+        else:
+            self._db = sqlite.connect(path, timeout=timeout)
         self._db.text_factory = self._textFactory
         self._path = path
         self.echo = os.environ.get("DBECHO")
         self.mod = False
+        self.profile = None
 
     def execute(self, sql, *args, **ka):
         """The result of execute on the database with sql query and either ka if it exists, or a.
@@ -24,6 +74,7 @@ class DB:
         If insert, update or delete, mod is set to True
         If self.echo, prints the execution time
         if self.echo is "2", also print the arguments.
+        If the index advisor is started, the statement is recorded.
         """
         normalizedSql = sql.strip().lower()
         # mark modified?
@@ -45,6 +96,8 @@ class DB:
             if ka:
                 print(f"ka:\n----------------\n{ka}\n----------------\n", file=sys.stderr)
             raise
+        if indexAdvisor.enabled:
+            indexAdvisor.record(self._db, sql, ka or args, time.time() - startTime)
         if self.echo:
             #print args, ka
             print(sql, "%0.3fms" % ((time.time() - startTime)*1000))
@@ -54,17 +107,20 @@ class DB:
 
     def executemany(self, sql, queryParams):
         """The result of executmany on the database with sql query and l list.
+        Its rowcount is the number of rows changed, not counting the
+        changes of triggers.
 
         Mod is set to True
         If self.echo, prints the execution time
         """
         self.mod = True
         startTime = time.time()
-        self._db.executemany(sql, queryParams)
+        res = self._db.executemany(sql, queryParams)
         if self.echo:
             print(sql, "%0.3fms" % ((time.time() - startTime)*1000))
             if self.echo == "2":
                 print(queryParams)
+        return res
 
     def commit(self):
         """Commit database.
@@ -87,6 +143,22 @@ class DB:
         """rollback on the db"""
         self._db.rollback()
 
+    def begin(self):
+        """Start a transaction, unless one is open. Savepoints created
+        then are not committed when released."""
+        if not self._db.in_transaction:
+            self._db.execute("begin")
+
+    def createFunction(self, name, nargs, func):
+        """Make the python function func callable from sql as name. func
+        must return the same result for the same arguments, which lets
+        sqlite optimize its calls where supported: the argument needs
+        Python 3.8, and sqlite 3.8.3."""
+        kw = {}
+        if sys.version_info >= (3, 8) and sqlite.sqlite_version_info >= (3, 8, 3):
+            kw['deterministic'] = True
+        self._db.create_function(name, nargs, func, **kw)
+
     def scalar(self, *args, **kw):
         """The first value of the first tuple of the result, if it exists. None otherwise."""
         res = self.execute(*args, **kw).fetchone()
@@ -114,6 +186,38 @@ class DB:
         self._db.text_factory = None
         self._db.close()
 
+    def backupTo(self, path):
+        """Copy a consistent snapshot of the database to the file path,
+        page by page, using sqlite's online backup. Must be called
+        outside of a transaction."""
+        if not hasattr(self._db, "backup"):
+            # Python < 3.7
+            self._copyTo(path)
+            return
+        dst = sqlite.connect(path)
+        try:
+            self._db.backup(dst)
+        finally:
+            dst.close()
+
+    def _copyTo(self, path):
+        """Copy the database file to path, while a lock prevents other
+        connections from writing it."""
+        self._db.execute("begin immediate")
+        try:
+            shutil.copyfile(self._path, path)
+            # with WAL, the last commits may only be in the -wal file
+            if os.path.exists(self._path + "-wal"):
+                shutil.copyfile(self._path + "-wal", path + "-wal")
+        finally:
+            self._db.rollback()
+        # bring those commits into the copy, and make it a single file
+        dst = sqlite.connect(path)
+        try:
+            dst.execute("pragma journal_mode = delete")
+        finally:
+            dst.close()
+
     def set_progress_handler(self, *args):
         self._db.set_progress_handler(*args)
 
@@ -130,6 +234,28 @@ class DB:
     def interrupt(self):
         self._db.interrupt()
 
+    def applyProfile(self, name=None):
+        """Set the pragmas of the performance profile name, or of the
+        default one. Must be called outside of a transaction. Return the
+        journal mode in use."""
+        if name not in dbProfiles:
+            name = defaultDbProfile
+        profile = dbProfiles[name]
+        autocommit = self._db.isolation_level is None
+        self.setAutocommit(True)
+        self.execute("pragma cache_size = %d" % -profile['cache_size'])
+        self.execute("pragma mmap_size = %d" % profile['mmap_size'])
+        self.execute("pragma temp_store = %s" % profile['temp_store'])
+        journal = "delete" if isWin else profile['journal_mode']
+        journal = self.scalar("pragma journal_mode = %s" % journal)
+        synchronous = profile['synchronous']
+        if journal != "wal":
+            synchronous = "full"
+        self.execute("pragma synchronous = %s" % synchronous)
+        self.setAutocommit(autocommit)
+        self.profile = name
+        return journal
+
     def setAutocommit(self, autocommit):
         if autocommit:
             self._db.isolation_level = None
@@ -48,6 +48,9 @@ class DConf(DictAugmentedDyn):
     """A configuration for decks
 
     """
+    # where the configuration is stored, see anki/registry.py
+    table = "dconf"
+
     def load(self, manager, dict):
         super().load(manager, dict)
         # set limits to within bounds
@@ -67,7 +70,7 @@ class DConf(DictAugmentedDyn):
         """Add g to the set of dconf's. Potentially replacing a dconf with the
 same id."""
         self.manager.dconf[str(self.getId())] = self
-        self.manager.save()
+        self.manager.markChanged(self)
 
     def copy_(self, name):
         """Create a new configuration and return its id.
@@ -97,6 +100,7 @@ same id."""
         assert not self.isDefault()
         self.manager.col.modSchema(check=True)
         del self.manager.dconf[self.getId()]
+        self.manager.markChanged(self)
         for deck in self.decks():
             deck.setDefaultConf()
             deck.save()
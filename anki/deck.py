@@ -17,6 +17,9 @@ class Deck(DictAugmentedDyn):
     childrenDict -- dict from base name to children
     parent -- parent deck. For top level, it's the set of toplevel elements. For this set, it's None.
     """
+    # where the deck is stored, see anki/registry.py
+    table = "decks"
+
     def __init__(self, manager, dict, parent, loading=False, exporting=False):
         self.parent = parent
         self.childrenBaseNames = []
@@ -125,7 +128,7 @@ class Deck(DictAugmentedDyn):
         # ensure we have an active deck.
         if self.getId() in self.manager.active():
             self.manager.all()[0].select()
-        self.manager.save()
+        self.manager.markChanged(self)
 
     def rename(self, newName, merge=False):
         """Rename the deck object g to newName. Updates
@@ -7,6 +7,7 @@ import json
 import operator
 import unicodedata
 
+from anki import registry
 from anki.consts import *
 from anki.dconf import DConf, defaultConf
 from anki.deck import Deck
@@ -146,6 +147,8 @@ class DeckManager:
     col -- the collection associated to this Deck manager
     decks -- associating to each id (as string) its deck
     dconf -- associating to each id (as string) its configuration(option)
+    dirty -- the set of (table, id) of the decks and configurations
+    changed since the last flush, or None if any may have changed
     """
     # Registry save/load
     #############################################################
@@ -155,19 +158,25 @@ class DeckManager:
         self.col = col
         self.decks = {}
         self.dconf = {}
+        self.dirty = set()
 
     def load(self, decks, dconf):
         """Assign decks and dconf of this object using the two parameters.
 
-        It also ensures that the number of cards per day is at most
-        999999 or correct this error.
+        The decks are created at once, to build their tree. The
+        configurations are created when first accessed; it also ensures
+        that their number of cards per day is at most 999999 or correct
+        this error.
 
         Keyword arguments:
-        decks -- json dic associating to each id (as string) its deck.
-        dconf -- json dic associating to each id (as string) its configuration(option)
+        decks -- json dic associating to each id (as string) its deck,
+        or dict associating to each id its deck's json
+        dconf -- json dic associating to each id (as string) its configuration(option),
+        or dict associating to each id its configuration's json
         """
         self.loading = True
         self.changed = False
+        self.dirty = set()
         self.loadDeck(decks)
         self.loadConf(dconf)
         self.loading = False
@@ -176,11 +185,12 @@ class DeckManager:
         """If decks is not provided, reload current deck collection"""
         if decks is None:
             decks = self.decks
-        else:
+        elif isinstance(decks, str):
             decks = json.loads(decks)
         self.decks = {}
         self.decksByNames = {}
-        decks = list(decks.values())
+        decks = [json.loads(deck) if isinstance(deck, str) else deck
+                 for deck in decks.values()]
         decks.sort(key=operator.itemgetter("name"))
         self.topLevel = self.createDeck({"name": "", "id":-1, "dyn":DECK_STD})
         #std deck so it can have child
@@ -189,10 +199,7 @@ class DeckManager:
             deck.addInManager()
 
     def loadConf(self, dconf):
-        self.dconf = {}
-        for dconf in json.loads(dconf).values():
-            dconf = DConf(self, dconf)
-            self.dconf[str(dconf['id'])] = dconf
+        self.dconf = registry.LazyRegistry(lambda conf: DConf(self, conf), dconf)
 
     def save(self, deckOrOption=None):
         """State that the DeckManager has been changed. Changes the
@@ -203,6 +210,16 @@ class DeckManager:
         """
         if deckOrOption:
             deckOrOption.save()
+        else:
+            self.markChanged()
+
+    def markChanged(self, deckOrOption=None):
+        """Schedule the flush of deckOrOption, added, changed or removed,
+        or of every deck and configuration."""
+        if deckOrOption is None:
+            self.dirty = None
+        elif self.dirty is not None:
+            self.dirty.add((deckOrOption.table, str(deckOrOption.getId())))
         self.changed = True
 
     def flush(self):
@@ -210,10 +227,17 @@ class DeckManager:
         changes happenned.
         """
         if self.changed:
-            self.col.db.execute("update col set decks=?, dconf=?",
-                                 json.dumps(self.decks, default=lambda model: model.dumps()),
-                                 json.dumps(self.dconf, default=lambda model: model.dumps()))
+            if self.col.objectTables:
+                for table, objects in (("decks", self.decks), ("dconf", self.dconf)):
+                    ids = None if self.dirty is None else [
+                        id for dirtyTable, id in self.dirty if dirtyTable == table]
+                    registry.writeObjects(self.col.db, table, objects, ids)
+            else:
+                self.col.db.execute("update col set decks=?, dconf=?",
+                                     json.dumps(self.decks, default=lambda model: model.dumps()),
+                                     json.dumps(self.dconf, default=lambda model: model.dumps()))
             self.changed = False
+            self.dirty = set()
 
     # Deck save/load
     #############################################################
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# Copyright: Ankitects Pty Ltd and contributors
+# License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
+
+"""
+Compare two strings character by character, in O((N+M)D) time and
+O(N+M) memory at most, N and M being the lengths of the strings and D the
+number of characters to insert or delete to go from one to the other.
+
+difflib.SequenceMatcher looks for the longest common block, then does
+the same on both sides of it: comparing two answers of a few hundred
+characters which differ a lot is quadratic at each level. Here, the
+common prefix and suffix are skipped, and the rest is compared with
+the linear space variant of Myers' algorithm ("An O(ND) Difference
+Algorithm and Its Variations", 1986): the middle snake of the shortest
+edit script splits the comparison in two halves, which are compared in
+the same way. A typed answer with a few typos costs little more than
+reading it.
+
+When the strings have little in common, D is close to N+M, and
+SequenceMatcher, which then finds few blocks, is faster. The search for
+a middle snake is given up past maxEditRatio * (N+M) edits, and the
+part of the strings being compared is passed to SequenceMatcher.
+
+The result has the format of get_matching_blocks(). Unless
+SequenceMatcher was used, it is a longest common subsequence, which
+SequenceMatcher doesn't always find.
+"""
+
+import difflib
+
+# the fraction of the characters which may need an edit before
+# SequenceMatcher is used instead
+maxEditRatio = 0.05
+
+
+def matchingBlocks(a, b):
+    """A list of triples (i, j, n) meaning that a[i:i+n] == b[j:j+n],
+    increasing in i and j, for a common subsequence of a and b.
+    As in SequenceMatcher.get_matching_blocks(), adjacent blocks are
+    merged, and the last triple is the dummy (len(a), len(b), 0)."""
+    blocks = []
+    _compare(a, 0, len(a), b, 0, len(b), blocks)
+    blocks.sort()
+    merged = []
+    for i, j, n in blocks:
+        if merged and merged[-1][0] + merged[-1][2] == i and \
+                merged[-1][1] + merged[-1][2] == j:
+            merged[-1][2] += n
+        elif n:
+            merged.append([i, j, n])
+    merged.append([len(a), len(b), 0])
+    return [tuple(block) for block in merged]
+
+
+def _compare(a, alo, ahi, b, blo, bhi, blocks):
+    "Append to blocks the common blocks of a[alo:ahi] and b[blo:bhi]."
+    # common prefix
+    start = alo
+    while alo < ahi and blo < bhi and a[alo] == b[blo]:
+        alo += 1
+        blo += 1
+    if alo > start:
+        blocks.append((start, blo - (alo - start), alo - start))
+    # common suffix
+    end = ahi
+    while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+        ahi -= 1
+        bhi -= 1
+    if ahi < end:
+        blocks.append((ahi, bhi, end - ahi))
+    if alo == ahi or blo == bhi:
+        return
+    # both ends differ, so at least two edits remain, and each half
+    # needs fewer
+    limit = max(8, int(maxEditRatio * (ahi - alo + bhi - blo)))
+    snake = _middleSnake(a, alo, ahi, b, blo, bhi, limit)
+    if snake is None:
+        matcher = difflib.SequenceMatcher(
+            None, a[alo:ahi], b[blo:bhi], autojunk=False)
+        blocks.extend((alo + i, blo + j, n)
+                      for i, j, n in matcher.get_matching_blocks())
+        return
+    x, y, u, v = snake
+    if u > x:
+        blocks.append((x, y, u - x))
+    _compare(a, alo, x, b, blo, y, blocks)
+    _compare(a, u, ahi, b, v, bhi, blocks)
+
+
+def _middleSnake(a, alo, ahi, b, blo, bhi, limit):
+    """The snake (x, y) to (u, v), in the middle of a shortest edit script
+    from a[alo:ahi] to b[blo:bhi], or None if this script needs more than
+    2 * limit edits.
+
+    Forward paths start at (alo, blo), and forward[k] is the furthest x
+    reached on the diagonal x - y = k. Backward paths start at (ahi,
+    bhi), and backward[k] is the furthest distance from ahi reached on
+    the diagonal where the distances from the ends differ by k. The
+    forward diagonal k is the backward diagonal delta - k."""
+    n = ahi - alo
+    m = bhi - blo
+    delta = n - m
+    odd = delta & 1
+    # diagonals go from -(limit+1) to limit+1; negative indices wrap
+    # around
+    size = 2 * limit + 4
+    forward = [0] * size
+    backward = [0] * size
+    for d in range(min(limit, (n + m + 1) // 2) + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[k - 1] < forward[k + 1]):
+                x = forward[k + 1]
+            else:
+                x = forward[k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            forward[k] = x
+            if odd and -(d - 1) <= delta - k <= d - 1 and \
+                    x + backward[delta - k] >= n:
+                return alo + x0, blo + y0, alo + x, blo + y
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and backward[k - 1] < backward[k + 1]):
+                x = backward[k + 1]
+            else:
+                x = backward[k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[ahi - 1 - x] == b[bhi - 1 - y]:
+                x += 1
+                y += 1
+            backward[k] = x
+            if not odd and -d <= delta - k <= d and \
+                    x + forward[delta - k] >= n:
+                return ahi - x, bhi - y, ahi - x0, bhi - y0
+    return None
@@ -6,16 +6,21 @@ import json
 import os
 import re
 import shutil
+import time
 import typing
 import unicodedata
 import zipfile
+import zlib
 
-from anki import Collection
+from anki import Collection, registry
+from anki.consts import *
+from anki.db import DB
 from anki.deck import Deck
 from anki.hooks import runHook
 from anki.lang import _
 from anki.storage import Collection
-from anki.utils import ids2str, namedtmp, splitFields, stripHTML
+from anki.utils import (ids2str, intTime, namedtmp, splitFields,
+                        stripHTML)
 
 
 class Exporter:
@@ -180,45 +185,17 @@ class AnkiExporter(Exporter):
         self.src = self.col
         # find cards
         cids = self.cardIds()
-        # copy cards, noting used nids
-        nids = {}
-        data = []
-        for row in self.src.db.execute(
-            "select * from cards where id in "+ids2str(cids)):
-            nids[row[1]] = True
-            data.append(row)
-            # clear flags
-            row = list(row)
-            row[-2] = 0
-        self.dst.db.executemany(
-            "insert into cards values (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
-            data)
-        # notes
-        strnids = ids2str(list(nids.keys()))
-        notedata = []
-        for row in self.src.db.all(
-            "select * from notes where id in "+strnids):
+        # copy cards, their notes and their review log
+        self._copyRows(cids)
+        if not self.includeSched:
             # remove system tags if not exporting scheduling info
-            if not self.includeSched:
-                row = list(row)
-                row[5] = self.removeSystemTags(row[5])
-            notedata.append(row)
-        self.dst.db.executemany(
-            "insert into notes values (?,?,?,?,?,?,?,?,?,?,?)",
-            notedata)
-        # models used by the notes
-        mids = self.dst.db.list("select distinct mid from notes where id in "+
-                                strnids)
-        # card history and revlog
-        if self.includeSched:
-            data = self.src.db.all(
-                "select * from revlog where cid in "+ids2str(cids))
-            self.dst.db.executemany(
-                "insert into revlog values (?,?,?,?,?,?,?,?,?)",
-                data)
-        else:
+            self.dst.db._db.create_function(
+                "removeSystemTags", 1, self.removeSystemTags)
+            self.dst.db.execute("update notes set tags = removeSystemTags(tags)")
             # need to reset card state
-            self.dst.sched.resetCards(cids)
+            self._resetCards()
+        # models used by the notes
+        mids = self.dst.db.list("select distinct mid from notes")
         # models - start with zero
         self.dst.models.models = {}
         for srcModel in self.src.models.all():
@@ -255,9 +232,10 @@ class AnkiExporter(Exporter):
         media = {}
         self.mediaDir = self.src.media.dir()
         if self.includeMedia:
-            for row in notedata:
-                flds = row[6]
-                mid = row[2]
+            # only fields which may contain a reference are parsed
+            for mid, flds in self.dst.db.execute("""
+select mid, flds from notes where flds like '%[sound:%' or flds like '%<img%'
+or flds like '%[latex]%' or flds like '%[$%' order by id"""):
                 for file in self.src.media.filesInStr(mid, flds):
                     # skip files in subdirs
                     if file != os.path.basename(file):
@@ -265,24 +243,91 @@ class AnkiExporter(Exporter):
                     media[file] = True
             if self.mediaDir:
                 for fname in os.listdir(self.mediaDir):
+                    # only files starting with _ may be used by models
+                    if not fname.startswith("_"):
+                        continue
                     path = os.path.join(self.mediaDir, fname)
                     if os.path.isdir(path):
                         continue
-                    if fname.startswith("_"):
-                        # Scan all models in mids for reference to fname
-                        for srcModel in self.src.models.all():
-                            if int(srcModel.getId()) in mids:
-                                if self._modelHasMedia(srcModel, fname):
-                                    media[fname] = True
-                                    break
+                    # Scan all models in mids for reference to fname
+                    for srcModel in self.src.models.all():
+                        if int(srcModel.getId()) in mids:
+                            if self._modelHasMedia(srcModel, fname):
+                                media[fname] = True
+                                break
         self.mediaFiles = list(media.keys())
         self.dst.crt = self.src.crt
         # todo: tags?
         self.count = self.dst.cardCount()
         self.dst.setMod()
+        # the tag index is rebuilt by the collection importing the file
+        self.dst.tags.dropIndex()
         self.postExport()
         self.dst.close()
 
+    def _copyRows(self, cids):
+        """Copy the cards whose id is in cids, their notes and, if
+        scheduling is included, their review log, from the source to the
+        destination.
+
+        The source is attached to the destination's connection, so
+        that rows are copied by sqlite without going through python.
+        Only what is committed in the source can be read this way,
+        hence it is saved first."""
+        self.src.save()
+        db = self.dst.db
+        db.commit()
+        db.execute("attach ? as src", self.src.path)
+        try:
+            db.execute("create temp table expcids (id integer primary key)")
+            db.executemany("insert or ignore into expcids values (?)",
+                           ([cid] for cid in cids))
+            db.execute("""
+insert into cards select cards.* from src.cards cards, expcids
+where cards.id = expcids.id""")
+            db.execute("""
+insert into notes select * from src.notes
+where id in (select nid from main.cards)""")
+            if self.includeSched:
+                db.execute("""
+insert into revlog select * from src.revlog
+where cid in (select id from expcids)""")
+            db.commit()
+        except:
+            db.rollback()
+            raise
+        finally:
+            db.execute("detach src")
+        self.dst.lock()
+
+    def _resetCards(self):
+        """Reset the scheduling information of all cards of the
+        destination, as sched.resetCards does, using set-based updates."""
+        db = self.dst.db
+        # we want to avoid resetting due number of existing new cards
+        db.execute(f"""
+create temp table expnonnew as select id, nid from cards
+where queue != {QUEUE_NEW} or type != {CARD_NEW}""")
+        db.execute(
+            f"update cards set reps=0,lapses=0,odid=0,odue=0,queue={QUEUE_NEW}")
+        # forget non-new cards, putting them at the end of the new queue
+        db.execute(f"""
+update cards set type={CARD_NEW},queue={QUEUE_NEW},ivl=0,due=0,odue=0,factor=?
+where id in (select id from expnonnew)""", STARTING_FACTOR)
+        start = (db.scalar(
+            f"select max(due) from cards where type={CARD_NEW}") or 0) + 1
+        # their notes are numbered in the order of their first card
+        db.execute(
+            "create temp table expnotepos (pos integer primary key, nid integer)")
+        db.execute("""
+insert into expnotepos (nid) select nid from expnonnew
+group by nid order by min(id)""")
+        db.execute("create index expnotepos_nid on expnotepos (nid)")
+        db.execute("""
+update cards set due=?+(select pos from expnotepos where nid=cards.nid)-1,
+mod=?, usn=? where id in (select id from expnonnew)""",
+                   start, intTime(), self.dst.usn())
+
     def postExport(self):
         # overwrite to apply customizations to the deck before it's closed,
         # such as update the deck description
@@ -305,20 +350,42 @@ class AnkiExporter(Exporter):
 ######################################################################
 
 class AnkiPackageExporter(AnkiExporter):
+    """
+    throughput -- after an export, a dict with the number of bytes of
+    the package, the number of seconds taken to write it, and their ratio.
+    """
 
     key = _("Anki Deck Package")
     ext = ".apkg"
+    # Media whose format is already compressed. Deflating them wastes time.
+    storedExtensions = {
+        "mp3", "ogg", "oga", "opus", "m4a", "aac", "flac", "wma", "spx",
+        "jpg", "jpeg", "png", "gif", "webp", "ico", "tif", "tiff",
+        "mp4", "webm", "mkv", "mov", "avi", "mpg", "mpeg", "ogv", "3gp",
+        "flv", "swf", "zip", "gz", "bz2", "xz", "7z", "pdf", "woff", "woff2"}
+    # Media in uncompressed formats (text, fonts, bitmaps, wave audio),
+    # which deflate well.
+    deflatedExtensions = {
+        "svg", "css", "js", "html", "htm", "txt", "json", "xml", "ttf",
+        "otf", "tex", "csv", "bmp", "wav"}
 
     def __init__(self, col):
         AnkiExporter.__init__(self, col)
+        self.throughput = None
 
     def exportInto(self, path):
+        startTime = time.time()
         # open a zip file
         zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, allowZip64=True)
         media = self.doExport(zip, path)
         # media map
         zip.writestr("media", json.dumps(media))
         zip.close()
+        elapsed = max(time.time() - startTime, 1e-6)
+        size = os.path.getsize(path)
+        self.throughput = dict(bytes=size, seconds=elapsed,
+                               bytesPerSecond=size/elapsed)
+        self.col.log(path, self.throughput)
 
     def doExport(self, zip, path):
         # export into the anki2 file
@@ -345,22 +412,45 @@ class AnkiPackageExporter(AnkiExporter):
         return media
 
     def _exportMedia(self, zip, files, fdir):
+        """Write the files of fdir in the zip, named by their index in
+        files. Return the map from those indexes to the file names.
+
+        Files are streamed into the archive, each compressed as
+        _compressType decides."""
         media = {}
         for index, file in enumerate(files):
-            cStr = str(index)
-            mpath = os.path.join(fdir, file)
-            if os.path.isdir(mpath):
+            path = os.path.join(fdir, file)
+            compressType = self._compressType(path)
+            if compressType is None:
+                # directory or missing file
                 continue
-            if os.path.exists(mpath):
-                if re.search(r'\.svg$', file, re.IGNORECASE):
-                    zip.write(mpath, cStr, zipfile.ZIP_DEFLATED)
-                else:
-                    zip.write(mpath, cStr, zipfile.ZIP_STORED)
-                media[cStr] = unicodedata.normalize("NFC", file)
-                runHook("exportedMediaFiles", index)
+            cStr = str(index)
+            zip.write(path, cStr, compressType)
+            media[cStr] = unicodedata.normalize("NFC", file)
+            runHook("exportedMediaFiles", index)
 
         return media
 
+    def _compressType(self, path):
+        """How to compress the media at path in the package. None if it
+        should not be exported.
+
+        Already compressed formats are stored, text formats are
+        deflated. Otherwise, the start of the file is compressed to
+        check whether deflating it is worthwhile."""
+        if not os.path.isfile(path):
+            return None
+        ext = os.path.splitext(path)[1][1:].lower()
+        if ext in self.storedExtensions:
+            return zipfile.ZIP_STORED
+        if ext in self.deflatedExtensions:
+            return zipfile.ZIP_DEFLATED
+        with open(path, "rb") as file:
+            sample = file.read(65536)
+        if len(zlib.compress(sample, 1)) < 0.9*len(sample):
+            return zipfile.ZIP_DEFLATED
+        return zipfile.ZIP_STORED
+
     def prepareMedia(self):
         # chance to move each file in self.mediaFiles into place before media
         # is zipped up
@@ -398,11 +488,15 @@ class AnkiCollectionPackageExporter(AnkiPackageExporter):
         self.count = self.col.cardCount()
         v2 = self.col.schedVer() != 1
         self.col.close()
-        if not v2:
-            zip.write(self.col.path, "collection.anki2")
-        else:
-            self._addDummyCollection(zip)
-            zip.write(self.col.path, "collection.anki21")
+        path = self._collectionCopy()
+        try:
+            if not v2:
+                zip.write(path, "collection.anki2")
+            else:
+                self._addDummyCollection(zip)
+                zip.write(path, "collection.anki21")
+        finally:
+            os.unlink(path)
         self.col.reopen()
         # copy all media
         if not self.includeMedia:
@@ -410,6 +504,26 @@ class AnkiCollectionPackageExporter(AnkiPackageExporter):
         mdir = self.col.media.dir()
         return self._exportMedia(zip, os.listdir(mdir), mdir)
 
+    # tables which are not part of the collection format: the tag index
+    # and the LaTeX errors are rebuilt by the client, the object tables
+    # are also saved as blobs when the collection is closed
+    extraTables = ("note_tags", "note_tags_state", "latex_errors",
+                   "blobsums") + registry.tables
+
+    def _collectionCopy(self):
+        """The path of a copy of the closed collection, without
+        extraTables. The collection itself is left untouched."""
+        path = namedtmp("export.anki2")
+        if os.path.exists(path):
+            os.unlink(path)
+        shutil.copyfile(self.col.path, path)
+        db = DB(path)
+        for table in self.extraTables:
+            db.execute(f"drop table if exists {table}")
+        db.commit()
+        db.close()
+        return path
+
 # Export modules
 ##########################################################################
 
@@ -262,13 +262,9 @@ class Finder:
         (val, args) = args
         if val == "none":
             return 'note.tags = ""'
-        val = val.replace("*", "%")
-        if not val.startswith("%"):
-            val = "% " + val
-        if not val.endswith("%") or val.endswith('\\%'):
-            val += " %"
-        args.append(val)
-        return "note.tags like ? escape '\\'"
+        query, queryArgs = self.col.tags.tagQuery(val)
+        args.extend(queryArgs)
+        return "note.id in (%s)" % query
 
     def _findCardState(self, args):
         """A sql query, as in 'is:foo'"""
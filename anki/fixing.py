@@ -1,35 +1,73 @@
 import os
-import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 from anki.consts import *
+from anki.db import DB, DBError
 from anki.dconf import defaultConf as defaultDeckConf
 from anki.decks import defaultDeck, defaultDynamicDeck
 from anki.lang import _, ngettext
-from anki.utils import ids2str, intTime
+from anki.utils import (fieldChecksum, guid64, ids2str, intTime, splitFields,
+                        stripHTMLMedia)
 
 
 class FixingManager:
+
+    """Check the database, and fix the problems found.
+
+    Each table is read once, by a scan collecting what every check on
+    this table needs. The scans only read the collection, so when
+    possible they run concurrently, each on its own read-only
+    connection. Then the problems found are fixed on the collection,
+    each kind by a few set-based statements.
+
+    problems -- the messages describing the problems found
+    timings -- associate to each scan and each group of fixes its
+    number of seconds
+    parallel -- whether the scans may run in worker threads
+    models -- associate to each model id its number of fields, the index
+    of its sort field and, for standard models, the set of its
+    templates' ordinals
+    scanned -- associate to each scan its result
+    """
+
+    scans = ("integrity", "scanNotes", "scanCards", "scanRevlog")
+    maxWorkers = 4
+
     def __init__(self, col):
         self.col = col
         self.db = self.col.db
+        self.parallel = True
+        self.timings = {}
 
     def run(self):
         "Fix possible problems and rebuild caches."
         self.problems = []
-        self.curs = self.db.cursor()
+        self.timings = {}
         self.col.save()
-        oldSize = os.stat(self.col.path)[stat.ST_SIZE]
+        # there is no checkpoint: the fixes aren't journaled
+        with self.col.withoutUndo():
+            return self._run()
+
+    def _run(self):
+        self.models = self._modelInfo()
+        self.scanned = self._runScans()
 
         # whether sqlite find a problem in its database
-        if self.db.scalar("pragma integrity_check") != "ok":
+        if self.scanned['integrity'] != "ok":
             return (_("Collection is corrupt. Please see the manual."), False)
 
         self.actualFix()
 
         # and finally, optimize
-        self.col.optimize()
-        newSize = os.stat(self.col.path)[stat.ST_SIZE]
-        txt = _("Database rebuilt and optimized.")
+        with self._timed("optimize"):
+            vacuumed = self.col.optimize()
+        self.col.log("check database", self.timings)
+        if vacuumed:
+            txt = _("Database rebuilt and optimized.")
+        else:
+            txt = _("Database optimized.")
         ok = not self.problems
         self.problems.append(txt)
         # if any problems were found, force a full sync
@@ -38,31 +76,198 @@ class FixingManager:
         self.col.save()
         return ("\n".join(self.problems), ok)
 
+    def _modelInfo(self):
+        info = {}
+        for model in self.col.models.all():
+            ords = None
+            if model['type'] == MODEL_STD:
+                ords = {template['ord'] for template in model['tmpls']}
+            info[int(model.getId())] = (len(model['flds']), model.sortIdx(), ords)
+        return info
+
+    @contextmanager
+    def _timed(self, name):
+        startTime = time.time()
+        try:
+            yield
+        finally:
+            self.timings[name] = time.time() - startTime
+
+    # Scans
+    ######################################################################
+
+    def _runScans(self):
+        "Associate to each scan its result."
+        if not self._canParallelize():
+            return {name: self._timedScan(name, self.db) for name in self.scans}
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.maxWorkers) as executor:
+            futures = [executor.submit(self._readOnlyScan, name)
+                       for name in self.scans]
+            for name, future in zip(self.scans, futures):
+                try:
+                    results[name] = future.result()
+                except DBError:
+                    # e.g. database locked. Use the main connection instead.
+                    results[name] = self._timedScan(name, self.db)
+        return results
+
+    def _canParallelize(self):
+        """Whether the scans can run on other connections, which only see
+        what is committed."""
+        return (self.parallel and
+                not self.db.mod and
+                not self.col.server and
+                os.path.exists(self.col.path))
+
+    def _readOnlyScan(self, name):
+        "Run the scan name on a new read-only connection, in a worker thread."
+        db = DB(self.col.path, readOnly=True)
+        try:
+            return self._timedScan(name, db)
+        finally:
+            db.close()
+
+    def _timedScan(self, name, db):
+        with self._timed(name):
+            return getattr(self, name)(db)
+
+    def integrity(self, db):
+        return db.scalar("pragma integrity_check")
+
+    def scanNotes(self, db):
+        """The problems of the notes table.
+
+        missingModel, wrongFieldCount, withoutCard -- the ids of the notes
+        whose model is missing, whose number of fields is not the
+        model's, and which have no card
+        fieldCache -- (sfld, csum, id) for the notes whose field cache is
+        outdated
+        duplicateGuids -- (id, id of the first note with this guid) for
+        the notes whose guid was already used
+        """
+        missingModel = []
+        wrongFieldCount = []
+        withoutCard = []
+        fieldCache = []
+        duplicateGuids = []
+        guids = {}
+        for id, mid, flds, sfld, csum, guid, hasCard in db.execute("""
+select id, mid, flds, sfld, csum, guid,
+exists (select 1 from cards where nid = notes.id) from notes"""):
+            info = self.models.get(mid)
+            if info is None:
+                missingModel.append(id)
+                continue
+            nbFields, sortIdx, ords = info
+            fields = splitFields(flds)
+            if len(fields) != nbFields:
+                wrongFieldCount.append(id)
+                continue
+            if not hasCard:
+                withoutCard.append(id)
+                continue
+            newSfld = stripHTMLMedia(fields[sortIdx])
+            newCsum = fieldChecksum(fields[0])
+            # sfld has integer affinity
+            if str(sfld) != newSfld or csum != newCsum:
+                fieldCache.append((newSfld, newCsum, id))
+            if guid in guids:
+                duplicateGuids.append((id, guids[guid]))
+            else:
+                guids[guid] = id
+        return dict(missingModel=missingModel, wrongFieldCount=wrongFieldCount,
+                    withoutCard=withoutCard, fieldCache=fieldCache,
+                    duplicateGuids=duplicateGuids)
+
+    def scanCards(self, db):
+        """The problems of the cards table.
+
+        withoutNote -- the ids of the cards whose note is missing
+        invalidOrdinal -- the ids of the cards of a standard model without
+        template of their ordinal
+        odue, bigDue, reviewDue, floatIvl -- (id, nid) for the cards to fix
+        by odueTypeLrnOrQueueDue, atMost1000000Due, reasonableRevueDue and
+        floatIvlInCard, as they are after the previous fixes
+        nextPos -- the due of the last new card, once fixed, plus one
+        """
+        withoutNote = []
+        invalidOrdinal = []
+        odue = []
+        bigDue = []
+        reviewDue = []
+        floatIvl = []
+        lastPos = None
+        for (id, nid, ord, type, queue, due, odue_, odid, ivl, mid) in db.execute("""
+select c.id, c.nid, c.ord, c.type, c.queue, c.due, c.odue, c.odid, c.ivl, n.mid
+from cards c left join notes n on n.id = c.nid"""):
+            if mid is None:
+                withoutNote.append(id)
+                continue
+            ords = self.models.get(mid, (None, None, None))[2]
+            if ords is not None and ord not in ords:
+                invalidOrdinal.append(id)
+                continue
+            if odue_ > 0 and (type == CARD_LRN or queue == CARD_DUE) and not odid:
+                odue.append((id, nid))
+            if type == CARD_NEW and due >= 1000000:
+                bigDue.append((id, nid))
+                due = 1000000 + int(due) % 1000000
+            if type == CARD_NEW and (lastPos is None or due > lastPos):
+                lastPos = due
+            if queue == 2 and due > 100000:
+                reviewDue.append((id, nid))
+            elif ivl != round(ivl) or due != round(due):
+                floatIvl.append((id, nid))
+        return dict(withoutNote=withoutNote, invalidOrdinal=invalidOrdinal,
+                    odue=odue, bigDue=bigDue, reviewDue=reviewDue,
+                    floatIvl=floatIvl,
+                    nextPos=0 if lastPos is None else lastPos + 1)
+
+    def scanRevlog(self, db):
+        "The ids of the reviews whose intervals are not integers."
+        return db.list("""
+select id from revlog where ivl != round(ivl) or lastIvl != round(lastIvl)""")
+
+    # Fixes
+    ######################################################################
+
     def actualFix(self):
-        self.noteWithMissingModel()
-        self.override()
-        self.req()
-        self.invalidCardOrdinal()
-        self.wrongNumberOfField()
-        self.noteWithoutCard()
-        self.cardWithoutNote()
-        self.odueTypeLrnOrQueueDue()
-        # tags
-        self.col.tags.registerNotes()
-        self.updateAllFieldcache()
-        self.atMost1000000Due()
-        self.setNextPos()
-        self.reasonableRevueDue()
-        self.floatIvlInCard()
-        self.floatIvlInRevLog()
-        self.ensureSomeNoteType()
-        self.checkDeck()
-        self.uniqueGuid()
+        with self._timed("fixModels"):
+            self.noteWithMissingModel()
+            self.override()
+            self.req()
+        with self._timed("fixNotes"):
+            self.invalidCardOrdinal()
+            self.wrongNumberOfField()
+            self.noteWithoutCard()
+            self.cardWithoutNote()
+        with self._timed("fixCards"):
+            self.odueTypeLrnOrQueueDue()
+            self.atMost1000000Due()
+            self.setNextPos()
+            self.reasonableRevueDue()
+            self.floatIvlInCard()
+            self.floatIvlInRevLog()
+        with self._timed("fixCaches"):
+            # tags
+            self.col.tags.registerNotes()
+            self.updateAllFieldcache()
+        with self._timed("fixDecks"):
+            self.ensureSomeNoteType()
+            self.checkDeck()
+            self.uniqueGuid()
+
+    def _remaining(self, cards):
+        """The ids of cards, a list of (id, nid), whose note was not
+        deleted by the previous fixes."""
+        notes = self.scanned['scanNotes']
+        removed = set(notes['missingModel']) | set(notes['wrongFieldCount'])
+        return [id for id, nid in cards if nid not in removed]
 
     def noteWithMissingModel(self):
         # note types with a missing model
-        ids = self.db.list("""
-select id from notes where mid not in """ + ids2str(self.col.models.ids()))
+        ids = self.scanned['scanNotes']['missingModel']
         if ids:
             self.problems.append(
                 ngettext("Deleted %d note with missing note type.",
@@ -86,39 +291,28 @@ select id from notes where mid not in """ + ids2str(self.col.models.ids()))
                 self.problems.append(_("Fixed note type: %s") % model.getName())
 
     def invalidCardOrdinal(self):
-        for model in self.col.models.all(type=MODEL_STD):
-            # cards with invalid ordinal
-            ids = self.db.list("""
-select id from cards where ord not in %s and nid in (
-select id from notes where mid = ?)""" %
-                               ids2str([template['ord'] for template in model['tmpls']]),
-                               model.getId())
-            if ids:
-                self.problems.append(
-                    ngettext("Deleted %d card with missing template.",
-                             "Deleted %d cards with missing template.",
-                             len(ids)) % len(ids))
-                self.col.remCards(ids)
+        # cards with invalid ordinal
+        ids = self.scanned['scanCards']['invalidOrdinal']
+        if ids:
+            self.problems.append(
+                ngettext("Deleted %d card with missing template.",
+                         "Deleted %d cards with missing template.",
+                         len(ids)) % len(ids))
+            self.col.remCards(ids)
 
     def wrongNumberOfField(self):
         # notes with invalid field count
-        for model in self.col.models.all():
-            ids = []
-            for id, flds in self.db.execute(
-                    "select id, flds from notes where mid = ?", model.getId()):
-                if (flds.count("\x1f") + 1) != len(model['flds']):
-                    ids.append(id)
-            if ids:
-                self.problems.append(
-                    ngettext("Deleted %d note with wrong field count.",
-                             "Deleted %d notes with wrong field count.",
-                             len(ids)) % len(ids))
-                self.col.remNotes(ids)
+        ids = self.scanned['scanNotes']['wrongFieldCount']
+        if ids:
+            self.problems.append(
+                ngettext("Deleted %d note with wrong field count.",
+                         "Deleted %d notes with wrong field count.",
+                         len(ids)) % len(ids))
+            self.col.remNotes(ids)
 
     def noteWithoutCard(self):
         # delete any notes with missing cards
-        ids = self.db.list("""
-select id from notes where id not in (select distinct nid from cards)""")
+        ids = self.scanned['scanNotes']['withoutCard']
         if ids:
             cnt = len(ids)
             self.problems.append(
@@ -128,8 +322,7 @@ select id from notes where id not in (select distinct nid from cards)""")
 
     def cardWithoutNote(self):
         # cards with missing notes
-        ids = self.db.list("""
-select id from cards where nid not in (select id from notes)""")
+        ids = self.scanned['scanCards']['withoutNote']
         if ids:
             cnt = len(ids)
             self.problems.append(
@@ -139,8 +332,7 @@ select id from cards where nid not in (select id from notes)""")
 
     def odueTypeLrnOrQueueDue(self):
         # cards with odue set when it shouldn't be
-        ids = self.db.list(f"""
-select id from cards where odue > 0 and (type={CARD_LRN} or queue={CARD_DUE}) and not odid""")
+        ids = self._remaining(self.scanned['scanCards']['odue'])
         if ids:
             cnt = len(ids)
             self.problems.append(
@@ -149,42 +341,28 @@ select id from cards where odue > 0 and (type={CARD_LRN} or queue={CARD_DUE}) an
             self.db.execute("update cards set odue=0 where id in "+
                 ids2str(ids))
 
-    def odueQueue2(self):
-        # cards with odid set when not in a dyn deck
-        dids = [id for id in self.col.decks.allIds() if not self.col.decks.get(id).isDyn()]
-        ids = self.db.list("""
-        select id from cards where odid > 0 and did in %s""" % ids2str(dids))
-        if ids:
-            cnt = len(ids)
-            self.problems.append(
-                ngettext("Fixed %d card with invalid properties.",
-                         "Fixed %d cards with invalid properties.", cnt) % cnt)
-            self.db.execute("update cards set odid=0, odue=0 where id in "+
-                ids2str(ids))
-
     def updateAllFieldcache(self):
-        # field cache
-        for model in self.col.models.all():
-            self.col.updateFieldCache(model.nids())
+        # field cache; only the outdated rows are written
+        self.db.executemany("update notes set sfld=?, csum=? where id=?",
+                            self.scanned['scanNotes']['fieldCache'])
 
     def atMost1000000Due(self):
         # new cards can't have a due position > 32 bits, so wrap items over
         # 2 million back to 1 million
-        self.curs.execute(f"""
-update cards set due=1000000+due%1000000,mod=?,usn=? where due>=1000000
-and type = {CARD_NEW}""", [intTime(), self.col.usn()])
-        if self.curs.rowcount:
-            self.problems.append("Found %d new cards with a due number >= 1,000,000 - consider repositioning them in the Browse screen." % self.curs.rowcount)
+        ids = self._remaining(self.scanned['scanCards']['bigDue'])
+        if ids:
+            self.db.execute("""
+update cards set due=1000000+due%1000000,mod=?,usn=? where id in """ +
+                            ids2str(ids), intTime(), self.col.usn())
+            self.problems.append("Found %d new cards with a due number >= 1,000,000 - consider repositioning them in the Browse screen." % len(ids))
 
     def setNextPos(self):
         # new card position
-        self.col.conf['nextPos'] = self.db.scalar(
-            f"select max(due)+1 from cards where type = {CARD_NEW}") or 0
+        self.col.conf['nextPos'] = self.scanned['scanCards']['nextPos']
 
     def reasonableRevueDue(self):
         # reviews should have a reasonable due #
-        ids = self.db.list(
-            "select id from cards where queue = 2 and due > 100000")
+        ids = self._remaining(self.scanned['scanCards']['reviewDue'])
         if ids:
             self.problems.append("Reviews had incorrect due date.")
             self.db.execute(
@@ -193,14 +371,16 @@ and type = {CARD_NEW}""", [intTime(), self.col.usn()])
 
     def floatIvlInCard(self):
         # v2 sched had a bug that could create decimal intervals
-        self.curs.execute("update cards set ivl=round(ivl),due=round(due) where ivl!=round(ivl) or due!=round(due)")
-        if self.curs.rowcount:
-            self.problems.append("Fixed %d cards with v2 scheduler bug." % self.curs.rowcount)
+        ids = self._remaining(self.scanned['scanCards']['floatIvl'])
+        if ids:
+            self.db.execute("update cards set ivl=round(ivl),due=round(due) where id in " + ids2str(ids))
+            self.problems.append("Fixed %d cards with v2 scheduler bug." % len(ids))
 
     def floatIvlInRevLog(self):
-        self.curs.execute("update revlog set ivl=round(ivl),lastIvl=round(lastIvl) where ivl!=round(ivl) or lastIvl!=round(lastIvl)")
-        if self.curs.rowcount:
-            self.problems.append("Fixed %d review history entries with v2 scheduler bug." % self.curs.rowcount)
+        ids = self.scanned['scanRevlog']
+        if ids:
+            self.db.execute("update revlog set ivl=round(ivl),lastIvl=round(lastIvl) where id in " + ids2str(ids))
+            self.problems.append("Fixed %d review history entries with v2 scheduler bug." % len(ids))
 
     def ensureSomeNoteType(self):
         # models
@@ -222,13 +402,8 @@ and type = {CARD_NEW}""", [intTime(), self.col.usn()])
                         self.problems.append(f"Adding some «{key}» which was missing in deck{what} {params['name']}")
 
     def uniqueGuid(self):
-        lastGuid = None
-        nids = []
-        lastNid = None
-        for guid, nid in self.db.all("select guid, id from notes order by guid"):
-            if lastGuid == guid:
-                self.db.execute("update notes set guid = ? where id = ? ", guid64(), nid)
-                nids.append((nid,lastNid))
-                self.problems.append(f"The guid of note %d has been changed because it used to be the guid of note %d.", nid, lastNid)
-            lastGuid = guid
-            lastNid = nid
+        duplicates = self.scanned['scanNotes']['duplicateGuids']
+        self.db.executemany("update notes set guid = ? where id = ?",
+                            [(guid64(), nid) for nid, firstNid in duplicates])
+        for nid, firstNid in duplicates:
+            self.problems.append("The guid of note %d has been changed because it used to be the guid of note %d." % (nid, firstNid))
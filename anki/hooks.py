@@ -8,11 +8,16 @@ Hooks - hook management and tools for extending Anki
 
 To find available hooks, grep for runHook and runFilter in the source code.
 
+The time spent in the functions on hooks can be measured with
+startHookProfile(), see Profiling below.
+
 Instrumenting allows you to modify functions that don't have hooks available.
 If you call wrap() with pos='around', the original function will not be called
 automatically but can be called with _old().
 """
 
+import json
+import time
 from typing import Any, Callable, Dict, List
 
 import decorator
@@ -21,6 +26,9 @@ import decorator
 ##############################################################################
 
 _hooks: Dict[str, List[Callable[..., Any]]] = {}
+# functions called, once, before the first run of a hook. E.g. to
+# import a lazy add-on, which adds its functions to the hook.
+_hookLoaders: Dict[str, List[Callable[[], Any]]] = {}
 
 def runHook(hook, *args):
     """Run all functions on hook. Do not return value.
@@ -28,6 +36,8 @@ def runHook(hook, *args):
     keyword arguments:
     hook -- a hook name (string)
     *args -- the list of arguments to give to the functions"""
+    if hook in _hookLoaders:
+        _runHookLoaders(hook)
     hook = _hooks.get(hook, None)
     if hook:
         for func in hook:
@@ -46,6 +56,8 @@ def runFilter(hook, arg, *args):
     hook -- a hook name (string)
     arg -- the arg, which is modified by each method
     *args -- the list of arguments given to every functions"""
+    if hook in _hookLoaders:
+        _runHookLoaders(hook)
     hook = _hooks.get(hook, None)
     if hook:
         for func in hook:
@@ -61,6 +73,8 @@ def addHook(hook, func):
     if not _hooks.get(hook, None):
         _hooks[hook] = []
     if func not in _hooks[hook]:
+        if _profile is not None:
+            func = _TimedHook(hook, func)
         _hooks[hook].append(func)
 
 def remHook(hook, func):
@@ -69,6 +83,15 @@ def remHook(hook, func):
     if func in hook:
         hook.remove(func)
 
+def addHookLoader(hook, loader):
+    """Call loader before hook is first run. Loaders of a hook are called
+    in the order they were added."""
+    _hookLoaders.setdefault(hook, []).append(loader)
+
+def _runHookLoaders(hook):
+    for loader in _hookLoaders.pop(hook):
+        loader()
+
 # Instrumenting
 ##############################################################################
 
@@ -102,3 +125,92 @@ def wrap(old, new, pos="after"):
         return repl(*args, **kwargs)
 
     return decorator.decorator(decorator_wrapper)(old)
+
+# Profiling
+##############################################################################
+# While profiling, each function on a hook is replaced by a _TimedHook,
+# which counts its calls and their time. runHook and runFilter are
+# unchanged, so profiling costs nothing while it is off.
+
+# (hook, function, module) -> [calls, seconds], or None if not profiling
+_profile = None
+
+class _TimedHook:
+    "A function on hook, which records its calls in _profile."
+
+    def __init__(self, hook, func):
+        self.func = func
+        self.key = (hook, getattr(func, "__qualname__", repr(func)),
+                    getattr(func, "__module__", None) or "")
+        self.stats = _profile.setdefault(self.key, [0, 0])
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        try:
+            return self.func(*args)
+        finally:
+            self.stats[0] += 1
+            self.stats[1] += time.perf_counter() - start
+
+    def __eq__(self, other):
+        # so that remHook and addHook find the original function
+        if isinstance(other, _TimedHook):
+            other = other.func
+        return self.func == other
+
+    def __hash__(self):
+        return hash(self.func)
+
+def startHookProfile():
+    "Start recording the calls of each function on each hook."
+    global _profile
+    if _profile is not None:
+        return
+    _profile = {}
+    for hook, funcs in _hooks.items():
+        funcs[:] = [_TimedHook(hook, func) for func in funcs]
+
+def stopHookProfile():
+    "Stop recording. Return the records, as in hookProfile."
+    global _profile
+    if _profile is None:
+        return []
+    for funcs in _hooks.values():
+        funcs[:] = [func.func if isinstance(func, _TimedHook) else func
+                    for func in funcs]
+    profile = hookProfile()
+    _profile = None
+    return profile
+
+def hookProfile():
+    """A dict for each function called on a hook since profiling started,
+    the slowest first. Its keys are hook, function, module, addon (the
+    add-on folder, or None for anki's own functions), calls and seconds."""
+    if _profile is None:
+        return []
+    records = []
+    for (hook, func, module), (calls, seconds) in _profile.items():
+        if not calls:
+            continue
+        package = module.split(".")[0]
+        addon = None if package in ("anki", "aqt") else package
+        records.append(dict(hook=hook, function=func, module=module,
+                            addon=addon, calls=calls, seconds=seconds))
+    records.sort(key=lambda record: -record['seconds'])
+    return records
+
+def hookProfileReport():
+    "The profile as text, to be read in the debug console."
+    lines = ["%8.3fs %8d %s: %s (%s)" % (
+        record['seconds'], record['calls'], record['hook'],
+        record['function'], record['addon'] or record['module'])
+             for record in hookProfile()]
+    return "\n".join(["seconds    calls hook: function (add-on)"] + lines)
+
+def hookProfileJson(path=None):
+    "The profile as json. Also written at path if it is given."
+    text = json.dumps(hookProfile(), indent=1)
+    if path:
+        with open(path, "w", encoding="utf8") as file:
+            file.write(text)
+    return text
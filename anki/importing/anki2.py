@@ -10,7 +10,7 @@ from anki.importing.base import Importer
 from anki.lang import _
 from anki.models import Model
 from anki.storage import Collection
-from anki.utils import intTime, joinFields, splitFields
+from anki.utils import ids2str, intTime, joinFields, splitFields
 
 
 class Anki2Importer(Importer):
@@ -23,6 +23,7 @@ class Anki2Importer(Importer):
     _changedGuids -- seems to be always empty
     _ignoredGuids -- sends to True the GUID which won't be imported.
     allowUpdate -- whether an update is
+    streaming -- whether notes and cards are imported by batches of batchSize. See _importNotesStreaming
     dupes -- Number of cards which have been ignored: note with same guid is already in src or dst collection, and update allowed but imported mod time of the model of the imported note is older or equal to the mod time of the other note with same guid.
     add -- the number of cards added
     updated -- the number of card updated
@@ -31,6 +32,10 @@ class Anki2Importer(Importer):
     needMapper = False
     deckPrefix = None
     allowUpdate = True
+    # whether to read the source collection by batches of batchSize notes
+    # and cards, instead of loading both collections in memory
+    streaming = False
+    batchSize = 1000
 
     def __init__(self, col, file):
         super().__init__(col, file)
@@ -82,19 +87,24 @@ class Anki2Importer(Importer):
     ######################################################################
 
     def _logNoteRow(self, action, noteRow):
-        self.log.append("[%s] %s" % (
+        self.log.append(self._noteLogLine(action, noteRow))
+
+    def _noteLogLine(self, action, noteRow):
+        return "[%s] %s" % (
             action,
             noteRow[6].replace("\x1f", ", ")
-        ))
+        )
 
     def _importNotes(self):
+        if self.streaming:
+            return self._importNotesStreaming()
         # build guid -> (id,mod,mid) hash & map of existing note ids
         self._notes = {}
-        existing = {}
+        existing = set()
         for id, guid, mod, mid in self.dst.db.execute(
             "select id, guid, mod, mid from notes"):
             self._notes[guid] = (id, mod, mid)
-            existing[id] = True
+            existing.add(id)
         # we may need to rewrite the guid if the model schemas don't match,
         # so we need to keep track of the changes for the card import stage
         self._changedGuids = {}
@@ -102,103 +112,177 @@ class Anki2Importer(Importer):
         # guids, so we avoid importing invalid cards
         self._ignoredGuids = {}
         # iterate over source collection
-        add = []
-        update = []
-        dirty = []
+        rows = {"add": [], "update": [], "ignored": [], "identical": []}
         usn = self.dst.usn()
-        dupesIdentical = []
-        dupesIgnored = []
         total = 0
         for note in self.src.db.execute(
             "select * from notes"):
             total += 1
-            # turn the db result into a mutable list
-            nid, guid, mid, mod, usn_, tags, flds, sfld, csum, flags, data = note
-            shouldAdd, mid = self._uniquifyNote(guid, mid)
-            if shouldAdd:
-                # ensure id is unique
-                while nid in existing:
-                    nid += 999
-                existing[nid] = True
-                # bump usn
-                usn_ = usn
-                # update media references in case of dupes
-                flds = self._mungeMedia(mid, flds)
-                note = nid, guid, mid, mod, usn_, tags, flds, sfld, csum, flags, data
-                add.append(note)
-                dirty.append(nid)
-                # note we have added the guid
-                self._notes[guid] = (nid, mod, mid)
-            else:
-                # a duplicate or changed schema - safe to update?
-                if self.allowUpdate:
-                    oldNid, oldMod, oldMid = self._notes[guid]
-                    # will update if incoming note more recent
-                    if oldMod < mod:
-                        # safe if note types identical
-                        if oldMid == mid:
-                            # incoming note should use existing id
-                            nid = oldNid
-                            usn_ = usn
-                            flds = self._mungeMedia(mid, flds)
-                            note = nid, guid, mid, mod, usn_, tags, flds, sfld, csum, flags, data
-                            update.append(note)
-                            dirty.append(nid)
-                        else:
-                            note = nid, guid, mid, mod, usn_, tags, flds, sfld, csum, flags, data
-                            dupesIgnored.append(note)
-                            self._ignoredGuids[guid] = True
-                    else:
-                        note = nid, guid, mid, mod, usn_, tags, flds, sfld, csum, flags, data
-                        dupesIdentical.append(note)
+            action, note = self._classifyNote(note, existing, usn)
+            if action:
+                rows[action].append(note)
+        dirty = [note[0] for note in rows["add"] + rows["update"]]
+        self._logNotes(total, *[
+            [self._noteLogLine(action, row) for row in rows[key]]
+            for action, key in self._logActions()])
+        # add to col
+        self.dst.db.executemany(
+            "insert or replace into notes values (?,?,?,?,?,?,?,?,?,?,?)",
+            rows["add"])
+        self.dst.db.executemany(
+            "insert or replace into notes values (?,?,?,?,?,?,?,?,?,?,?)",
+            rows["update"])
+        self.dst.updateFieldCache(dirty)
+        self.dst.tags.registerNotes(dirty)
 
+    def _importNotesStreaming(self):
+        """As _importNotes, without loading the notes of either
+        collection in memory.
+
+        The guid, id, mod and mid of destination notes are copied in
+        an indexed temporary table. Source notes are then read by
+        batches of batchSize; the guids of a batch are matched in sql,
+        and the batch is written before the next one is read. Only the
+        log lines are kept until the end."""
+        db = self.dst.db
+        db.execute("drop table if exists temp.impnotes")
+        db.execute("drop table if exists temp.impbatch")
+        db.execute("""
+create temp table impnotes (guid text primary key, id integer, mod integer,
+mid integer)""")
+        db.execute("""
+insert or replace into impnotes select guid, id, mod, mid from notes
+order by id""")
+        db.execute("create temp table impbatch (guid text, id integer)")
+        self._changedGuids = {}
+        self._ignoredGuids = {}
+        lines = {"add": [], "update": [], "ignored": [], "identical": []}
+        usn = self.dst.usn()
+        total = 0
+        cursor = self.src.db.execute("select * from notes")
+        while True:
+            batch = cursor.fetchmany(self.batchSize)
+            if not batch:
+                break
+            total += len(batch)
+            self._notes = self._batchNotes(batch, 1, 0)
+            existing = _UsedIds(db, "notes", [note[0] for note in batch])
+            rows = {"add": [], "update": [], "ignored": [], "identical": []}
+            for note in batch:
+                action, note = self._classifyNote(note, existing, usn)
+                if action:
+                    rows[action].append(note)
+            for action, key in self._logActions():
+                lines[key].extend(self._noteLogLine(action, row)
+                                  for row in rows[key])
+            db.executemany(
+                "insert or replace into notes values (?,?,?,?,?,?,?,?,?,?,?)",
+                rows["add"] + rows["update"])
+            db.executemany(
+                "insert or replace into impnotes values (?,?,?,?)",
+                [(note[1], note[0], note[3], note[2]) for note in rows["add"]])
+            dirty = [note[0] for note in rows["add"] + rows["update"]]
+            self.dst.updateFieldCache(dirty)
+            self.dst.tags.registerNotes(dirty)
+        self._notes = None
+        self._logNotes(total, *[lines[key] for action, key in self._logActions()])
+
+    def _batchNotes(self, batch, guidIndex, idIndex):
+        """The dict guid -> (id,mod,mid) of the destination notes, restricted
+        to the guids of the batch of rows. The rows are also saved in
+        impbatch."""
+        db = self.dst.db
+        db.execute("delete from impbatch")
+        db.executemany("insert into impbatch values (?, ?)",
+                       ((row[guidIndex], row[idIndex]) for row in batch))
+        notes = {}
+        for guid, id, mod, mid in db.execute("""
+select guid, id, mod, mid from impnotes
+where guid in (select guid from impbatch)"""):
+            notes[guid] = (id, mod, mid)
+        return notes
+
+    def _classifyNote(self, note, existing, usn):
+        """What to do with a note row of the source collection.
+
+        Return a pair (action, row), with action "add", "update",
+        "ignored" (the note type changed), "identical" or None (an
+        existing note, when updates are not allowed), and the row to
+        write or to log.
+
+        existing -- the set of note ids used in the destination. Updated
+        with the ids of added notes.
+        usn -- the usn of the destination
+        """
+        nid, guid, mid, mod, usn_, tags, flds, sfld, csum, flags, data = note
+        shouldAdd, mid = self._uniquifyNote(guid, mid)
+        if shouldAdd:
+            # ensure id is unique
+            while nid in existing:
+                nid += 999
+            existing.add(nid)
+            # bump usn
+            usn_ = usn
+            # update media references in case of dupes
+            flds = self._mungeMedia(mid, flds)
+            # note we have added the guid
+            self._notes[guid] = (nid, mod, mid)
+            return "add", (nid, guid, mid, mod, usn_, tags, flds, sfld, csum, flags, data)
+        # a duplicate or changed schema - safe to update?
+        if not self.allowUpdate:
+            return None, note
+        oldNid, oldMod, oldMid = self._notes[guid]
+        # will update if incoming note more recent
+        if oldMod >= mod:
+            return "identical", (nid, guid, mid, mod, usn_, tags, flds, sfld, csum, flags, data)
+        # safe if note types identical
+        if oldMid != mid:
+            self._ignoredGuids[guid] = True
+            return "ignored", (nid, guid, mid, mod, usn_, tags, flds, sfld, csum, flags, data)
+        # incoming note should use existing id
+        nid = oldNid
+        usn_ = usn
+        flds = self._mungeMedia(mid, flds)
+        return "update", (nid, guid, mid, mod, usn_, tags, flds, sfld, csum, flags, data)
+
+    def _logActions(self):
+        """The pairs (log action, note action), in the order in which notes
+        are logged."""
+        return ((_("Skipped"), "ignored"), (_("Updated"), "update"),
+                (_("Added"), "add"), (_("Identical"), "identical"))
+
+    def _logNotes(self, total, ignored, updated, added, identical):
+        """Log the number of notes of each kind, and then each of their log
+        line. Save those numbers for calling code."""
         self.log.append(_("Notes found in file: %d") % total)
 
-        if dupesIgnored:
+        if ignored:
             self.log.append(
                 _("Notes that could not be imported as note type has changed: %d") %
-                len(dupesIgnored))
-        if update:
+                len(ignored))
+        if updated:
             self.log.append(
                 _("Notes updated, as file had newer version: %d") %
-                len(update))
-        if add:
+                len(updated))
+        if added:
             self.log.append(
                 _("Notes added from file: %d") %
-                len(add))
-        if dupesIdentical:
+                len(added))
+        if identical:
             self.log.append(
                 _("Notes skipped, as they're already in your collection: %d") %
-                len(dupesIdentical))
+                len(identical))
 
         self.log.append("")
-
-        if dupesIgnored:
-            for row in dupesIgnored:
-                self._logNoteRow(_("Skipped"), row)
-        if update:
-            for row in update:
-                self._logNoteRow(_("Updated"), row)
-        if add:
-            for row in add:
-                self._logNoteRow(_("Added"), row)
-        if dupesIdentical:
-            for row in dupesIdentical:
-                self._logNoteRow(_("Identical"), row)
+        self.log.extend(ignored)
+        self.log.extend(updated)
+        self.log.extend(added)
+        self.log.extend(identical)
 
         # export info for calling code
-        self.dupes = len(dupesIdentical)
-        self.added = len(add)
-        self.updated = len(update)
-        # add to col
-        self.dst.db.executemany(
-            "insert or replace into notes values (?,?,?,?,?,?,?,?,?,?,?)",
-            add)
-        self.dst.db.executemany(
-            "insert or replace into notes values (?,?,?,?,?,?,?,?,?,?,?)",
-            update)
-        self.dst.updateFieldCache(dirty)
-        self.dst.tags.registerNotes(dirty)
+        self.dupes = len(identical)
+        self.added = len(added)
+        self.updated = len(updated)
 
     # determine if note is a duplicate, and adjust mid and/or guid as required
     # returns true if note should be added
@@ -324,83 +408,146 @@ class Anki2Importer(Importer):
     def _importCards(self):
         if self.mustResetLearning:
             self.src.changeSchedulerVer(2)
+        if self.streaming:
+            return self._importCardsStreaming()
         # build map of (guid, ord) -> cid and used id cache
         self._cards = {}
-        existing = {}
+        existing = set()
         for guid, ord, cid in self.dst.db.execute(
             "select note.guid, card.ord, card.id from cards card, notes note "
             "where card.nid = note.id"):
-            existing[cid] = True
+            existing.add(cid)
             self._cards[(guid, ord)] = cid
         # loop through src
         cards = []
         revlog = []
-        cnt = 0
         usn = self.dst.usn()
         aheadBy = self.src.sched.today - self.dst.sched.today
         for card in self.src.db.execute(
             "select note.guid, note.mid, card.* from cards card, notes note "
             "where card.nid = note.id"):
-            guid, mid, cid, nid, did, ord, mod, usn_, type, queue, due, ivl, factor, reps, lapses, left, odue, odid, flags, data = card
-            scid = cid
-            if guid in self._changedGuids:
-                guid = self._changedGuids[guid]
-            if guid in self._ignoredGuids:
-                continue
-            # does the card's note exist in dst col?
-            if guid not in self._notes:
+            row = self._cardRow(card, existing, usn, aheadBy)
+            if row is None:
                 continue
-            dnid = self._notes[guid]
-            # does the card already exist in the dst col?
-            if (guid, ord) in self._cards:
-                # fixme: in future, could update if newer mod time
-                continue
-            # doesn't exist. strip off note info, and save src id for later
-            # ensure the card id is unique
-            while cid in existing:
-                cid += 999
-            existing[cid] = True
-            # update cid, nid, etc
-            nid = self._notes[guid][0]
-            did = self._did(did)
-            mod = intTime()
-            # review cards have a due date relative to collection
-            if queue in (CARD_DUE, CARD_RELRN) or type == QUEUE_REV:
-                due -= aheadBy
-            # odue needs updating too
-            if odue:
-                odue -= aheadBy
-            # if odid true, convert card from filtered to normal
-            if odid:
-                # odid
-                odid = 0
-                # odue
-                due = odue
-                odue = 0
-                # queue
-                if type == QUEUE_LRN: # type
-                    queue = CARD_NEW
-                else:
-                    queue = type
-                # type
-                if type == QUEUE_LRN:
-                    type = QUEUE_NEW
-                if type == 1:
-                    type = 0
-            card = (cid, nid, did, ord, mod, usn, type, queue, due, ivl, factor, reps, lapses, left, odue, odid, flags, data)
-            cards.append(card)
-            # we need to import revlog, rewriting card ids and bumping usn
-            for rid, cid_, usn_, ease, ivl, lastIvl, factor, time, type in self.src.db.execute(
-                "select * from revlog where cid = ?", scid):
-                rev = (rid, cid, usn, ease, ivl, lastIvl, factor, time, type)
-                revlog.append(rev)
-            cnt += 1
+            cards.append(row)
+            revlog.extend(self._cardRevlog(row[0], card[2], usn))
         # apply
         self.dst.db.executemany("""
 insert or ignore into cards values (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""", cards)
         self.dst.db.executemany("""
 insert or ignore into revlog values (?,?,?,?,?,?,?,?,?)""", revlog)
 
+    def _importCardsStreaming(self):
+        """As _importCards, reading the source cards by batches of
+        batchSize, and writing each batch before the next one is read.
+
+        The notes and cards of the destination related to a batch are
+        found using the temporary table impnotes built during
+        _importNotesStreaming."""
+        db = self.dst.db
+        usn = self.dst.usn()
+        aheadBy = self.src.sched.today - self.dst.sched.today
+        cursor = self.src.db.execute(
+            "select note.guid, note.mid, card.* from cards card, notes note "
+            "where card.nid = note.id")
+        while True:
+            batch = cursor.fetchmany(self.batchSize)
+            if not batch:
+                break
+            # guids may have been changed during note import
+            self._notes = self._batchNotes(
+                [(self._changedGuids.get(card[0], card[0]),) for card in batch],
+                0, 0)
+            self._cards = {}
+            for guid, ord, cid in db.execute("""
+select impnotes.guid, cards.ord, cards.id from cards, impnotes
+where cards.nid = impnotes.id
+and impnotes.guid in (select guid from impbatch)"""):
+                self._cards[(guid, ord)] = cid
+            existing = _UsedIds(db, "cards", [card[2] for card in batch])
+            cards = []
+            revlog = []
+            for card in batch:
+                row = self._cardRow(card, existing, usn, aheadBy)
+                if row is None:
+                    continue
+                cards.append(row)
+                revlog.extend(self._cardRevlog(row[0], card[2], usn))
+            db.executemany("""
+insert or ignore into cards values (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""", cards)
+            db.executemany("""
+insert or ignore into revlog values (?,?,?,?,?,?,?,?,?)""", revlog)
+        self._notes = None
+        self._cards = None
+        db.execute("drop table if exists temp.impnotes")
+        db.execute("drop table if exists temp.impbatch")
+
+    def _cardRow(self, card, existing, usn, aheadBy):
+        """The row of the destination's cards table for a card of the
+        source, or None if the card should not be imported.
+
+        card -- a row of the source cards table, preceded by the guid and
+        mid of its note.
+        existing -- the set of card ids used in the destination. Updated
+        with the new id.
+        usn -- the usn of the destination
+        aheadBy -- number of days between the source and the destination
+        """
+        guid, mid, cid, nid, did, ord, mod, usn_, type, queue, due, ivl, factor, reps, lapses, left, odue, odid, flags, data = card
+        if guid in self._changedGuids:
+            guid = self._changedGuids[guid]
+        if guid in self._ignoredGuids:
+            return None
+        # does the card's note exist in dst col?
+        if guid not in self._notes:
+            return None
+        # does the card already exist in the dst col?
+        if (guid, ord) in self._cards:
+            # fixme: in future, could update if newer mod time
+            return None
+        # doesn't exist. strip off note info, and save src id for later
+        # ensure the card id is unique
+        while cid in existing:
+            cid += 999
+        existing.add(cid)
+        # update cid, nid, etc
+        nid = self._notes[guid][0]
+        did = self._did(did)
+        mod = intTime()
+        # review cards have a due date relative to collection
+        if queue in (CARD_DUE, CARD_RELRN) or type == QUEUE_REV:
+            due -= aheadBy
+        # odue needs updating too
+        if odue:
+            odue -= aheadBy
+        # if odid true, convert card from filtered to normal
+        if odid:
+            # odid
+            odid = 0
+            # odue
+            due = odue
+            odue = 0
+            # queue
+            if type == QUEUE_LRN: # type
+                queue = CARD_NEW
+            else:
+                queue = type
+            # type
+            if type == QUEUE_LRN:
+                type = QUEUE_NEW
+            if type == 1:
+                type = 0
+        return (cid, nid, did, ord, mod, usn, type, queue, due, ivl, factor, reps, lapses, left, odue, odid, flags, data)
+
+    def _cardRevlog(self, cid, scid, usn):
+        """The revlog rows of the source card scid, rewritten for the card
+        cid of the destination."""
+        # we need to import revlog, rewriting card ids and bumping usn
+        return [(rid, cid, usn, ease, ivl, lastIvl, factor, time, type)
+                for rid, cid_, usn_, ease, ivl, lastIvl, factor, time, type
+                in self.src.db.execute(
+                    "select * from revlog where cid = ?", scid)]
+
     # Media
     ######################################################################
 
@@ -481,3 +628,30 @@ insert or ignore into revlog values (?,?,?,?,?,?,?,?,?)""", revlog)
         self.dst.conf['nextPos'] = self.dst.db.scalar(
             "select max(due)+1 from cards where type = 0") or 0
         self.dst.save()
+
+
+class _UsedIds:
+    """The ids used in a table of the destination, as needed to import
+    a batch of rows.
+
+    The ids of the batch are fetched at once; an id is otherwise looked
+    up in the table when it is tested, which only occurs when an id
+    was bumped."""
+
+    def __init__(self, db, table, ids):
+        self.db = db
+        self.table = table
+        self.ids = set(db.list("select id from %s where id in %s" % (
+            table, ids2str(ids))))
+        self.checked = set(ids)
+
+    def __contains__(self, id):
+        if id not in self.checked:
+            self.checked.add(id)
+            if self.db.scalar("select 1 from %s where id = ?" % self.table, id):
+                self.ids.add(id)
+        return id in self.ids
+
+    def add(self, id):
+        self.checked.add(id)
+        self.ids.add(id)
@@ -4,6 +4,7 @@
 
 import json
 import os
+import shutil
 import unicodedata
 import zipfile
 
@@ -29,10 +30,9 @@ class AnkiPackageImporter(Anki2Importer):
         except KeyError:
             suffix = ".anki2"
 
-        col = z.read("collection"+suffix)
         colpath = tmpfile(suffix=suffix)
-        with open(colpath, "wb") as file:
-            file.write(col)
+        with z.open("collection"+suffix) as col, open(colpath, "wb") as file:
+            shutil.copyfileobj(col, file)
         self.file = colpath
         # we need the media dict in advance, and we'll need a map of fname ->
         # number to use during the import
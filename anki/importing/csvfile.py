@@ -3,6 +3,7 @@
 # License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
 
 import csv
+import itertools
 import re
 
 from anki.importing.noteimp import ForeignNote, NoteImporter
@@ -13,6 +14,11 @@ class TextImporter(NoteImporter):
 
     needDelimiter = True
     patterns = "\t|,;:"
+    # whether to read the file row by row while notes are imported,
+    # instead of loading it in memory
+    streaming = False
+    # number of lines used to guess the format of the file
+    sniffLines = 10
 
     def __init__(self, col, file):
         NoteImporter.__init__(self, col, file)
@@ -24,36 +30,60 @@ class TextImporter(NoteImporter):
 
     def foreignNotes(self):
         self.open()
+        if self.streaming:
+            return self._foreignNotesStreaming()
         # process all lines
-        log = []
-        notes = []
-        lineNum = 0
-        ignored = 0
+        self.log = []
+        self.ignored = 0
+        notes = list(self._notesFromLines(self.data))
+        self.fileobj.close()
+        return notes
+
+    def _foreignNotesStreaming(self):
+        """The notes of the file, read while they are generated. Rows are
+        logged while the notes are imported."""
+        self.log = []
+        self.ignored = 0
+        with open(self.file, "r", encoding='utf-8-sig') as file:
+            lines = self._dataLines(file)
+            first = next(lines, None)
+            if first is not None and not first.startswith("tags:"):
+                lines = itertools.chain([first], lines)
+            yield from self._notesFromLines(lines)
+
+    def _notesFromLines(self, lines):
+        """The notes of the csv lines. Rows whose number of fields is not
+        numFields are logged and counted in ignored."""
         if self.delimiter:
-            reader = csv.reader(self.data, delimiter=self.delimiter, doublequote=True)
+            reader = csv.reader(lines, delimiter=self.delimiter, doublequote=True)
         else:
-            reader = csv.reader(self.data, self.dialect, doublequote=True)
+            reader = csv.reader(lines, self.dialect, doublequote=True)
         try:
             for row in reader:
                 if len(row) != self.numFields:
                     if row:
-                        log.append(_(
+                        self.log.append(_(
                             "'%(row)s' had %(num1)d fields, "
                             "expected %(num2)d") % {
                             "row": " ".join(row),
                             "num1": len(row),
                             "num2": self.numFields,
                             })
-                        ignored += 1
+                        self.ignored += 1
                     continue
-                note = self.noteFromFields(row)
-                notes.append(note)
+                yield self.noteFromFields(row)
         except (csv.Error) as e:
-            log.append(_("Aborted: %s") % str(e))
-        self.log = log
-        self.ignored = ignored
-        self.fileobj.close()
-        return notes
+            self.log.append(_("Aborted: %s") % str(e))
+
+    def _dataLines(self, file):
+        """The lines of the file not starting with #, each ending with a
+        newline."""
+        for line in file:
+            if line.startswith("#"):
+                continue
+            if not line.endswith("\n"):
+                line += "\n"
+            yield line
 
     def open(self):
         "Same as cacheFile"
@@ -69,7 +99,8 @@ class TextImporter(NoteImporter):
 
     def openFile(self):
         """Put:
-        in data: all lines not starting with #, and not tags
+        in data: all lines not starting with #, and not tags (only the first
+        sniffLines ones if streaming)
         in tags: the tags, separated by space, assuming first line which is not a comment start with "tags:".
         Set CSV reader, or delimiter if csv can't be guessed.
         set numFields to the number of fields of the first non empty line
@@ -77,11 +108,18 @@ class TextImporter(NoteImporter):
         """
         self.dialect = None
         self.fileobj = open(self.file, "r", encoding='utf-8-sig')
-        self.data = self.fileobj.read()
-        def sub(s):
-            return re.sub(r"^\#.*$", "__comment", s)
-        #set of lines not starting with #
-        self.data = [sub(x)+"\n" for x in self.data.split("\n") if sub(x) != "__comment"]
+        if self.streaming:
+            # only keep what is needed to guess the format; the file is
+            # read again by foreignNotes
+            self.data = list(itertools.islice(self._dataLines(self.fileobj),
+                                              self.sniffLines + 1))
+            self.fileobj.close()
+        else:
+            self.data = self.fileobj.read()
+            def sub(s):
+                return re.sub(r"^\#.*$", "__comment", s)
+            #set of lines not starting with #
+            self.data = [sub(x)+"\n" for x in self.data.split("\n") if sub(x) != "__comment"]
         if self.data:
             if self.data[0].startswith("tags:"):
                 tags = str(self.data[0][5:]).strip()
@@ -103,7 +141,7 @@ class TextImporter(NoteImporter):
         sniffer = csv.Sniffer()
         if not self.delimiter:
             try:
-                self.dialect = sniffer.sniff("\n".join(self.data[:10]),
+                self.dialect = sniffer.sniff("\n".join(self.data[:self.sniffLines]),
                                              self.patterns)
             except:
                 try:
@@ -2,14 +2,16 @@
 # Copyright: Ankitects Pty Ltd and contributors
 # License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
 
-import html
+import itertools
+import re
 import unicodedata
 
 from anki.consts import NEW_CARDS_RANDOM, STARTING_FACTOR
+from anki.hooks import runHook
 from anki.importing.base import Importer
 from anki.lang import _, ngettext
-from anki.utils import (fieldChecksum, guid64, intTime, joinFields,
-                        splitFields, timestampID)
+from anki.utils import (fieldChecksum, guid64, ids2str, intTime,
+                        joinFields, splitFields, timestampID)
 
 # Stores a list of fields, tags and deck
 ######################################################################
@@ -47,6 +49,10 @@ updateMode = 0
 ignoreMode = 1
 addMode = 2
 
+# what to replace in fields when HTML is not allowed
+_escapes = {"&": "&amp;", "<": "&lt;", ">": "&gt;", "\n": "<br>"}
+_escapeRe = re.compile("[&<>\n]")
+
 class NoteImporter(Importer):
     """TODO
 
@@ -62,6 +68,8 @@ class NoteImporter(Importer):
     needDelimiter = False
     allowHTML = False
     importMode = updateMode
+    # number of notes normalized, checked for duplicates and written at once
+    batchSize = 1000
 
     def __init__(self, col, file):
         Importer.__init__(self, col, file)
@@ -117,65 +125,56 @@ class NoteImporter(Importer):
         for fact in self.mapping:
             if fact == "_tags":
                 self._tagsMapped = True
-        # gather checks for duplicate comparison
-        csums = {}
-        for csum, id in self.col.db.execute(
-            "select csum, id from notes where mid = ?", self.model.getId()):
-            if csum in csums:
-                csums[csum].append(id)
-            else:
-                csums[csum] = [id]
         firsts = {}#mapping sending first field of added note to true
         fld0name = self.model['flds'][0].getName()
         fld0idx = self.mapping.index(fld0name) if fld0name in self.mapping else None
         self._fmap = self.model.fieldMap()
         self._nextID = timestampID(self.col.db, "notes")
         # loop through the notes
-        updates = []
         updateLog = []
         updateLogTxt = _("First field matched: %s")
         dupeLogTxt = _("Added duplicate with first field: %s")
-        new = []
+        newCount = 0
+        updateCount = 0
         self._ids = []
         self._cards = []
         self._emptyNotes = False
         dupeCount = 0
         dupes = []#List of first field seen, present in the db, and added anyway
-        for note in notes:
-            for fieldIndex in range(len(note.fields)):
-                if not self.allowHTML:
-                    note.fields[fieldIndex] = html.escape(note.fields[fieldIndex], quote=False)
-                note.fields[fieldIndex] = note.fields[fieldIndex].strip()
-                if not self.allowHTML:
-                    note.fields[fieldIndex] = note.fields[fieldIndex].replace("\note", "<br>")
-                note.fields[fieldIndex] = unicodedata.normalize("NFC", note.fields[fieldIndex])
-            note.tags = [unicodedata.normalize("NFC", tag) for tag in note.tags]
-            ###########start test fld0
-            fld0 = note.fields[fld0idx]
-            csum = fieldChecksum(fld0)
-            # first field must exist
-            if not fld0:
-                self.log.append(_("Empty first field: %s") %
-                                " ".join(note.fields))
-                continue
-            # earlier in import?
-            if fld0 in firsts and self.importMode != addMode and not self.col.conf.get("allowDuplicateFirstField", False):
-                # duplicates in source file; log and ignore
-                self.log.append(_("Appeared twice in file: %s") %
-                                fld0)
-                continue
-            firsts[fld0] = True
-            # already exists?
-            if self.col.conf.get("allowEmptyFirstField", False) and fld0idx is None:
-                continue
-            found = False#Whether a note with a similar first field was found
-            if csum in csums and not self.col.conf.get("allowDuplicateFirstField", False):
-                # if duplicate allowed, don't test?
+        allowDuplicate = self.col.conf.get("allowDuplicateFirstField", False)
+        processed = 0
+        for batch in self._batches(notes):
+            for note in batch:
+                self._normalizeNote(note)
+            if allowDuplicate or fld0idx is None:
+                csums = {}
+            else:
+                csums = self._candidates(
+                    fieldChecksum(note.fields[fld0idx]) for note in batch)
+            new = []
+            updates = []
+            for note in batch:
+                ###########start test fld0
+                fld0 = note.fields[fld0idx]
+                csum = fieldChecksum(fld0)
+                # first field must exist
+                if not fld0:
+                    self.log.append(_("Empty first field: %s") %
+                                    " ".join(note.fields))
+                    continue
+                # earlier in import?
+                if fld0 in firsts and self.importMode != addMode and not allowDuplicate:
+                    # duplicates in source file; log and ignore
+                    self.log.append(_("Appeared twice in file: %s") %
+                                    fld0)
+                    continue
+                firsts[fld0] = True
+                # already exists?
+                if self.col.conf.get("allowEmptyFirstField", False) and fld0idx is None:
+                    continue
+                found = False#Whether a note with a similar first field was found
                 # csum is not a guarantee; have to check
-                for id in csums[csum]:
-                    flds = self.col.db.scalar(
-                        "select flds from notes where id = ?", id)
-                    sflds = splitFields(flds)
+                for id, sflds in csums.get(csum, []):
                     if fld0 == sflds[0]:
                         # duplicate
                         found = True
@@ -196,15 +195,21 @@ class NoteImporter(Importer):
                                 updateLog.append(dupeLogTxt % fld0)
                                 dupes.append(fld0)
                             found = False
-            # newly add
-            if not found:
-                data = self.newData(note)
-                if data:
-                    new.append(data)
-                    # note that we've seen this note once already
-                    firsts[fld0] = True
-        self.addNew(new)
-        self.addUpdates(updates)
+                # newly add
+                if not found:
+                    data = self.newData(note)
+                    if data:
+                        new.append(data)
+                        # note that we've seen this note once already
+                        firsts[fld0] = True
+            # write the batch, so that its notes can be released
+            self.addNew(new)
+            self.addUpdates(updates)
+            newCount += len(new)
+            updateCount += self.updateCount
+            processed += len(batch)
+            runHook("importedNotes", processed)
+        self.updateCount = updateCount
         # make sure to update sflds, etc
         self.col.updateFieldCache(self._ids)
         # generate cards
@@ -221,7 +226,7 @@ class NoteImporter(Importer):
         if conf['new']['order'] == NEW_CARDS_RANDOM:
             deck.randomizeCards()
 
-        part1 = ngettext("%d note added", "%d notes added", len(new)) % len(new)
+        part1 = ngettext("%d note added", "%d notes added", newCount) % newCount
         part2 = ngettext("%d note updated", "%d notes updated",
                          self.updateCount) % self.updateCount
         if self.importMode == updateMode:
@@ -241,6 +246,44 @@ This can happen when you have empty fields or when you have not mapped the \
 content in the text file to the correct fields."""))
         self.total = len(self._ids)
 
+    def _batches(self, notes):
+        """The notes, by lists of at most batchSize notes. notes may be
+        any iterable, so that importers can generate them while they
+        are imported."""
+        notes = iter(notes)
+        while True:
+            batch = list(itertools.islice(notes, self.batchSize))
+            if not batch:
+                return
+            yield batch
+
+    def _normalizeNote(self, note):
+        """Escape (unless HTML is allowed), strip and NFC-normalize the
+        fields and tags of the note, in place."""
+        note.fields = [self._normalizeField(field) for field in note.fields]
+        note.tags = [unicodedata.normalize("NFC", tag) for tag in note.tags]
+
+    def _normalizeField(self, field):
+        """The field escaped (unless HTML is allowed), stripped, with
+        newlines replaced by <br> and NFC-normalized. The escaping is
+        done in a single pass; normalizing a field already in NFC
+        form, such as an ascii one, is only a quick check."""
+        field = field.strip()
+        if not self.allowHTML:
+            field = _escapeRe.sub(lambda match: _escapes[match.group(0)], field)
+        return unicodedata.normalize("NFC", field)
+
+    def _candidates(self, csums):
+        """Dict sending each checksum of csums to the list of (id, fields)
+        of the notes of the model with this first field checksum, as
+        found in a single query."""
+        candidates = {}
+        for id, csum, flds in self.col.db.execute(
+            "select id, csum, flds from notes where mid = ? and csum in %s" %
+            ids2str(set(csums)), self.model.getId()):
+            candidates.setdefault(csum, []).append((id, splitFields(flds)))
+        return candidates
+
     def newData(self, note):
         id = self._nextID
         self._nextID += 1
@@ -260,6 +303,7 @@ content in the text file to the correct fields."""))
         self.col.db.executemany(
             "insert or replace into notes values (?,?,?,?,?,?,?,?,?,?,?)",
             rows)
+        self.col.tags.updateIndex([row[0] for row in rows])
 
     def updateData(self, note, id, sflds):
         self._ids.append(id)
@@ -275,16 +319,17 @@ content in the text file to the correct fields."""))
                     id, note.fieldsStr]
 
     def addUpdates(self, rows):
-        old = self.col.db.totalChanges()
+        # the notes updated, not the rows of note_tags, nor those the undo
+        # journal's triggers log
         if self._tagsMapped:
-            self.col.db.executemany("""
+            self.updateCount = self.col.db.executemany("""
 update notes set mod = ?, usn = ?, flds = ?, tags = ?
-where id = ? and (flds != ? or tags != ?)""", rows)
+where id = ? and (flds != ? or tags != ?)""", rows).rowcount
+            self.col.tags.updateIndex([row[4] for row in rows])
         else:
-            self.col.db.executemany("""
+            self.updateCount = self.col.db.executemany("""
 update notes set mod = ?, usn = ?, flds = ?
-where id = ? and flds != ?""", rows)
-        self.updateCount = self.col.db.totalChanges() - old
+where id = ? and flds != ?""", rows).rowcount
 
     def processFields(self, note, fields=None):
         if not fields:
@@ -8,7 +8,7 @@ import sys
 import time
 import unicodedata
 from string import capwords
-from xml.dom import minidom
+from xml.etree import ElementTree
 
 from anki.importing.noteimp import ForeignCard, ForeignNote, NoteImporter
 from anki.lang import _, ngettext
@@ -93,9 +93,6 @@ class SupermemoXmlImporter(NoteImporter):
         self.numFields=int(2)
 
         # SmXmlParse VARIABLES
-        self.xmldoc = None
-        self.pieces = []
-        self.cntBuf = [] #to store last parsed data
         self.cntElm = [] #to store SM Elements data
         self.cntCol = [] #to store SM Colections data
 
@@ -168,20 +165,21 @@ class SupermemoXmlImporter(NoteImporter):
     ## DEFAULT IMPORTER METHODS
 
     def foreignNotes(self):
+        """Generate the notes while the file is parsed"""
 
-        # Load file and parse it by minidom
+        # Load file, it is parsed by iterparse
         self.loadSource(self.file)
 
         # Migrating content / time consuming part
         # addItemToCards is called for each sm element
         self.logger('Parsing started.')
-        self.parse()
+        self.total = 0
+        for note in self.parse():
+            self.total += 1
+            yield note
         self.logger('Parsing done.')
 
-        # Return imported cards
-        self.total = len(self.notes)
         self.log.append(ngettext("%d card imported.", "%d cards imported.", self.total) % self.total)
-        return self.notes
 
     def fields(self):
         return 2
@@ -284,74 +282,63 @@ class SupermemoXmlImporter(NoteImporter):
         return io.StringIO(str(source))
 
     def loadSource(self, source):
-        """Load source file and parse with xml.dom.minidom"""
+        """Set the source file, parsed with iterparse by parse"""
         self.source = source
-        self.logger('Load started...')
-        sock = open(self.source)
-        self.xmldoc = minidom.parse(sock).documentElement
-        sock.close()
         self.logger('Load done.')
 
 
     # PARSE
-    def parse(self, node=None):
-        "Parse method - parses document elements"
-
-        if node is None and self.xmldoc is not None:
-            node = self.xmldoc
-
-        _method = "parse_%s" % node.__class__.__name__
-        if hasattr(self,_method):
-            parseMethod = getattr(self, _method)
-            parseMethod(node)
-        else:
-            self.logger('No handler for method %s' % _method, level=3)
-
-    def parse_Document(self, node):
-        "Parse XML document"
-
-        self.parse(node.documentElement)
-
-    def parse_Element(self, node):
-        "Parse XML element"
-
-        _method = "do_%s" % node.tagName
-        if hasattr(self,_method):
-            handlerMethod = getattr(self, _method)
-            handlerMethod(node)
-        else:
-            self.logger('No handler for method %s' % _method, level=3)
-            #print traceback.print_exc()
-
-    def parse_Text(self, node):
-        "Parse text inside elements. Text is stored into local buffer."
-
-        text = node.data
-        self.cntBuf.append(text)
-
-    #def parse_Comment(self, node):
-    #    """
-    #    Source can contain XML comments, but we ignore them
-    #    """
-    #    pass
+    def parse(self):
+        """Parse the document while it is read, and generate the notes
+        as the elements defining them end.
+
+        As with a recursive descent of the document, only the children
+        of the collection and of its elements are sent to their
+        start_/do_ handlers. Handled elements are then removed from the
+        tree, so that memory does not depend on the size of the file."""
+
+        handledParents = (None, "SuperMemoCollection", "SuperMemoElement")
+        stack = []
+        for event, node in ElementTree.iterparse(self.source, events=("start", "end")):
+            if event == "start":
+                parent = stack[-1] if stack else None
+                stack.append(node)
+                if getattr(parent, "tag", None) in handledParents:
+                    startMethod = getattr(self, "start_%s" % node.tag, None)
+                    if startMethod:
+                        startMethod(node)
+                continue
+            stack.pop()
+            parent = stack[-1] if stack else None
+            if getattr(parent, "tag", None) not in handledParents:
+                continue
+            _method = "do_%s" % node.tag
+            if hasattr(self,_method):
+                handlerMethod = getattr(self, _method)
+                handlerMethod(node)
+            else:
+                self.logger('No handler for method %s' % _method, level=3)
+            if parent is not None:
+                parent.remove(node)
+            if self.notes:
+                yield from self.notes
+                self.notes = []
 
 
     # DO
     def do_SuperMemoCollection(self, node):
-        "Process SM Collection"
+        "Process SM Collection. Its children are processed while parsed."
 
-        for child in node.childNodes: self.parse(child)
-
-    def do_SuperMemoElement(self, node):
-        "Process SM Element (Type - Title,Topics)"
+    def start_SuperMemoElement(self, node):
+        "Start an SM Element (Type - Title,Topics)"
 
         self.logger('='*45, level=3)
 
         self.cntElm.append(SuperMemoElement())
         self.cntElm[-1]['lTitle'] = self.cntMeta['title']
 
-        #parse all child elements
-        for child in node.childNodes: self.parse(child)
+    def do_SuperMemoElement(self, node):
+        "Process SM Element (Type - Title,Topics), once its children are processed"
 
         #strip all saved strings, just for sure
         for key in list(self.cntElm[-1].keys()):
@@ -395,32 +382,30 @@ class SupermemoXmlImporter(NoteImporter):
     def do_Content(self, node):
         "Process SM element Content"
 
-        for child in node.childNodes:
-            if hasattr(child,'tagName') and child.firstChild is not None:
-                self.cntElm[-1][child.tagName]=child.firstChild.data
+        for child in node:
+            if child.text is not None:
+                self.cntElm[-1][child.tag]=child.text
 
     def do_LearningData(self, node):
         "Process SM element LearningData"
 
-        for child in node.childNodes:
-            if hasattr(child,'tagName') and child.firstChild is not None:
-                self.cntElm[-1][child.tagName]=child.firstChild.data
+        for child in node:
+            if child.text is not None:
+                self.cntElm[-1][child.tag]=child.text
 
     # It's being processed in do_Content now
     #def do_Question(self, node):
-    #    for child in node.childNodes: self.parse(child)
-    #    self.cntElm[-1][node.tagName]=self.cntBuf.pop()
+    #    self.cntElm[-1][node.tag]=node.text
 
     # It's being processed in do_Content now
     #def do_Answer(self, node):
-    #    for child in node.childNodes: self.parse(child)
-    #    self.cntElm[-1][node.tagName]=self.cntBuf.pop()
+    #    self.cntElm[-1][node.tag]=node.text
 
     def do_Title(self, node):
         "Process SM element Title"
 
-        title = self._decode_htmlescapes(node.firstChild.data)
-        self.cntElm[-1][node.tagName] = title
+        title = self._decode_htmlescapes(node.text)
+        self.cntElm[-1][node.tag] = title
         self.cntMeta['title'].append(title)
         self.cntElm[-1]['lTitle'] = self.cntMeta['title']
         self.logger('Start of topic \t- ' + " / ".join(self.cntMeta['title']), level=2)
@@ -429,8 +414,8 @@ class SupermemoXmlImporter(NoteImporter):
     def do_Type(self, node):
         "Process SM element Type"
 
-        if len(self.cntBuf) >=1 :
-            self.cntElm[-1][node.tagName]=self.cntBuf.pop()
+        if node.text is not None:
+            self.cntElm[-1][node.tag]=node.text
 
 
 #if __name__ == '__main__':
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# Copyright: Ankitects Pty Ltd and contributors
+# License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
+
+"""
+Find the statements which read a whole table for lack of an index.
+
+When started, every statement run through anki.db.DB is counted and
+timed, and the first time a statement is seen, its plan is asked to
+sqlite with EXPLAIN QUERY PLAN. The report lists the statements whose
+plan scans a table, those taking the most time first.
+
+When the environment variable ANKI_INDEX_ADVISOR contains a path,
+runanki starts indexAdvisor, and the report is written at this path each
+time a collection is closed.
+"""
+
+import os
+import re
+
+# a scan of a table, as opposed to a search in an index or a scan of a
+# covering index
+_fullScan = re.compile(r"SCAN (?:TABLE )?(\w+)(?: AS \w+)?$")
+
+
+class IndexAdvisor:
+
+    """
+    statements -- associate to each statement seen its [number of runs,
+    seconds, tables scanned]
+    path -- where to write the report, or None.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.statements = {}
+
+    # Starting and stopping
+    ######################################################################
+
+    def startFromEnv(self):
+        "Start if ANKI_INDEX_ADVISOR is set."
+        path = os.environ.get("ANKI_INDEX_ADVISOR")
+        if path:
+            self.start(path)
+
+    def start(self, path=None):
+        self.enabled = True
+        self.path = path
+
+    def stop(self):
+        "Stop recording. Return the report."
+        self.enabled = False
+        return self.report()
+
+    def writeReport(self):
+        "Write the report, if it was asked."
+        if self.enabled and self.path:
+            with open(self.path, "w", encoding="utf8") as file:
+                file.write(self.report())
+
+    # Recording
+    ######################################################################
+
+    def record(self, connection, sql, args, seconds):
+        """Count the statement sql, run with args on the sqlite connection
+        in seconds."""
+        entry = self.statements.get(sql)
+        if entry is None:
+            entry = [0, 0, self._scannedTables(connection, sql, args)]
+            self.statements[sql] = entry
+        entry[0] += 1
+        entry[1] += seconds
+
+    def _scannedTables(self, connection, sql, args):
+        "The tables the plan of sql reads entirely."
+        if not re.match(r"\s*(select|update|delete|insert|with)\b", sql, re.I):
+            return []
+        try:
+            plan = connection.execute("explain query plan " + sql, args).fetchall()
+        except Exception:
+            return []
+        tables = []
+        for row in plan:
+            match = _fullScan.match(row[-1])
+            if match:
+                tables.append(match.group(1))
+        return tables
+
+    # Report
+    ######################################################################
+
+    def scans(self):
+        """(seconds, runs, tables, sql) for each statement scanning a
+        table, the slowest first."""
+        return sorted(((seconds, runs, tables, sql)
+                       for sql, (runs, seconds, tables) in self.statements.items()
+                       if tables),
+                      key=lambda scan: -scan[0])
+
+    def report(self, limit=50):
+        """The limit statements scanning a table which took the most time."""
+        scans = self.scans()
+        lines = ["Statements: %d, scanning a table: %d" % (
+            len(self.statements), len(scans)), "",
+                 "   total    runs tables: statement"]
+        for seconds, runs, tables, sql in scans[:limit]:
+            lines.append("%7.3fs %7d %s: %s" % (
+                seconds, runs, ", ".join(tables), " ".join(sql.split())[:300]))
+        return "\n".join(lines) + "\n"
+
+
+indexAdvisor = IndexAdvisor()
+
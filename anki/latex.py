@@ -6,10 +6,13 @@ import html
 import os
 import re
 import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from anki.hooks import addHook
 from anki.lang import _
-from anki.utils import call, checksum, isMac, namedtmp, stripHTML, tmpdir
+from anki.utils import call, checksum, ids2str, isMac, stripHTML, tmpdir
 
 pngCommands = [
     ["latex", "-interaction=nonstopmode", "tmp.tex"],
@@ -52,7 +55,8 @@ def mungeQAandErr(html, type, fields, model, data, col):
     * Html, where LaTeX parts are replaced by some HTML.
     * Whether there is an error
 
-    see _imgLink docstring regarding the rules for LaTeX media.
+    see _imgLink docstring regarding the rules for LaTeX media. The
+    missing images of html are compiled concurrently.
 
     keyword arguments:
     html -- the text in which to find the LaTeX to be replaced.
@@ -65,15 +69,21 @@ def mungeQAandErr(html, type, fields, model, data, col):
     data -- not used. [cid, nid, mid, did, ord, tags, flds]
     col -- the current collection. It deals with media folder
     """
+    expressions = list(_expressions(html))
+    links = col.latex.imgLinks([latex for text, latex in expressions], model)
     error = False
-    for prefix, key, suffix in {("", "standard",""), ("$", "expression", "$"), ("\\begin{displaymath}", "math", "\\end{displaymath}")}:
-        for match in regexps[key].finditer(html):
-            textToCompile = prefix+match.group(1)+suffix
-            link, er = _imgLink(col, textToCompile, model)
-            html = html.replace(match.group(), link)
-            error = error or er
+    for (text, latex), (link, er) in zip(expressions, links):
+        html = html.replace(text, link)
+        error = error or er
     return (html, error)
 
+def _expressions(html):
+    """(text, textToCompile) for each LaTeX part of html: the text of the
+    part, and the LaTeX code to compile."""
+    for prefix, key, suffix in (("", "standard",""), ("$", "expression", "$"), ("\\begin{displaymath}", "math", "\\end{displaymath}")):
+        for match in regexps[key].finditer(html):
+            yield match.group(), prefix+match.group(1)+suffix
+
 def _imgLink(col, latex, model):
     """A pair:
     * Some HTML to display instead of the LaTeX code.
@@ -86,12 +96,8 @@ def _imgLink(col, latex, model):
 
     In case of compilation error, an error message explaining the
     error (or asking whether program latex and dvipng/dvisvgm are
-    installed) is returned.
-
-    During the compilation the compiled file is in tmp.tex and its
-    output (err and std) in latex_log.tex, replacing previous files of
-    the same name. Both of those file are in the tmpdir as in
-    utils.py.
+    installed) is returned. It is remembered by col.latex, so that the
+    same code is not compiled again.
 
     Keyword arguments:
     col -- the current collection. It is used for the media folder (and
@@ -100,31 +106,7 @@ def _imgLink(col, latex, model):
     model -- the model in which is compiled the note. It deals with
     the header/footer, and the image file format.
     """
-    txt = _latexFromHtml(col, latex)
-
-    if txt in col.buggedLatex:
-        return col.buggedLatex[txt], True
-    if model.get("latexsvg", False):
-        ext = "svg"
-    else:
-        ext = "png"
-
-    # is there an existing file?
-    fname = "latex-%s.%s" % (checksum(txt.encode("utf8")), ext)
-    link = '<img class=latex src="%s">' % fname
-    if os.path.exists(fname):
-        return (link, False)
-
-    # building disabled?
-    if not build:
-        return ("[latex]%s[/latex]" % latex, False)
-
-    err, compilationWasTried = _buildImg(col, txt, fname, model)
-    if err:
-        col.buggedLatex[txt] = err
-        return err, True
-    else:
-        return (link, False)
+    return col.latex.imgLinks([latex], model)[0]
 
 def _latexFromHtml(col, latex):
     """Convert entities and fix newlines.
@@ -135,39 +117,9 @@ def _latexFromHtml(col, latex):
     latex = stripHTML(latex)
     return latex
 
-def _buildImg(col, latex, fname, model):
-    """An error message if something did not work correctly.
-
-    Generate an image file from latex code
-
-    latex's header and foot is added as in the model. The image is
-    named fname and added to the media folder of this collection.
-
-    The compiled file is in tmp.tex and its output (err and std) in
-    latex_log.tex, replacing previous files of the same name. Both of
-    those file are in the tmpdir as in utils.py
-
-    Compiles to svg if latexsvg is set to true in the model, otherwise
-    to png. The compilation commands are given above.
-
-    In case of error, return: * an error message to be displayed
-    instead of the LaTeX document. (Note that this image is not
-    displayed in AnkiDroid. It is probably shown only in computer
-    mode)
-    * whether it's a problem with the LaTeX (otherwise, it's a
-    compilation problem, and it may be worth trying again)
-
-    Keyword arguments:
-    col -- the current collection. It deals with media folder
-    latex -- the code LaTeX to compile, as given in fields
-    fname -- the name given to the generated png
-    model -- the model in which is compiled the note. It deals with
-    the header/footer, and the image file format
-    """
-    # add header/footer
-    latex = (model["latexPre"] + "\n" +
-             latex + "\n" +
-             model["latexPost"])
+def _forbiddenCommand(latex):
+    """The error message to show if the LaTeX document latex uses a
+    command which is not allowed, otherwise None."""
     # it's only really secure if run in a jail, but these are the most common
     tmplatex = latex.replace("\\includegraphics", "")
     for bad in ("\\write18", "\\readline", "\\input", "\\include",
@@ -176,43 +128,44 @@ def _buildImg(col, latex, fname, model):
         # don't mind if the sequence is only part of a command
         bad_re = "\\" + bad + "[^a-zA-Z]"
         if re.search(bad_re, tmplatex):
-            return (_("""\
+            return _("""\
 
 For security reasons, '%s' is not allowed on cards. You can still use \
 it by placing the command in a different package, and importing that \
-package in the LaTeX header instead.""") % bad, True)
-
-    # commands to use?
-    if model.get("latexsvg", False):
-        latexCmds = svgCommands
-        ext = "svg"
-    else:
-        latexCmds = pngCommands
-        ext = "png"
-
-    # write into a temp file
-    log = open(namedtmp("latex_log.txt"), "w")
-    texpath = namedtmp("tmp.tex")
-    texfile = open(texpath, "w", encoding="utf8")
-    texfile.write(latex)
-    texfile.close()
-    mdir = col.media.dir()
-    oldcwd = os.getcwd()
-    png = namedtmp("tmp.%s" % ext)
-    try:
-        # generate an image
-        os.chdir(tmpdir())
+package in the LaTeX header instead.""") % bad
+    return None
+
+def _compile(latex, ext, path):
+    """A pair (error message, whether compilation was tried), the message
+    being empty if the image was generated.
+
+    Compile the LaTeX document latex to an image of type ext, png or
+    svg, saved at path. The compilation commands are given above.
+
+    It runs in a worker thread: the document and the output of the
+    commands are in a new folder of the tmpdir of utils.py, which is
+    deleted if the compilation succeeds.
+
+    In case of error, the message is in html, to be displayed instead
+    of the LaTeX document. (Note that this image is not displayed in
+    AnkiDroid. It is probably shown only in computer mode)
+    """
+    latexCmds = svgCommands if ext == "svg" else pngCommands
+    folder = tempfile.mkdtemp(dir=tmpdir())
+    texpath = os.path.join(folder, "tmp.tex")
+    logpath = os.path.join(folder, "latex_log.txt")
+    with open(texpath, "w", encoding="utf8") as texfile:
+        texfile.write(latex)
+    with open(logpath, "w") as log:
         for latexCmd in latexCmds:
-            if call(latexCmd, stdout=log, stderr=log):
-                return _errMsg(latexCmd[0], texpath)
-        # add the image to the media folder
-        shutil.copyfile(png, os.path.join(mdir, fname))
-        return "", True
-    finally:
-        os.chdir(oldcwd)
-        log.close()
-
-def _errMsg(type, texpath):
+            if call(latexCmd, stdout=log, stderr=log, cwd=folder):
+                return _errMsg(latexCmd[0], texpath, logpath)
+    # add the image to the media folder
+    shutil.copyfile(os.path.join(folder, "tmp.%s" % ext), path)
+    shutil.rmtree(folder, ignore_errors=True)
+    return "", True
+
+def _errMsg(type, texpath, logpath):
     """A pair with:
     * an error message, in html, concerning LaTeX compilation.
     * whether compilation at least started
@@ -223,11 +176,12 @@ def _errMsg(type, texpath):
     Keyword arguments
     type -- the (begin of the) executed command
     texpath -- the path to the (temporary) file which was compiled
+    logpath -- the path to the output of the commands
     """
     msg = (_("Error executing %s.") % type) + "<br>"
     msg += (_("Generated file: %s") % texpath) + "<br>"
     try:
-        with open(namedtmp("latex_log.txt", rm=False)) as file:
+        with open(logpath) as file:
             log = file.read()
         if not log:
             raise Exception()
@@ -238,6 +192,216 @@ def _errMsg(type, texpath):
         compilationWasTried = False
     return msg, compilationWasTried
 
+class LatexBuilder:
+
+    """Generate the images of the LaTeX of a collection, several at once.
+
+    Each missing image is a job of a pool of worker threads, each of
+    them waiting for the latex and dvipng/dvisvgm processes of its job.
+    A job is known by the name of its image, the checksum of its code:
+    an image asked again while it is compiled is not compiled twice.
+
+    The failures are remembered, so that a document is not compiled
+    again until Check Media. The error messages are saved in the table
+    latex_errors of the collection, by checksum of the whole document,
+    header and footer included. Failures before compilation started,
+    e.g. when latex is not installed, are only remembered until the
+    collection is closed.
+
+    _jobs -- associate to the name of each image being compiled the
+    future of its result, as returned by _compile
+    _errors -- associate to the checksum of each document which failed its
+    error message; None until loaded from latex_errors
+    _newErrors -- associate to the checksum of each document which failed
+    since the last flush (error message, whether to save it)
+    """
+
+    maxWorkers = os.cpu_count() or 2
+
+    def __init__(self, col):
+        self.col = col
+        self._executor = None
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._errors = None
+        self._newErrors = {}
+
+    # Images
+    ######################################################################
+
+    def imgLinks(self, latexes, model):
+        """The pair (html, error) to show instead of each LaTeX code of
+        latexes, as explained in _imgLink. The missing images are
+        compiled concurrently."""
+        started = [self._start(latex, model) for latex in latexes]
+        return [self._result(*start) for start in started]
+
+    def _start(self, latex, model):
+        """A triple (html, error, future) for latex: the future of the
+        compilation of its image if it is needed, otherwise None; and
+        the html to show and whether it is an error, once the image
+        exists."""
+        txt = _latexFromHtml(self.col, latex)
+        if model.get("latexsvg", False):
+            ext = "svg"
+        else:
+            ext = "png"
+
+        # is there an existing file?
+        fname = "latex-%s.%s" % (checksum(txt.encode("utf8")), ext)
+        link = '<img class=latex src="%s">' % fname
+        path = os.path.join(self.col.media.dir(), fname)
+        if os.path.exists(path):
+            return (link, False, None)
+
+        # add header/footer
+        document = (model["latexPre"] + "\n" +
+                    txt + "\n" +
+                    model["latexPost"])
+        key = checksum(ext + document)
+        error = self.error(key)
+        if error:
+            return (error, True, None)
+
+        # building disabled?
+        if not build:
+            return ("[latex]%s[/latex]" % latex, False, None)
+
+        error = _forbiddenCommand(document)
+        if error:
+            self._addError(key, error, True)
+            return (error, True, None)
+        with self._lock:
+            future = self._jobs.get(fname)
+            new = future is None
+            if new:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.maxWorkers)
+                future = self._executor.submit(_compile, document, ext, path)
+                self._jobs[fname] = future
+        if new:
+            future.add_done_callback(
+                lambda future: self._jobDone(fname, key, future))
+        return (link, False, future)
+
+    def _result(self, html, error, future):
+        if future is None:
+            return html, error
+        message, compilationWasTried = future.result()
+        if message:
+            return message, True
+        return html, False
+
+    def _jobDone(self, fname, key, future):
+        "Called at the end of the job of fname, usually in a worker thread."
+        if not future.cancelled() and future.exception() is None:
+            error, compilationWasTried = future.result()
+            if error:
+                # before the job is forgotten, so that it's not started again
+                self._addError(key, error, compilationWasTried)
+        with self._lock:
+            self._jobs.pop(fname, None)
+
+    def prerender(self, query=""):
+        """Start compiling the missing images of the notes matching query,
+        or of every note. Return the futures of the jobs started, whose
+        results are as those of _compile."""
+        nids = self.col.findNotes(query) if query else None
+        sql = "select mid, flds from notes"
+        if nids is not None:
+            sql += " where id in " + ids2str(nids)
+        futures = {}
+        for mid, flds in self.col.db.execute(sql):
+            model = self.col.models.get(mid)
+            if not model:
+                continue
+            for string in self._renderedStrings(model, flds):
+                for text, latex in _expressions(string):
+                    html, error, future = self._start(latex, model)
+                    if future is not None:
+                        futures[html] = future
+        return list(futures.values())
+
+    def _renderedStrings(self, model, flds):
+        "The strings of flds whose LaTeX may be shown, as filesInStr."
+        if model.isCloze() and "{{c" in flds:
+            return self.col.media._expandClozes(flds)
+        return [flds]
+
+    def shutdown(self):
+        "Stop the jobs not started, and wait for the others."
+        if self._executor is None:
+            return
+        with self._lock:
+            futures = list(self._jobs.values())
+        for future in futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+    # Failures
+    ######################################################################
+
+    def error(self, key):
+        "The error message of the document whose checksum is key, or None."
+        with self._lock:
+            if key in self._newErrors:
+                return self._newErrors[key][0]
+        return self._loadErrors().get(key)
+
+    def _loadErrors(self):
+        if self._errors is None:
+            self._errors = {}
+            if self._hasTable():
+                self._errors = dict(self.col.db.all(
+                    "select key, error from latex_errors"))
+        return self._errors
+
+    def _addError(self, key, error, save):
+        with self._lock:
+            self._newErrors[key] = (error, save)
+
+    def _hasTable(self):
+        return bool(self.col.db.scalar(
+            "select 1 from sqlite_master where type = 'table' and name = 'latex_errors'"))
+
+    def flush(self):
+        """Save the failures since the last flush. Not a change of the
+        collection: its mod is kept, and the rows are committed by the
+        next commit, at the latest when the collection is closed."""
+        with self._lock:
+            newErrors = self._newErrors
+            self._newErrors = {}
+        self._loadErrors().update(
+            (key, error) for key, (error, save) in newErrors.items())
+        toSave = [(key, error) for key, (error, save) in newErrors.items() if save]
+        if not toSave:
+            return
+        mod = self.col.db.mod
+        self.col.db.execute("""
+create table if not exists latex_errors (
+    key             text primary key,
+    error           text not null
+)""")
+        self.col.db.executemany(
+            "insert or replace into latex_errors values (?, ?)", toSave)
+        self.col.db.mod = mod
+
+    def rollback(self):
+        """Forget the failures loaded or flushed, after a rollback of the
+        collection, which may have undone their rows."""
+        self._errors = None
+
+    def clearErrors(self):
+        "Forget the failures, so that their documents are compiled again."
+        with self._lock:
+            self._newErrors = {}
+        self._errors = {}
+        if self._hasTable():
+            mod = self.col.db.mod
+            self.col.db.execute("delete from latex_errors")
+            self.col.db.mod = mod
+
 # setup q/a filter
 addHook("mungeQA", mungeQA)
 #This hook is called collection._renderQA. See mungeQA comment to know
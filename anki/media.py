@@ -87,6 +87,7 @@ class MediaManager:
         create = not os.path.exists(path)
         os.chdir(self._dir)
         self.db = DB(path)
+        self.db.applyProfile(self.col.db.profile)
         if create:
             self._initDB()
         self.maybeUpgrade()
@@ -342,8 +343,11 @@ create table meta (dirMod int, lastUsn int); insert into meta values (0, 0);
     ##########################################################################
 
     def check(self, local=None):
-        "Return (missingFiles, unusedFiles, warnings)."
+        """Return (missingFiles, unusedFiles, warnings).
+
+        The LaTeX which failed to compile is compiled again."""
         mdir = self.dir()
+        self.col.latex.clearErrors()
         # gather all media references in NFC form
         allRefs = set()
         refsToNid = dict() # this dic is new
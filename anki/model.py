@@ -40,6 +40,9 @@ defaultModel = {
 }
 
 class Model(DictAugmentedIdUsn):
+    # where the model is stored, see anki/registry.py
+    table = "models"
+
     def flush(self):
         for tmpl in self['tmpls']:
             tmpl.flush()
@@ -93,7 +96,7 @@ class Model(DictAugmentedIdUsn):
         self.ensureNameUnique()
         self.manager.models[str(self.getId())] = self
         # mark registry changed, but don't bump mod time
-        self.manager.save()
+        self.manager.markChanged(self)
 
     def setCurrent(self):
         """Change curModel value and marks the collection as modified."""
@@ -110,7 +113,7 @@ select id from cards where nid in (select id from notes where mid = ?)""",
                                       self.getId()))
         # then the model
         del self.manager.models[str(self.getId())]
-        self.manager.save()
+        self.manager.markChanged(self)
         # GUI should ensure last model is not deleted
         if current:
             list(self.manager.models.values())[0].setCurrent()
@@ -285,25 +288,78 @@ select id from cards where nid in (select id from notes where mid = ?)""",
     # - maps are ord->ord, and there should not be duplicate targets
     # - newModel should be self if model is not changing
 
-    def change(self, oldModel, nids, fmap, cmap):
+    # notes converted at once by change
+    changeBatchSize = 1000
+
+    def change(self, oldModel, nids, fmap, cmap, progress=None):
         """Change the model of the nodes in nids to self
         currently, fmap and cmap are null only for tests.
+
+        The notes are converted by batches of changeBatchSize, in a
+        single transaction. Return True, or False if the conversion was
+        cancelled, in which case no note is changed.
+
         keyword arguments
         oldModel -- the previous oldModel of the notes
         nids -- a list of id of notes whose oldModel is oldModel
         self -- the model to which the cards must be converted
         fmap -- the dictionnary sending to each fields'ord of the old model a field'ord of the new model
         cmap -- the dictionnary sending to each card type's ord of the old model a card type's ord of the new model
+        progress -- if set, called as progress(done, total) after each
+        batch, with the number of notes converted; returning True
+        cancels the conversion.
         """
         # changeNote does not uses oldModel, so self has been chosen to be the new model.
-        self.manager.col.modSchema(check=True)
+        col = self.manager.col
+        col.modSchema(check=True)
         assert self.getId() == oldModel.getId() or (fmap and cmap)
-        assert not self.manager.col.db.list("select id from notes where mid <> ? and id in "+ids2str(nids), oldModel.getId())
-        if fmap:
-            self._changeNotes(nids, fmap)
-        if cmap:
-            self._changeCards(nids, oldModel, cmap)
-        self.manager.col.genCards(nids)
+        genOrds = self._ordsToGenerate(oldModel, fmap, cmap)
+        col.db.begin()
+        col.db.execute("savepoint changeModel")
+        try:
+            for start in range(0, len(nids), self.changeBatchSize):
+                batch = nids[start:start + self.changeBatchSize]
+                assert not col.db.list("select id from notes where mid <> ? and id in "+ids2str(batch), oldModel.getId())
+                if fmap:
+                    self._changeNotes(batch, fmap)
+                if cmap:
+                    self._changeCards(batch, oldModel, cmap)
+                if genOrds is None or genOrds:
+                    col.genCards(batch, genOrds)
+                if progress and progress(start + len(batch), len(nids)):
+                    col.db.execute("rollback to changeModel")
+                    return False
+        except:
+            col.db.execute("rollback to changeModel")
+            raise
+        finally:
+            col.db.execute("release changeModel")
+        return True
+
+    def _ordsToGenerate(self, oldModel, fmap, cmap):
+        """The ords of the templates of self whose cards may be missing
+        after change, or None if they all may be.
+
+        A template which receives the cards of a template of oldModel,
+        with the same requirement once its fields are mapped by fmap,
+        has a card for exactly the notes which had one."""
+        if self.isCloze() or oldModel.isCloze():
+            return None
+        if fmap is None:
+            fmap = {ord: ord for ord in range(len(oldModel['flds']))}
+        if cmap is None:
+            cmap = {ord: ord for ord in range(len(oldModel['tmpls']))}
+        sources = {new: old for old, new in cmap.items() if new is not None}
+        ords = set()
+        for template in self['tmpls']:
+            ord, type, req = template.getReq()
+            old = sources.get(ord)
+            if old is not None:
+                oldOrd, oldType, oldReq = oldModel['tmpls'][old].getReq()
+                if oldType == type and {fmap.get(idx) for idx in oldReq} == set(req):
+                    continue
+            ords.add(ord)
+        return ords
 
     def _changeNotes(self, nids, map):
         """Change the note whose ids are nid to the model self, reorder
@@ -314,23 +370,20 @@ select id from cards where nid in (select id from notes where mid = ?)""",
         newmodel -- the model of destination of the note
         map -- the dictionnary sending to each fields'ord of the old model a field'ord of the new model
         """
-        noteData = []
-        #The list of dictionnaries, containing the information relating to the new cards
         nfields = len(self['flds'])
-        for (nid, flds) in self.manager.col.db.execute(
-            "select id, flds from notes where id in "+ids2str(nids)):
-            newflds = {}
+        def remapFields(flds):
             flds = splitFields(flds)
-            for old, new in list(map.items()):
-                newflds[new] = flds[old]
-            flds = [newflds.get(index, "")
-                    for index in range(nfields)]
-            flds = joinFields(flds)
-            noteData.append(dict(nid=nid, flds=flds, mid=self.getId(),
-                      mod=intTime(),usn=self.manager.col.usn()))
-        self.manager.col.db.executemany(
-            "update notes set flds=:flds,mid=:mid,mod=:mod,usn=:usn where id = :nid", noteData)
-        self.manager.col.updateFieldCache(nids)
+            newflds = [""] * nfields
+            for old, new in map.items():
+                if new is not None:
+                    newflds[new] = flds[old]
+            return joinFields(newflds)
+        col = self.manager.col
+        col.db.createFunction("remapFields", 1, remapFields)
+        col.db.execute(
+            "update notes set flds=remapFields(flds),mid=?,mod=?,usn=? where id in "+ids2str(nids),
+            self.getId(), intTime(), col.usn())
+        col.updateFieldCache(nids)
 
     def _changeCards(self, nids, oldModel, map):
         """Change the note whose ids are nid to the model self, reorder
@@ -344,31 +397,35 @@ select id from cards where nid in (select id from notes where mid = ?)""",
         newmodel -- the model of destination of the notes
         map -- the dictionnary sending to each card 'ord of the old model a card'ord of the new model or to None
         """
-        cardData = []
-        deleted = []
-        for (cid, ord) in self.manager.col.db.execute(
-            "select id, ord from cards where nid in "+ids2str(nids)):
-            # if the src model is a cloze, we ignore the map, as the gui
-            # doesn't currently support mapping them
-            if oldModel.isCloze():
-                new = ord
-                if self['type'] != MODEL_CLOZE:
-                    # if we're mapping to a regular note, we need to check if
-                    # the destination ord is valid
-                    if len(self['tmpls']) <= ord:
-                        new = None
-            else:
-                # mapping from a regular note, so the map should be valid
-                new = map[ord]
-            if new is not None:
-                cardData.append(dict(
-                    cid=cid,new=new,usn=self.manager.col.usn(),mod=intTime()))
+        col = self.manager.col
+        snids = ids2str(nids)
+        # if the src model is a cloze, we ignore the map, as the gui
+        # doesn't currently support mapping them
+        if oldModel.isCloze():
+            ordMap = {}
+            if self['type'] != MODEL_CLOZE:
+                # if we're mapping to a regular note, we need to check if
+                # the destination ord is valid
+                deleted = col.db.list(
+                    "select id from cards where nid in %s and ord >= ?" % snids,
+                    len(self['tmpls']))
             else:
-                deleted.append(cid)
-        self.manager.col.db.executemany(
-            "update cards set ord=:new,usn=:usn,mod=:mod where id=:cid",
-            cardData)
-        self.manager.col.remCards(deleted)
+                deleted = []
+            kept = "1"
+        else:
+            # mapping from a regular note, so the map should be valid
+            ordMap = {old: new for old, new in map.items() if new is not None}
+            deleted = col.db.list(
+                "select id from cards where nid in %s and ord in %s" % (
+                    snids, ids2str(old for old, new in map.items() if new is None)))
+            kept = "ord in " + ids2str(ordMap)
+        # the cards to delete are selected before their ords are reused
+        ords = "".join(" when %d then %d" % (old, new) for old, new in ordMap.items())
+        col.db.execute(
+            "update cards set %s usn=?,mod=? where nid in %s and %s" % (
+                "ord = case ord%s end," % ords if ords else "", snids, kept),
+            col.usn(), intTime())
+        col.remCards(deleted)
 
     # Schema hash
     ##########################################################################
@@ -399,10 +456,13 @@ select id from cards where nid in (select id from notes where mid = ?)""",
             req.append([template['ord'], type, list])
         self['req'] = req
 
-    def availOrds(self, flds):
+    def availOrds(self, flds, ords=None):
         """Given a joined field string, return ordinal of card type which
         should be generated. See
         ../documentation/templates_generation_rules.md for the detail
+
+        ords -- if set, only the card types of these ordinals are
+        considered. Ignored for cloze.
         """
         if self.isCloze():
             return self._availClozeOrds(flds)
@@ -411,6 +471,8 @@ select id from cards where nid in (select id from notes where mid = ?)""",
             fields[index] = fieldType.strip()
         avail = []
         for template in self['tmpls']:
+            if ords is not None and template['ord'] not in ords:
+                continue
             ord, type, req = template.getReq()
             # unsatisfiable template
             if type == "none":
@@ -6,6 +6,7 @@ import copy
 import json
 import time
 
+from anki import registry
 from anki.consts import *
 from anki.fields import Field
 from anki.hooks import runHook
@@ -87,18 +88,21 @@ class ModelManager:
     #############################################################
 
     def __init__(self, col):
-        """Returns a ModelManager whose collection is col."""
+        """Returns a ModelManager whose collection is col.
+
+        dirty -- the ids of the models changed since the last flush, or
+        None if any model may have changed"""
         self.col = col
         self.models = {}
         self.changed = False
+        self.dirty = set()
 
     def load(self, json_):
-        "Load registry from JSON."
+        """Load registry from JSON, or from a dict associating to each id
+        its model's json. The models are created when first accessed."""
         self.changed = False
-        self.models = dict()
-        for model in json.loads(json_).values():
-            self.models[str(model['id'])] = self.createModel(model)
-            
+        self.dirty = set()
+        self.models = registry.LazyRegistry(self.createModel, json_)
 
     def createModel(self, model):
         return Model(self, model)
@@ -116,8 +120,18 @@ class ModelManager:
         if model:
             model.save(templates=templates)
         else:
-            self.changed = True
-            runHook("newModel") # By default, only refresh side bar of browser
+            self.markChanged()
+
+    def markChanged(self, model=None):
+        """Schedule the flush of model, added, changed or removed, or of
+        the whole registry. Calls hook newModel."""
+        if model is None:
+            self.dirty = None
+        elif self.dirty is not None and model.getId() is not None:
+            # a model without id is not in the registry yet
+            self.dirty.add(str(model.getId()))
+        self.changed = True
+        runHook("newModel") # By default, only refresh side bar of browser
 
     def flush(self):
         "Flush the registry if any models were changed."
@@ -125,9 +139,13 @@ class ModelManager:
             for model in self.models.values():
                 model.flush()
             self.ensureNotEmpty()
-            self.col.db.execute("update col set models = ?",
-                                 json.dumps(self.models, default=lambda model: model.dumps()))
+            if self.col.objectTables:
+                registry.writeObjects(self.col.db, "models", self.models, self.dirty)
+            else:
+                self.col.db.execute("update col set models = ?",
+                                     json.dumps(self.models, default=lambda model: model.dumps()))
             self.changed = False
+            self.dirty = set()
 
     def ensureNotEmpty(self):
         if not self.models:
@@ -298,15 +316,15 @@ class ModelManager:
         return template.move(idx)
     def _syncTemplates(self, model):
         return model._syncTemplates()
-    def change(self, model, nids, newModel, fmap, cmap):
-        return newModel.change(model, nids, fmap, cmap)
+    def change(self, model, nids, newModel, fmap, cmap, progress=None):
+        return newModel.change(model, nids, fmap, cmap, progress)
     def scmhash(self, model):
         return model.scmhash()
     def _updateRequired(self, model):
         return model._updateRequired()
     def _reqForTemplate(self, model, flds, template):
         return template._req(flds)
-    def availOrds(self, model, flds):
-        return model.availOrds(flds)
+    def availOrds(self, model, flds, ords=None):
+        return model.availOrds(flds, ords)
     def _availClozeOrds(self, model, flds, allowEmpty=True):
         model._availClozeOrds(flds, allowEmpty)
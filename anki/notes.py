@@ -38,6 +38,8 @@ class Note:
     _fmap -- Mapping of (field name) -> (ord, field object). See models.py for field objects
     scm -- schema mod time: time when "schema" was modified. As in the collection.
     newlyAdded -- used by flush, to see whether a note is new or not.
+    _genKey -- what card generation depended on when the note was last
+    loaded or flushed, or None for a note never flushed. See _cardsKey.
     """
     def __init__(self, col, model=None, id=None):
         """A note.
@@ -52,6 +54,7 @@ class Note:
         assert not (model and id)
         self.col = col
         self.newlyAdded = False
+        self._genKey = None
         if id:
             self.id = id
             self.load()
@@ -85,6 +88,7 @@ from notes where id = ?""", self.id)
         self._model = self.col.models.get(self.mid, orNone=False)
         self._fmap = self._model.fieldMap()
         self.scm = self.col.scm
+        self._genKey = self._cardsKey()
 
     def tagTex(self, mod=None):
         """Add tag LaTeXError if the note has a LaTeX error. Remove it
@@ -115,7 +119,8 @@ from notes where id = ?""", self.id)
         If there exists a note with same id, tags and fields, and mod is not set, do nothing.
         Change the mod to given argument or current time
         Change the USNk
-        If the note is not new, according to _preFlush, generate the cards
+        If the note is not new, according to _preFlush, and cards may be
+        missing according to mayGenCards, generate the cards
         Add its tag to the collection
         Add the note in the db
 
@@ -143,6 +148,7 @@ insert or replace into notes values (?,?,?,?,?,?,?,?,?,?,?)""",
                             fields, sfld, csum, self.flags,
                             self.data)
         self.col.tags.register(self.tags)
+        self.col.tags.indexNote(self.id, self.col.tags.split(tags))
         self._postFlush()
         return texError
 
@@ -280,11 +286,30 @@ space, with an initial and a final white space."""
         self.newlyAdded = not self.col.db.scalar(
             "select 1 from cards where nid = ? limit 1", self.id)
 
+    def _cardsKey(self):
+        """What the cards generated depend on: the set of non-empty fields,
+        and for a cloze note, the cloze numbers."""
+        key = frozenset(ord for ord, field in enumerate(self.fields)
+                        if field.strip())
+        if self._model.isCloze():
+            return key, frozenset(self._model._availClozeOrds(
+                self.joinedFields(), allowEmpty=False))
+        return key
+
+    def mayGenCards(self):
+        """Whether flushing this note may generate cards. False if the
+        changes since it was loaded or flushed keep the same set of
+        non-empty fields."""
+        return self._genKey is None or self._genKey != self._cardsKey()
+
     def _postFlush(self):
         """Generate cards for non-empty template of this note.
 
-        Not executed if this note is newlyAdded."""
-        if not self.newlyAdded:
+        Not executed if this note is newlyAdded, or if mayGenCards is
+        False."""
+        genCards = self.mayGenCards()
+        self._genKey = self._cardsKey()
+        if not self.newlyAdded and genCards:
             rem = self.col.genCards([self.id])
             # popping up a dialog while editing is confusing; instead we can
             # document that the user should open the templates window to
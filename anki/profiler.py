@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# Copyright: Ankitects Pty Ltd and contributors
+# License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
+
+"""
+Measure where the time goes while Anki starts.
+
+When the environment variable ANKI_PROFILE_STARTUP contains a path,
+runanki starts startupProfiler before importing aqt. Then each module
+imported is timed, and so is each phase of the startup marked with
+startupProfiler.phase(name). When the first profile is loaded, or the
+profile manager shown, the report is written at this path.
+"""
+
+import builtins
+import importlib.util
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+
+    """
+    imports -- list of [name, seconds, self seconds, depth], one for each
+    module loaded, in the order the loads started. Seconds include the
+    modules imported by this module; self seconds don't.
+    phases -- list of [name, seconds, depth], in the order the phases
+    started.
+    path -- where to write the report, or None.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.imports = []
+        self.phases = []
+        self.path = None
+        self._stack = []
+        self._phaseDepth = 0
+        self._origImport = None
+        self._start = None
+        self.total = 0
+
+    # Starting and stopping
+    ######################################################################
+
+    def startFromEnv(self):
+        "Start if ANKI_PROFILE_STARTUP is set."
+        path = os.environ.get("ANKI_PROFILE_STARTUP")
+        if path:
+            self.start(path)
+
+    def start(self, path=None):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.path = path
+        self._start = time.perf_counter()
+        self._origImport = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self):
+        "Stop measuring. Return the report."
+        if not self.enabled:
+            return None
+        builtins.__import__ = self._origImport
+        self.enabled = False
+        self.total = time.perf_counter() - self._start
+        return self.report()
+
+    def finish(self):
+        "Stop measuring and write the report, if it was asked."
+        if not self.enabled:
+            return
+        report = self.stop()
+        if self.path:
+            with open(self.path, "w", encoding="utf8") as file:
+                file.write(report)
+
+    # Measuring
+    ######################################################################
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        label = self._newModules(name, globals, fromlist, level)
+        # only the first import of a module costs something
+        if label is None:
+            return self._origImport(name, globals, locals, fromlist, level)
+        entry = [label, 0, 0, len(self._stack)]
+        self.imports.append(entry)
+        self._stack.append(0)
+        start = time.perf_counter()
+        try:
+            return self._origImport(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            entry[1] = elapsed
+            entry[2] = elapsed - children
+            if self._stack:
+                self._stack[-1] += elapsed
+
+    def _newModules(self, name, globals, fromlist, level):
+        """The name of the modules this import statement loads, or None if
+        they are all loaded already."""
+        if level:
+            package = (globals or {}).get("__package__") or ""
+            try:
+                name = importlib.util.resolve_name(
+                    "." * level + name, package).rstrip(".")
+            except ImportError:
+                return name
+        module = sys.modules.get(name)
+        if module is None:
+            return name
+        # from package import submodules
+        missing = [item for item in fromlist or ()
+                   if item != "*" and not hasattr(module, item)]
+        if missing:
+            return "%s.(%s)" % (name, ", ".join(missing))
+        return None
+
+    @contextmanager
+    def phase(self, name):
+        "Time the block as the phase name. Does nothing unless started."
+        if not self.enabled:
+            yield
+            return
+        entry = [name, 0, self._phaseDepth]
+        self.phases.append(entry)
+        self._phaseDepth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry[1] = time.perf_counter() - start
+            self._phaseDepth -= 1
+
+    # Report
+    ######################################################################
+
+    def report(self, limit=50):
+        """The phases, and the limit modules which took the most time by
+        themselves."""
+        lines = ["Startup: %.3fs" % self.total, "", "Phases:"]
+        for name, seconds, depth in self.phases:
+            lines.append("%8.3fs %s%s" % (seconds, "  " * depth, name))
+        lines.append("")
+        lines.append("Imports (%d modules, %.3fs):" % (
+            len(self.imports),
+            sum(seconds for _, seconds, _, depth in self.imports if not depth)))
+        lines.append("    self   cumul. module")
+        slowest = sorted(self.imports, key=lambda entry: -entry[2])[:limit]
+        for name, seconds, selfSeconds, _ in slowest:
+            lines.append("%7.3fs %7.3fs %s" % (selfSeconds, seconds, name))
+        return "\n".join(lines) + "\n"
+
+    def importedModules(self):
+        return [entry[0] for entry in self.imports]
+
+
+startupProfiler = StartupProfiler()
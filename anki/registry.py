@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+# Copyright: Ankitects Pty Ltd and contributors
+# License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
+
+"""
+Storage of the models, decks and deck options as one row per object.
+
+By default, each of those registries is a json blob of the table col,
+entirely rewritten whenever one of its objects changes. A collection
+may instead use object tables: each model, deck and deck option is a
+row (id, json) of the table models, decks or dconf, and the managers
+only write the objects saved since they were last flushed.
+
+The blobs remain what older clients, full syncs and exported
+collections read. They are reassembled from the rows, without
+serializing the objects again, when the collection is closed. The sha1
+of each blob written is kept in the table blobsums. A blob which
+doesn't match it when the collection is loaded was changed by an older
+client: the rows of its table are rebuilt from it.
+
+Whatever the layout, the models and deck options are loaded in a
+LazyRegistry: the objects are only created, and with object tables
+their json only parsed, when they are first accessed.
+"""
+
+import hashlib
+import json
+
+# the tables, named as the columns of col containing their blob
+tables = ("models", "decks", "dconf")
+
+
+def hasObjectTables(db):
+    return bool(db.scalar(
+        "select 1 from sqlite_master where type = 'table' and name = 'blobsums'"))
+
+
+def createObjectTables(db, registries):
+    """Create the object tables, filled with registries, a dict
+    associating to each table the dict of its objects by id."""
+    for table in tables:
+        db.execute(f"""
+create table if not exists {table} (
+    id              integer primary key,
+    data            text not null
+)""")
+        writeObjects(db, table, registries[table])
+    db.execute("""
+create table if not exists blobsums (
+    name            text primary key,
+    sha1            text not null
+)""")
+    writeBlobs(db)
+
+
+def dropObjectTables(db):
+    "Write the blobs from the rows, and drop the object tables."
+    writeBlobs(db)
+    for table in tables + ("blobsums",):
+        db.execute(f"drop table {table}")
+
+
+def writeObjects(db, table, registry, ids=None):
+    """Write the objects of registry whose ids are in ids, or all of
+    them. An id absent from registry is deleted."""
+    if ids is None:
+        db.execute(f"delete from {table}")
+        ids = list(registry.keys())
+    for id in ids:
+        obj = registry.get(str(id))
+        if obj is None:
+            db.execute(f"delete from {table} where id = ?", int(id))
+        else:
+            db.execute(f"insert or replace into {table} values (?, ?)",
+                       int(id), json.dumps(obj))
+
+
+def _assemble(db, table):
+    "The blob of table, built from its rows."
+    return "{%s}" % ", ".join(
+        '"%d": %s' % (id, data)
+        for id, data in db.execute(f"select id, data from {table}"))
+
+
+def _sha1(blob):
+    return hashlib.sha1(blob.encode("utf8")).hexdigest()
+
+
+def writeBlobs(db):
+    "Write in col the blobs assembled from the rows."
+    for table in tables:
+        blob = _assemble(db, table)
+        db.execute(f"update col set {table} = ?", blob)
+        db.execute("insert or replace into blobsums values (?, ?)",
+                   table, _sha1(blob))
+
+
+def loadBlob(db, table, blob):
+    """The registry of table, given its blob in col, as a dict from id to
+    json. Rebuild the rows from the blob if it changed since it was
+    last written."""
+    if _sha1(blob) != db.scalar(
+            "select sha1 from blobsums where name = ?", table):
+        registry = json.loads(blob)
+        writeObjects(db, table, registry)
+        db.execute("insert or replace into blobsums values (?, ?)",
+                   table, _sha1(blob))
+        return registry
+    return {str(id): data
+            for id, data in db.execute(f"select id, data from {table}")}
+
+
+class LazyRegistry(dict):
+
+    """A dict from id to object, whose objects are created on first
+    access. It can be used as the dict of its objects: iterating,
+    values(), items(), copies, comparisons and json.dumps() create the
+    missing ones. Only the methods of dict called explicitly, e.g.
+    dict.values(registry), see the objects not yet created as None.
+
+    create -- the function creating an object from a dict
+    _raw -- associating to each id not yet accessed its dict, or its
+    json
+    """
+
+    def __init__(self, create, raw):
+        """raw -- a json, or a dict from id to dict or json."""
+        super().__init__()
+        self.create = create
+        if isinstance(raw, str):
+            raw = json.loads(raw)
+        self._raw = dict(raw)
+        for id in self._raw:
+            super().__setitem__(id, None)
+
+    def _load(self, id):
+        value = self._raw.pop(id)
+        if isinstance(value, str):
+            value = json.loads(value)
+        obj = self.create(value)
+        super().__setitem__(id, obj)
+        return obj
+
+    def __getitem__(self, id):
+        if id in self._raw:
+            return self._load(id)
+        return super().__getitem__(id)
+
+    def get(self, id, default=None):
+        if id in self:
+            return self[id]
+        return default
+
+    def __setitem__(self, id, obj):
+        self._raw.pop(id, None)
+        super().__setitem__(id, obj)
+
+    def __delitem__(self, id):
+        self._raw.pop(id, None)
+        super().__delitem__(id)
+
+    def pop(self, id, *default):
+        if id in self._raw:
+            self._load(id)
+        return super().pop(id, *default)
+
+    def setdefault(self, id, default=None):
+        if id not in self:
+            self[id] = default
+        return self[id]
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        id = list(super().__iter__())[-1]
+        return id, self.pop(id)
+
+    def __iter__(self):
+        # dict(), {**registry} and update() only copy the values directly
+        # from a dict whose __iter__ is dict's
+        return super().__iter__()
+
+    def copy(self):
+        "A dict of the objects, all created."
+        return dict(self)
+
+    def __eq__(self, other):
+        self.loadAll()
+        if isinstance(other, LazyRegistry):
+            other.loadAll()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def loadAll(self):
+        for id in list(self._raw):
+            self._load(id)
+
+    def values(self):
+        self.loadAll()
+        return super().values()
+
+    def items(self):
+        self.loadAll()
+        return super().items()
+
+    def loaded(self):
+        "The number of objects created."
+        return len(self) - len(self._raw)
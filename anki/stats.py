@@ -2,11 +2,15 @@
 # Copyright: Ankitects Pty Ltd and contributors
 # License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
 
+import copy
 import datetime
 import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from anki.consts import *
+from anki.db import DB, DBError
 from anki.lang import _, ngettext
 from anki.utils import fmtTimeSpan, ids2str
 
@@ -88,32 +92,127 @@ class CardStats:
 ##########################################################################
 
 class CollectionStats:
+    """The statistics of a deck or of the whole collection.
+
+    db -- the connection used by the queries. The collection's one,
+    except while a section is computed in a worker thread.
+    timings -- associate to each section's name the number of seconds
+    taken to compute it during the last report.
+    _scope -- during a report, the ids of the decks in the statistics,
+    the ids of the active decks and the name of the scope, resolved on
+    the calling thread; None otherwise.
+    parallel -- whether sections may be computed in worker threads, on
+    read-only connections.
+    """
+
+    # The method computing each section, in the order of the report
+    sections = ("todayStats", "dueGraph", "repsGraphs", "introductionGraph",
+                "ivlGraph", "hourGraph", "easeGraph", "cardGraph", "footer")
+    maxWorkers = 4
 
     def __init__(self, col):
         self.col = col
+        self.db = col.db
         self._stats = None
         self.type = 0
         self.width = 600
         self.height = 200
         self.wholeCollection = False
+        self.parallel = True
+        self.timings = {}
+        self._scope = None
 
     # assumes jquery & plot are available in document
-    def report(self, type=0):
-        # 0=days, 1=weeks, 2=months
-        self.type = type
+    def report(self, type=0, onSection=None):
+        """The html of the statistics.
+
+        type -- 0=days, 1=weeks, 2=months
+        onSection -- if given, called on each part of the html, in
+        order, as soon as it is computed. This allows to show the first
+        sections while the other ones are still computed.
+        """
         from .statsbg import bg
         txt = self.css % bg
-        txt += self._section(self.todayStats())
-        txt += self._section(self.dueGraph())
-        txt += self.repsGraphs()
-        txt += self._section(self.introductionGraph())
-        txt += self._section(self.ivlGraph())
-        txt += self._section(self.hourGraph())
-        txt += self._section(self.easeGraph())
-        txt += self._section(self.cardGraph())
-        txt += self._section(self.footer())
+        if onSection:
+            onSection(txt)
+        for html in self.reportSections(type):
+            txt += html
+            if onSection:
+                onSection(html)
         return "<center>%s</center>" % txt
 
+    def reportSections(self, type=0):
+        """Generate the html of each section, in the order of the report.
+
+        Sections are independent aggregate queries. If possible, they
+        are computed concurrently, each on its own read-only connection;
+        sqlite releases the GIL while it executes a query."""
+        self.type = type
+        self.timings = {}
+        # workers only use their own connection, never the decks
+        self._scope = self._resolveScope()
+        try:
+            if not self._canParallelize():
+                for name in self.sections:
+                    yield self._timedSection(name)
+                return
+            with ThreadPoolExecutor(max_workers=self.maxWorkers) as executor:
+                futures = [executor.submit(self._readOnlySection, name)
+                           for name in self.sections]
+                for name, future in zip(self.sections, futures):
+                    try:
+                        yield future.result()
+                    except DBError:
+                        # e.g. database locked. Use the main connection
+                        # instead.
+                        yield self._timedSection(name)
+        finally:
+            self._scope = None
+
+    def _resolveScope(self):
+        "(dids in the statistics, active dids, name of the scope)"
+        active = self.col.decks.active()
+        if self.wholeCollection:
+            return ([deck.getId() for deck in self.col.decks.all()], active,
+                    _("whole collection"))
+        return active, active, self.col.decks.current().getName()
+
+    def _scopeInfo(self):
+        return self._scope or self._resolveScope()
+
+    def _canParallelize(self):
+        """Whether the sections can be computed on other connections.
+
+        Other connections only see what is committed. So it requires
+        that nothing was changed since last commit."""
+        return (self.parallel and
+                self.db is self.col.db and
+                not self.db.mod and
+                not self.col.server and
+                os.path.exists(self.col.path))
+
+    def _readOnlySection(self, name):
+        """The html of the section name, computed on a new read-only
+        connection. Called from a worker thread."""
+        db = DB(self.col.path, readOnly=True)
+        try:
+            stats = copy.copy(self)
+            stats.db = db
+            return stats._timedSection(name)
+        finally:
+            db.close()
+
+    def _timedSection(self, name):
+        """The html of the section name. Its computation time is saved in
+        timings."""
+        startTime = time.time()
+        html = getattr(self, name)()
+        if name != "repsGraphs":
+            # repsGraphs returns two sections already
+            html = self._section(html)
+        self.timings[name] = time.time() - startTime
+        return html
+
     def _section(self, txt):
         return "<div class=section>%s</div>" % txt
 
@@ -137,7 +236,7 @@ body {background-image: url(data:image/png;base64,%s); }
         lim = self._revlogLimit()
         if lim:
             lim = " and " + lim
-        cards, thetime, failed, lrn, rev, relrn, filt = self.col.db.first(f"""
+        cards, thetime, failed, lrn, rev, relrn, filt = self.db.first(f"""
 select count(), sum(time)/1000,
 sum(case when ease = 1 then 1 else 0 end), /* failed */
 sum(case when type = {CARD_NEW} then 1 else 0 end), /* learning */
@@ -171,7 +270,7 @@ from revlog where id > ? """+lim, (self.col.sched.dayCutoff-86400)*1000)
             html += (_("Learn: %(lrn)s, Review: %(nbRev)s, Relearn: %(relrn)s, Filtered: %(filt)s")
                   % dict(lrn=bold(lrn), nbRev=bold(rev), relrn=bold(relrn), filt=bold(filt)))
             # mature today
-            mcnt, msum = self.col.db.first("""
+            mcnt, msum = self.db.first("""
     select count(), sum(case when ease = 1 then 0 else 1 end) from revlog
     where lastIvl >= 21 and id > ?"""+lim, (self.col.sched.dayCutoff-86400)*1000)
             html += "<br>"
@@ -244,7 +343,7 @@ from revlog where id > ? """+lim, (self.col.sched.dayCutoff-86400)*1000)
         self._line(tableLines, _("Total"), ngettext("%d review", "%d reviews", tot) % tot)
         self._line(tableLines, _("Average"), self._avgDay(
             tot, num, _("reviews")))
-        tomorrow = self.col.db.scalar(f"""
+        tomorrow = self.db.scalar(f"""
 select count() from cards where did in %s and queue in ({QUEUE_REV}, {QUEUE_DAY_LRN})
 and due = ?""" % self._limit(), self.col.sched.today+1)
         tomorrow = ngettext("%d card", "%d cards", tomorrow) % tomorrow
@@ -257,7 +356,7 @@ and due = ?""" % self._limit(), self.col.sched.today+1)
             lim += " and due-:today >= %d" % start
         if end is not None:
             lim += " and day < %d" % end
-        return self.col.db.all(f"""
+        return self.db.all(f"""
 select (due-:today)/:chunk as day,
 sum(case when ivl < 21 then 1 else 0 end), -- yng
 sum(case when ivl >= 21 then 1 else 0 end) -- mtr
@@ -435,7 +534,7 @@ group by day order by day""" % (self._limit(), lim),
             tf = 60.0 # minutes
         else:
             tf = 3600.0 # hours
-        return self.col.db.all("""
+        return self.db.all("""
 select
 (cast((id/1000.0 - :cut) / 86400.0 as int))/:chunk as day,
 count(id)
@@ -458,7 +557,7 @@ group by day order by day""" % lim, cut=self.col.sched.dayCutoff,tf=tf, chunk=ch
             tf = 60.0 # minutes
         else:
             tf = 3600.0 # hours
-        return self.col.db.all(f"""
+        return self.db.all(f"""
 select
 (cast((id/1000.0 - :cut) / 86400.0 as int))/:chunk as day,
 sum(case when type = {CARD_NEW} then 1 else 0 end), -- lrn count
@@ -492,7 +591,7 @@ group by day order by day""" % lim,
             lim = "where " + " and ".join(lims)
         else:
             lim = ""
-        ret = self.col.db.first("""
+        ret = self.db.first("""
 select count(), abs(min(day)) from (select
 (cast((id/1000 - :cut) / 86400.0 as int)+1) as day
 from revlog %s
@@ -536,12 +635,12 @@ group by day order by day)""" % lim,
     def _ivls(self):
         start, end, chunk = self.get_start_end_chunk()
         lim = "and grp <= %d" % end if end else ""
-        data = [self.col.db.all(f"""
+        data = [self.db.all(f"""
 select ivl / :chunk as grp, count() from cards
 where did in %s and queue = {QUEUE_REV} %s
 group by grp
 order by grp""" % (self._limit(), lim), chunk=chunk)]
-        return data + list(self.col.db.first(f"""
+        return data + list(self.db.first(f"""
 select count(), avg(ivl), max(ivl) from cards where did in %s and queue = {QUEUE_REV}""" %
                                          self._limit())), chunk
 
@@ -619,7 +718,7 @@ select count(), avg(ivl), max(ivl) from cards where did in %s and queue = {QUEUE
             ease4repl = "3"
         else:
             ease4repl = "ease"
-        return self.col.db.all(f"""
+        return self.db.all(f"""
 select (case
 when type in ({CARD_NEW},{CARD_DUE}) then 0
 when lastIvl < 21 then 1
@@ -690,7 +789,7 @@ order by thetype, ease""" % (ease4repl, lim))
         pd = self._periodDays()
         if pd:
             lim += " and id > %d" % ((self.col.sched.dayCutoff-(86400*pd))*1000)
-        return self.col.db.all(f"""
+        return self.db.all(f"""
 select
 23 - ((cast((:cut - id/1000) / 3600.0 as int)) %% 24) as hour,
 sum(case when ease = 1 then 0 else 1 end) /
@@ -715,7 +814,7 @@ group by hour having count() > 30 order by hour""" % lim,
             nameColor.append(dict(data=div[index], label="%s: %s" % (kindOfCard, div[index]), color=col))
         # text data
         tableLines = []
-        (countCard, countNote) = self.col.db.first("""
+        (countCard, countNote) = self.db.first("""
 select count(id), count(distinct nid) from cards
 where did in %s """ % self._limit())
         self._line(tableLines, _("Total cards"), countCard)
@@ -749,7 +848,7 @@ when you answer "good" on a review.''')
         return "<table width=400>" + "".join(tableLines) + "</table>"
 
     def _factors(self):
-        return self.col.db.first(f"""
+        return self.db.first(f"""
 select
 min(factor) / 10.0,
 avg(factor) / 10.0,
@@ -757,7 +856,7 @@ max(factor) / 10.0
 from cards where did in %s and queue = {QUEUE_REV}""" % self._limit())
 
     def _cards(self):
-        return self.col.db.first(f"""
+        return self.db.first(f"""
 select
 sum(case when queue={QUEUE_REV} and ivl >= 21 then 1 else 0 end), -- mtr
 sum(case when queue in ({QUEUE_LRN},{QUEUE_DAY_LRN}) or (queue={QUEUE_REV} and ivl < 21) then 1 else 0 end), -- yng/lrn
@@ -772,11 +871,7 @@ from cards where did in %s""" % self._limit())
         html = "<br><br><font size=1>"
         html += _("Generated on %s") % time.asctime(time.localtime(time.time()))
         html += "<br>"
-        if self.wholeCollection:
-            deck = _("whole collection")
-        else:
-            deck = self.col.decks.current().getName()
-        html += _("Scope: %s") % deck
+        html += _("Scope: %s") % self._scopeInfo()[2]
         html += "<br>"
         html += _("Period: %s") % [
             _("1 month"),
@@ -891,16 +986,14 @@ $(function () {
     data=json.dumps(data), conf=json.dumps(conf)))
 
     def _limit(self):
-        if self.wholeCollection:
-            return ids2str([deck.getId() for deck in self.col.decks.all()])
-        return self.col.decks._activeAsString()
+        return ids2str(self._scopeInfo()[0])
 
     def _revlogLimit(self):
         """A query ensuring that cards are in an active deck"""
         if self.wholeCollection:
             return ""
         return ("cid in (select id from cards where did in %s)" %
-                ids2str(self.col.decks.active()))
+                ids2str(self._scopeInfo()[1]))
 
     def _title(self, title, subtitle=""):
         return '<h1>%s</h1>%s' % (title, subtitle)
@@ -910,10 +1003,10 @@ $(function () {
         if lim:
             lim = " where " + lim
         if by == 'review':
-            time = self.col.db.scalar("select id from revlog %s order by id limit 1" % lim)
+            time = self.db.scalar("select id from revlog %s order by id limit 1" % lim)
         elif by == 'add':
-            lim = "where did in %s" % ids2str(self.col.decks.active())
-            time = self.col.db.scalar("select id from cards %s order by id limit 1" % lim)
+            lim = "where did in %s" % ids2str(self._scopeInfo()[1])
+            time = self.db.scalar("select id from cards %s order by id limit 1" % lim)
         if not time:
             period = 1
         else:
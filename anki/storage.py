@@ -13,14 +13,17 @@ from anki.db import DB
 from anki.lang import _
 from anki.stdmodels import (addBasicModel, addBasicTypingModel, addClozeModel,
                             addForwardOptionalReverse, addForwardReverse)
-from anki.utils import intTime, isWin
+from anki.utils import intTime
 
 
-def Collection(path, lock=True, server=False, log=False, DeckManager=None):
+def Collection(path, lock=True, server=False, log=False, DeckManager=None,
+               dbProfile=None):
     """Open a new or existing collection. Path must be unicode.
 
     server -- always False in anki without add-on.
     log -- Boolean stating whether log must be made in the file, with same name than the collection, but ending in .log.
+    dbProfile -- the name of the performance profile of the connections
+    to the collection and its media database, see anki.db.dbProfiles.
     """
     assert path.endswith(".anki2")
     path = os.path.abspath(path)
@@ -36,10 +39,8 @@ def Collection(path, lock=True, server=False, log=False, DeckManager=None):
         ver = _createDB(db)
     else:
         ver = _upgradeSchema(db)
-    db.execute("pragma temp_store = memory")
-    db.execute("pragma cache_size = 10000")
-    if not isWin:
-        db.execute("pragma journal_mode = wal")
+    _upgradeIndices(db)
+    db.applyProfile(dbProfile)
     db.setAutocommit(False)
     # add db to col and do any remaining upgrades
     col = _Collection(db, server, log, DeckManager=DeckManager)
@@ -337,3 +338,25 @@ create index if not exists ix_revlog_cid on revlog (cid);
 -- field uniqueness
 create index if not exists ix_notes_csum on notes (csum);
 """)
+
+# indices added since the schema version 11, by index version
+_versionedIndices = {
+    1: """
+-- notes of a note type, duplicates in a note type
+create index if not exists ix_notes_mid_csum on notes (mid, csum);
+-- cards of filtered decks
+create index if not exists ix_cards_odid on cards (odid);
+""",
+}
+
+def _upgradeIndices(db):
+    """Add the indices of the versions more recent than the collection's.
+    They are not changes to sync, so the collection's mod is kept."""
+    ver = db.scalar("pragma user_version")
+    if ver >= INDEX_VERSION:
+        return
+    mod = db.mod
+    for version in range(ver + 1, INDEX_VERSION + 1):
+        db.executescript(_versionedIndices[version])
+    db.execute("pragma user_version = %d" % INDEX_VERSION)
+    db.mod = mod
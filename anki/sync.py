@@ -81,6 +81,8 @@ class Syncer:
         # if the deck has any pending changes, flush them first and bump mod
         # time
         self.col.save()
+        # the server will know the changes, they can't be undone anymore
+        self.col.clearUndo()
 
         # step 1: login & metadata
         runHook("sync", "login")
@@ -599,6 +601,7 @@ from notes where %s""" % (self.maxUsn, lim))
             "insert or replace into notes values (?,?,?,?,?,?,?,?,?,?,?)",
             rows)
         self.col.updateFieldCache([note[0] for note in rows])
+        self.col.tags.updateIndex([note[0] for note in rows])
 
     # Col config
     ##########################################################################
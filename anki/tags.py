@@ -7,7 +7,8 @@ Anki maintains a cache of used tags so it can quickly present a list of tags
 for autocomplete and in the browser. For efficiency, deletions are not
 tracked, so unused tags can only be removed from the list with a DB check.
 
-This module manages the tag cache and tags for notes.
+This module manages the tag cache and tags for notes, and the index of the
+tags of each note.
 """
 
 import json
@@ -23,11 +24,21 @@ class TagManager:
     #############################################################
 
     def __init__(self, col):
+        """
+        tags -- dict sending each registered tag to its usn
+        _lower -- dict sending each lowercased registered tag to the
+        registered tag, as used by canonify
+        _wildcards -- cache of the regexps of the tags to remove
+        """
         self.col = col
         self.tags = {}
+        self._lower = {}
+        self._wildcards = {}
+        self.indexed = False
 
     def load(self, json_):
         self.tags = json.loads(json_)
+        self._lower = {tag.lower(): tag for tag in self.tags}
         self.changed = False
 
     def flush(self):
@@ -50,6 +61,7 @@ class TagManager:
             if tag not in self.tags:
                 found = True
                 self.tags[tag] = self.col.usn() if usn is None else usn
+                self._lower[tag.lower()] = tag
                 self.changed = True
         if found:
             runHook("newTag")
@@ -58,16 +70,20 @@ class TagManager:
         return list(self.tags.keys())
 
     def registerNotes(self, nids=None):
-        "Add any missing tags from notes to the tags list."
+        """Add any missing tags from notes to the tags list. The index of
+        those notes' tags is updated first."""
         # when called without an argument, the old list is cleared first.
         if nids:
-            lim = " where id in " + ids2str(nids)
+            self.updateIndex(nids)
+            lim = " where nid in " + ids2str(nids)
         else:
+            self.rebuildIndex()
             lim = ""
             self.tags = {}
+            self._lower = {}
             self.changed = True
-        self.register(set(self.split(
-            " ".join(self.col.db.list("select distinct tags from notes"+lim)))))
+        self.register(self.col.db.list(
+            "select distinct tag collate binary from note_tags"+lim))
 
     def allItems(self):
         return list(self.tags.items())
@@ -76,15 +92,118 @@ class TagManager:
         self.changed = True
 
     def byDeck(self, did, children=False):
-        basequery = "select note.tags from cards card, notes note WHERE card.nid = note.id"
-        if not children:
-            query = basequery + " AND card.did=?"
-            res = self.col.db.list(query, did)
-            return list(set(self.split(" ".join(res))))
-        dids = [did] + [id for name, id in self.col.decks.children(did)]
-        query = basequery + " AND card.did IN " + ids2str(dids)
-        res = self.col.db.list(query)
-        return list(set(self.split(" ".join(res))))
+        """The tags of the notes having a card in the deck did, or in one of
+        its descendants if children is set."""
+        dids = [did]
+        if children:
+            dids += [id for name, id in self.col.decks.children(did)]
+        return self.col.db.list("""
+select distinct tag collate binary from note_tags
+where nid in (select nid from cards where did in %s)""" % ids2str(dids))
+
+    # Tag index
+    #############################################################
+    # The table note_tags contains a row (nid, tag) for each tag of
+    # each note, so that notes can be found by tag with an index instead
+    # of a scan of notes.tags. Methods changing the tags of notes keep
+    # it up to date. note_tags_state contains the mod time of the
+    # collection when the index was last saved; if the collection was
+    # saved without it, e.g. by another program, the index is rebuilt
+    # when the collection is loaded.
+
+    def loadIndex(self):
+        "Create the index if it is missing, and rebuild it if outdated."
+        db = self.col.db
+        mod = db.mod
+        db.execute("""
+create table if not exists note_tags (
+    nid             integer not null,
+    tag             text not null collate nocase,
+    primary key (nid, tag)
+) without rowid""")
+        db.execute("create index if not exists ix_note_tags_tag on note_tags (tag)")
+        db.execute("""
+create table if not exists note_tags_state (
+    id              integer primary key,
+    mod             integer not null
+)""")
+        self.indexed = True
+        if db.scalar("select mod from note_tags_state") != self.col.mod:
+            self.rebuildIndex()
+            self.setIndexMod(self.col.mod)
+        db.commit()
+        db.mod = mod
+
+    def dropIndex(self):
+        """Remove the index from the database, e.g. before the file is
+        shared. It is rebuilt when the collection is loaded again."""
+        self.col.db.execute("drop table if exists note_tags")
+        self.col.db.execute("drop table if exists note_tags_state")
+        self.indexed = False
+
+    def setIndexMod(self, mod):
+        "Note that the index is up to date with the collection saved at mod."
+        if self.indexed:
+            self.col.db.execute(
+                "insert or replace into note_tags_state values (1, ?)", mod)
+
+    def rebuildIndex(self):
+        "Index the tags of every note."
+        if not self.indexed:
+            return
+        self.col.db.execute("delete from note_tags")
+        self._indexRows(self.col.db.execute("select id, tags from notes"))
+
+    def updateIndex(self, nids):
+        "Index the tags of the notes nids, as saved in the database."
+        if not self.indexed:
+            return
+        strids = ids2str(nids)
+        self.col.db.execute("delete from note_tags where nid in " + strids)
+        self._indexRows(self.col.db.all(
+            "select id, tags from notes where id in " + strids))
+
+    def indexNote(self, nid, tags):
+        "Index the list of tags of the note nid."
+        if not self.indexed:
+            return
+        self.col.db.execute("delete from note_tags where nid = ?", nid)
+        self.col.db.executemany("insert or ignore into note_tags values (?, ?)",
+                                [(nid, tag) for tag in tags])
+
+    def unindexNotes(self, nids):
+        "Remove the notes nids from the index."
+        if not self.indexed:
+            return
+        self.col.db.execute("delete from note_tags where nid in " + ids2str(nids))
+
+    def _indexRows(self, rows):
+        """Index the rows (nid, tags), where tags is a string as in the
+        notes table."""
+        self.col.db.executemany(
+            "insert or ignore into note_tags values (?, ?)",
+            ((nid, tag) for nid, tags in rows for tag in self.split(tags)))
+
+    def tagQuery(self, tag):
+        """A query returning the ids of the notes having tag, and its
+        arguments.
+
+        As in searches, * matches any sequence of characters, % and _
+        are sql wildcards, and case is ignored. The index is used on the
+        part of tag before the first wildcard."""
+        if not tag.strip("*%"):
+            # matches the empty string, thus notes without tags
+            return "select id from notes", []
+        wildcard = re.search(r"[*%_\\]", tag)
+        if not wildcard:
+            return "select nid from note_tags where tag = ?", [tag]
+        query = "select nid from note_tags where tag like ? escape '\\'"
+        args = [tag.replace("*", "%")]
+        prefix = tag[:wildcard.start()]
+        if prefix:
+            query += " and tag >= ? and tag < ?"
+            args += [prefix, prefix + "\U0010ffff"]
+        return query, args
 
     # Bulk addition/removal from notes
     #############################################################
@@ -105,29 +224,30 @@ class TagManager:
             self.register(newTags)
         # find notes missing the tags
         if add:
-            tagsRequirement = "tags not "
-            fn = self.addToStr
+            tagsRequirement = "id not in "
+            fn = self.adder(tags)
         else:
-            tagsRequirement = "tags "
-            fn = self.remFromStr
+            tagsRequirement = "id in "
+            fn = self.remover(tags)
+        queries = [self.tagQuery(tag) for tag in newTags]
         lim = " or ".join(
-            [tagsRequirement+"like :_%d" % card for card, tag in enumerate(newTags)])
+            [tagsRequirement+"(%s)" % query for query, args in queries])
         res = self.col.db.all(
             "select id, tags from notes where id in %s and (%s)" % (
                 ids2str(ids), lim),
-            f"""select id, tags from notes where id in
-            {ids2str(ids)} and ({lim})""" ,
-            **dict([("_%d" % tagIndex, '%% %s %%' % tag.replace('*', '%'))
-                    for tagIndex, tag in enumerate(newTags)]))
+            *[arg for query, args in queries for arg in args])
         # update tags
         nids = []
         def fix(row):
             nids.append(row[0])
-            return {'id': row[0], 'tags': fn(tags, row[1]), 'mod':intTime(),
-                'usn':self.col.usn()}
+            return {'id': row[0], 'tags': fn(row[1]), 'mod':mod,
+                'usn':usn}
+        mod = intTime()
+        usn = self.col.usn()
         self.col.db.executemany(
             "update notes set tags=:tags,mod=:mod,usn=:usn where id = :id",
             [fix(row) for row in res])
+        self.updateIndex(nids)
 
     def bulkRem(self, ids, tags):
         self.bulkAdd(ids, tags, False)
@@ -148,27 +268,47 @@ and trailing spaces."""
 
     def addToStr(self, addtags, tags):
         "Add tags if they don't exist, and canonify."
-        currentTags = self.split(tags)
-        for tag in self.split(addtags):
-            if not self.inList(tag, currentTags):
-                currentTags.append(tag)
-        canonified = self.canonify(currentTags)
-        return self.join(canonified)
+        return self.adder(addtags)(tags)
 
     def remFromStr(self, deltags, tags):
         "Delete tags if they exist."
-        def wildcard(pat, str):
-            pat = re.escape(pat).replace('\\*', '.*')
-            return re.match("^"+pat+"$", str, re.IGNORECASE)
-        currentTags = self.split(tags)
-        for tag in self.split(deltags):
-            # find tags, ignoring case
-            removes = [tx for tx in currentTags
-                       if (tag.lower() == tx.lower()) or wildcard(tag, tx)]
-            # removes them
-            for remove in removes:
-                currentTags.remove(remove)
-        return self.join(currentTags)
+        return self.remover(deltags)(tags)
+
+    def adder(self, addtags):
+        """A function as addToStr(addtags, _). addtags is parsed once, so
+        that the function can be applied to the tags of many notes."""
+        addTags = self.split(addtags)
+        def add(tags):
+            currentTags = self.split(tags)
+            lowerTags = {tag.lower() for tag in currentTags}
+            for tag in addTags:
+                if tag.lower() not in lowerTags:
+                    currentTags.append(tag)
+                    lowerTags.add(tag.lower())
+            canonified = self.canonify(currentTags)
+            return self.join(canonified)
+        return add
+
+    def remover(self, deltags):
+        """A function as remFromStr(deltags, _). deltags is parsed once, so
+        that the function can be applied to the tags of many notes."""
+        delTags = [(tag.lower(), self._wildcard(tag))
+                   for tag in self.split(deltags)]
+        def rem(tags):
+            currentTags = self.split(tags)
+            for lowerTag, wildcard in delTags:
+                # find tags, ignoring case, and remove them
+                currentTags = [tx for tx in currentTags
+                               if not (lowerTag == tx.lower() or wildcard.match(tx))]
+            return self.join(currentTags)
+        return rem
+
+    def _wildcard(self, tag):
+        "The regexp matching tag, where * matches anything, ignoring case."
+        if tag not in self._wildcards:
+            pat = re.escape(tag).replace('\\*', '.*')
+            self._wildcards[tag] = re.compile("^"+pat+"$", re.IGNORECASE)
+        return self._wildcards[tag]
 
     # List-based utilities
     ##########################################################################
@@ -177,16 +317,15 @@ and trailing spaces."""
         "Strip duplicates, adjust case to match existing tags, and sort."
         strippedTags = []
         for tag in tagList:
-            tag = re.sub("[\"']", "", tag)
-            for existingTag in self.tags:
-                if tag.lower() == existingTag.lower():
-                    tag = existingTag
+            tag = tag.replace('"', "").replace("'", "")
+            tag = self._lower.get(tag.lower(), tag)
             strippedTags.append(tag)
         return sorted(set(strippedTags))
 
     def inList(self, tag, tags):
         """Whether tag is in tags. Ignore case."""
-        return tag.lower() in [tag.lower() for tag in tags]
+        lowerTag = tag.lower()
+        return any(lowerTag == tx.lower() for tx in tags)
 
     # Sync handling
     ##########################################################################
@@ -195,3 +334,5 @@ and trailing spaces."""
         for key in list(self.tags.keys()):
             self.tags[key] = 0
         self.save()
+        # the index is not part of the collection format
+        self.dropIndex()
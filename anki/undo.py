@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+# Copyright: Ankitects Pty Ltd and contributors
+# License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
+
+"""
+The journal of the changes of the collection, used to undo and redo.
+
+Temporary triggers record in the table undolog, for each row inserted,
+updated or deleted in the journaled tables, the statement which
+reverts this change. Those triggers and tables belong to the
+connection, they are never saved in the collection. Being in the
+database, the journal is not lost when the collection is committed,
+and is rolled back with it.
+
+A step is the list of changes which are undone at once. It starts at a
+checkpoint, or when a card is reviewed, and lasts until the next step
+starts. Changes made before the first step can't be undone, they are
+pruned when the collection is saved.
+
+Undoing a step runs its statements, newest first. The triggers record
+the statements reverting them in undolog; they are moved to the table
+redolog, as the step which can be redone. Redoing a step does the
+same, and the statements recorded form again a step of undolog.
+
+The decks are not saved for each review, since all of them would be
+logged. A review step keeps instead the daily counts of the decks the
+review may change, which the collection sets back once the step is
+reverted.
+
+The memory used is bounded. The triggers only log while there is a
+step to undo or redo, and the table undostate counts the characters of
+undolog as rows are logged. Once they exceed maxSize, logging stops:
+the last step is incomplete, so it and the steps before are forgotten.
+Before a step starts, the oldest steps are dropped to leave it at least
+half of maxSize. Bulk operations without a checkpoint, such as Check
+Database, run with the journal suspended: its triggers are dropped, and
+the steps before can't be undone anymore.
+"""
+
+from contextlib import contextmanager
+
+
+class Step:
+
+    """
+    name -- the name of the action, shown in the menu
+    start -- the seq of the first change of this step in the log
+    cid -- for a review, the id of the card reviewed; None otherwise
+    counts -- for a review, associate to the id of each deck whose daily
+    counts it may change the values of these counts before it. The
+    decks are not saved for each review, so they are not in the log.
+    end -- for a step which can be redone, the seq of its last change
+    in redolog
+    """
+
+    def __init__(self, name, start, cid=None, counts=None):
+        self.name = name
+        self.start = start
+        self.cid = cid
+        self.counts = counts
+        self.end = None
+
+
+class UndoJournal:
+
+    """
+    steps -- the steps which can be undone, the last one last
+    redoSteps -- the steps which can be redone, the last undone last
+    _redoMark -- the last seq of undolog after the last undo. If the log
+    changed since, the steps undone can't be redone anymore.
+    _suspended -- how many suspended() blocks are running
+    """
+
+    # the journaled tables, when they exist
+    tables = ("cards", "notes", "revlog", "graves", "col",
+              "models", "decks", "dconf")
+    # tables with big columns rarely changed: only changed columns are
+    # saved
+    columnTables = ("col",)
+    maxSteps = 50
+    # characters of all the statements of the log
+    maxSize = 20 * 1024 * 1024
+
+    def __init__(self, db):
+        self.db = db
+        self.steps = []
+        self.redoSteps = []
+        self._redoMark = None
+        self._suspended = 0
+        self._install()
+
+    def _install(self):
+        mod = self.db.mod
+        # "insert or replace" fires the delete trigger only with this
+        self.db.execute("pragma recursive_triggers = on")
+        for log in ("undolog", "redolog"):
+            self.db.execute(f"""
+create temp table if not exists {log} (
+    seq integer primary key autoincrement,
+    tbl text not null,
+    rid integer not null,
+    sql text not null
+)""")
+            self.db.execute(f"delete from {log}")
+        self.db.execute("""
+create temp table if not exists undostate (
+    id integer primary key,
+    logging integer not null,
+    overflow integer not null,
+    size integer not null,
+    maxSize integer not null
+)""")
+        self.db.execute("insert or replace into undostate values (1, 0, 0, 0, ?)",
+                        self.maxSize)
+        self.db.execute("""
+create temp trigger if not exists undolog_size after insert on undolog
+begin
+update undostate set size = size + length(new.sql);
+update undostate set logging = 0, overflow = 1 where size > maxSize;
+end""")
+        self._createTriggers()
+        self.db.mod = mod
+
+    def _journaledTables(self):
+        existing = self.db.list("select name from sqlite_master where type = 'table'")
+        return [table for table in self.tables if table in existing]
+
+    def _createTriggers(self):
+        for table in self._journaledTables():
+            for trigger in self._triggers(table):
+                self.db.execute(trigger)
+
+    def _dropTriggers(self):
+        for name in self.db.list(
+                "select name from sqlite_temp_master where type = 'trigger' "
+                "and name like 'undo\\_%' escape '\\'"):
+            self.db.execute(f"drop trigger {name}")
+
+    def _triggers(self, table):
+        columns = [row[1] for row in self.db.execute(f"pragma main.table_info({table})")]
+        log = f"insert into undolog (tbl, rid, sql) values ('{table}', "
+        # nothing is logged, not even the statement, unless logging
+        logging = "(select logging from undostate)"
+        triggers = [f"""
+create temp trigger if not exists undo_{table}_insert after insert on main.{table}
+when {logging}
+begin {log} new.rowid, 'delete from {table} where rowid=' || new.rowid); end""", f"""
+create temp trigger if not exists undo_{table}_delete before delete on main.{table}
+when {logging}
+begin {log} old.rowid, 'insert into {table} (rowid, {", ".join(columns)}) values ('
+|| old.rowid || ',' || {" || ',' || ".join(f"quote(old.{column})" for column in columns)} || ')'); end"""]
+        if table in self.columnTables:
+            for column in columns:
+                triggers.append(f"""
+create temp trigger if not exists undo_{table}_update_{column} after update of {column} on main.{table}
+when {logging} and old.{column} is not new.{column}
+begin {log} old.rowid, 'update {table} set {column}=' || quote(old.{column})
+|| ' where rowid=' || old.rowid); end""")
+        else:
+            changed = " or ".join(f"old.{column} is not new.{column}" for column in columns)
+            values = " || ',".join(f"{column}=' || quote(old.{column})" for column in columns)
+            triggers.append(f"""
+create temp trigger if not exists undo_{table}_update after update on main.{table}
+when {logging} and ({changed})
+begin {log} old.rowid, 'update {table} set {values} || ' where rowid=' || old.rowid); end""")
+        return triggers
+
+    def _execute(self, sql, *args):
+        "Execute sql on the logs, which are not part of the collection."
+        mod = self.db.mod
+        self.db.execute(sql, *args)
+        self.db.mod = mod
+
+    def _lastSeq(self, log="undolog"):
+        return self.db.scalar(f"select max(seq) from {log}") or 0
+
+    def _size(self):
+        "The number of characters of the statements of undolog."
+        return self.db.scalar("select size from undostate")
+
+    def _resetSize(self):
+        "Count again the characters of undolog, after deletions."
+        self._execute("""
+update undostate set size = (select coalesce(sum(length(sql)), 0) from undolog)""")
+
+    def _updateLogging(self):
+        """Log while there is a step to undo or redo, unless suspended.
+        This also ends an overflow."""
+        logging = bool(self.steps or self.redoSteps) and not self._suspended
+        self._execute("update undostate set logging = ?, overflow = 0, maxSize = ?",
+                      logging, self.maxSize)
+
+    def _overflowed(self):
+        """If undolog outgrew maxSize, the last step is incomplete: forget
+        it and the steps before. Return whether it did."""
+        if not self.db.scalar("select overflow from undostate"):
+            return False
+        self.clear()
+        return True
+
+    @contextmanager
+    def suspended(self):
+        """Don't journal the changes made in the block, e.g. those of a bulk
+        operation without checkpoint. The triggers are dropped meanwhile,
+        so those changes cost nothing more. As they can't be reverted,
+        the steps before can't be undone anymore."""
+        self.clear()
+        self._suspended += 1
+        if self._suspended == 1:
+            mod = self.db.mod
+            self._dropTriggers()
+            self.db.mod = mod
+        try:
+            yield
+        finally:
+            self._suspended -= 1
+            if not self._suspended:
+                mod = self.db.mod
+                self._createTriggers()
+                self.db.mod = mod
+
+    # Steps
+    ######################################################################
+
+    def clear(self):
+        self.steps = []
+        self.redoSteps = []
+        self._redoMark = None
+        self._execute("delete from undolog")
+        self._execute("delete from redolog")
+        self._resetSize()
+        self._updateLogging()
+
+    def startStep(self, name, cid=None, counts=None):
+        """The changes from now on form the step name. Nothing is journaled
+        while suspended."""
+        if self._suspended:
+            return
+        self._overflowed()
+        self._clearRedo()
+        # an empty step is replaced
+        if self.steps and self.steps[-1].start > self._lastSeq():
+            self.steps.pop()
+        self._dropOldSteps(self.maxSize // 2)
+        self.steps.append(Step(name, self._lastSeq() + 1, cid, counts))
+        self._updateLogging()
+
+    def _dropOldSteps(self, size):
+        "Drop the oldest steps while undolog has more than size characters."
+        while self.steps and self._size() > size:
+            self.steps.pop(0)
+            start = self.steps[0].start if self.steps else self._lastSeq() + 1
+            self._execute("delete from undolog where seq < ?", start)
+            self._resetSize()
+
+    def name(self):
+        if self._overflowed():
+            return None
+        return self.steps[-1].name if self.steps else None
+
+    def redoName(self):
+        if self._overflowed():
+            return None
+        if self.redoSteps and self._redoMark != self._lastSeq():
+            # the collection changed since the undo
+            self._clearRedo()
+        return self.redoSteps[-1].name if self.redoSteps else None
+
+    def _clearRedo(self):
+        if self.redoSteps:
+            self.redoSteps = []
+            self._execute("delete from redolog")
+        self._redoMark = None
+
+    def prune(self):
+        """Delete the changes no step can undo, and the oldest steps beyond
+        maxSteps. The size is bounded while logging."""
+        self._overflowed()
+        while len(self.steps) > self.maxSteps:
+            self.steps.pop(0)
+        start = self.steps[0].start if self.steps else self._lastSeq() + 1
+        self._execute("delete from undolog where seq < ?", start)
+        self._resetSize()
+        self._updateLogging()
+
+    # Undoing and redoing
+    ######################################################################
+
+    def undo(self, restore=None):
+        """Revert the changes of the last step. Return the step, and the
+        ids of the notes changed.
+
+        keyword arguments:
+        restore -- a function called with the step once its changes are
+        reverted. The changes it makes are reverted by redoing the step.
+        """
+        self.redoName()
+        step = self.steps.pop()
+        changes = self.db.all(
+            "select seq, tbl, rid, sql from undolog where seq >= ? "
+            "order by seq desc", step.start)
+        self.db.execute("delete from undolog where seq >= ?", step.start)
+        self._resetSize()
+        # the statements reverting the undo are logged, even if it was the
+        # last step
+        self._execute("update undostate set logging = 1")
+        mark = self._lastSeq()
+        nids = self._apply(changes)
+        if restore:
+            restore(step)
+        overflow = self.db.scalar("select overflow from undostate")
+        # the statements reverting the undo are the redo step
+        step.start = self._lastSeq("redolog") + 1
+        if not overflow:
+            self.db.execute("""
+insert into redolog (tbl, rid, sql)
+select tbl, rid, sql from undolog where seq > ? order by seq""", mark)
+        self.db.execute("delete from undolog where seq > ?", mark)
+        self._resetSize()
+        step.end = self._lastSeq("redolog")
+        if overflow:
+            # incomplete, it can't be redone
+            self._clearRedo()
+        else:
+            self.redoSteps.append(step)
+            self._redoMark = self._lastSeq()
+        self._updateLogging()
+        return step, nids
+
+    def redo(self):
+        """Apply again the changes of the last step undone. Return the step,
+        and the ids of the notes changed."""
+        step = self.redoSteps.pop()
+        changes = self.db.all(
+            "select seq, tbl, rid, sql from redolog where seq between ? and ? "
+            "order by seq desc", step.start, step.end)
+        self.db.execute("delete from redolog where seq >= ?", step.start)
+        # appended to the log, the changes can be undone again
+        step.start = self._lastSeq() + 1
+        step.end = None
+        self._execute("update undostate set logging = 1")
+        nids = self._apply(changes)
+        self.steps.append(step)
+        self._redoMark = self._lastSeq()
+        if self.db.scalar("select overflow from undostate"):
+            # incomplete, it can't be undone
+            self.clear()
+        else:
+            self._updateLogging()
+        return step, nids
+
+    def _apply(self, changes):
+        nids = set()
+        for seq, table, rid, sql in changes:
+            self.db.execute(sql)
+            if table == "notes":
+                nids.add(rid)
+        return nids
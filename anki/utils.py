@@ -372,6 +372,13 @@ def noBundledLibs():
     if oldlpath is not None:
         os.environ["LD_LIBRARY_PATH"] = oldlpath
 
+def envWithoutBundledLibs():
+    """A copy of the environment, without the bundled libraries. Unlike
+    noBundledLibs, it can be used from several threads at once."""
+    env = dict(os.environ)
+    env.pop("LD_LIBRARY_PATH", None)
+    return env
+
 def call(argv, wait=True, **kwargs):
     """Execute a command and return its return code.
 
@@ -397,10 +404,11 @@ def call(argv, wait=True, **kwargs):
             si.dwFlags |= subprocess._subprocess.STARTF_USESHOWWINDOW # pytype: disable=module-attr
     else:
         si = None
-    # run
+    # run. The LaTeX builder calls this from worker threads, so the
+    # environment of the process is left untouched
+    kwargs.setdefault("env", envWithoutBundledLibs())
     try:
-        with noBundledLibs():
-            o = subprocess.Popen(argv, startupinfo=si, **kwargs)
+        o = subprocess.Popen(argv, startupinfo=si, **kwargs)
     except OSError:
         # command not found
         return -1
@@ -565,7 +573,7 @@ class DictAugmentedIdUsn(DictAugmented):
         """
         self['mod'] = intTime()
         self['usn'] = self.manager.col.usn()
-        self.manager.save()
+        self.manager.markChanged(self)
 
     def setId(self, newId):
         self['id'] = newId
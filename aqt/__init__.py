@@ -5,6 +5,7 @@ import argparse
 import builtins
 import getpass
 import gettext
+import importlib
 import locale
 import sys
 import tempfile
@@ -16,8 +17,8 @@ from anki import version as _version
 from anki.consts import (  # imported because those variables were originally in this file
     appChanges, appDonate, appHelpSite, appShared, appUpdate, appWebsite)
 from anki.lang import langDir
+from anki.profiler import startupProfiler
 from anki.utils import checksum, isLin, isMac
-from aqt import about, addcards, browser, editcurrent, preferences, stats
 from aqt.main import AnkiQt
 from aqt.qt import *
 
@@ -57,7 +58,8 @@ except ImportError as e:
 # - A constructor, which return a window object.
 
 # to integrate a new window:
-# - add it to _dialogs
+# - add it to _dialogs. The class may be given as LazyCreator("module:name"),
+#   so that its module is imported only when the window is first opened
 # - have the window opened via aqt.dialogs.open(<name>, self)
 # - have a method reopen(*args), called if the user ask to open the window a second time. Arguments passed are the same than for original opening.
 
@@ -65,20 +67,42 @@ except ImportError as e:
 
 
 
+class LazyCreator:
+    """Create a window with the class "module:name", importing its module
+    when a window is first created, and not at startup."""
+
+    def __init__(self, path):
+        self.path = path
+        self._creator = None
+
+    def resolve(self):
+        "The class, imported if needed."
+        if self._creator is None:
+            module, attr = self.path.split(":")
+            self._creator = getattr(importlib.import_module(module), attr)
+        return self._creator
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+
 class DialogManager:
     """Associating to a window name a pair (as a list...)
 
     The element associated to WindowName Is composed of:
-    First element is the class to use to create the window WindowName.
+    First element is the class to use to create the window WindowName,
+    or a LazyCreator of this class, so that its module is imported
+    when the window is first opened, and not at startup. Both can be
+    called to create a window.
     Second element is the instance of this window, if it is already open. None otherwise
     """
     _dialogs = {
-        "AddCards": [addcards.AddCards, None],
-        "Browser": [browser.Browser, None],
-        "EditCurrent": [editcurrent.EditCurrent, None],
-        "DeckStats": [stats.DeckStats, None],
-        "About": [about.show, None],
-        "Preferences": [preferences.Preferences, None],
+        "AddCards": [LazyCreator("aqt.addcards:AddCards"), None],
+        "Browser": [LazyCreator("aqt.browser:Browser"), None],
+        "EditCurrent": [LazyCreator("aqt.editcurrent:EditCurrent"), None],
+        "DeckStats": [LazyCreator("aqt.stats:DeckStats"), None],
+        "About": [LazyCreator("aqt.about:show"), None],
+        "Preferences": [LazyCreator("aqt.preferences:Preferences"), None],
     }
 
     """List of opened window. In order to close them all"""
@@ -109,7 +133,7 @@ class DialogManager:
         args -- values passed to the opener.
         name -- the name of the window to open
         """
-        (creator, instance) = self._dialogs[name]
+        instance = self._dialogs[name][1]
         if instance:
             if instance.windowState() & Qt.WindowMinimized:
                 instance.setWindowState(instance.windowState() & ~Qt.WindowMinimized)
@@ -119,7 +143,7 @@ class DialogManager:
                 instance.reopen(*args, **kwargs)
             return instance
         else:
-            instance = creator(*args, **kwargs)
+            instance = self.creator(name)(*args, **kwargs)
             self._dialogs[name][1] = instance
             return instance
 
@@ -130,11 +154,19 @@ class DialogManager:
         args -- values passed to the opener.
         name -- the name of the window to open
         """
-        (creator, _) = self._dialogs[name]
-        instance = creator(*args, **kwargs)
+        instance = self.creator(name)(*args, **kwargs)
         self._openDialogs.append(instance)
         return instance
 
+    def creator(self, name):
+        """The class creating the window name, importing its module if
+        needed."""
+        creator = self._dialogs[name][0]
+        if isinstance(creator, LazyCreator):
+            creator = creator.resolve()
+            self._dialogs[name][0] = creator
+        return creator
+
     def markClosed(self, name):
         """Remove the window of windowName from the set of windows. """
         # If it is a window of kind single, then call super
@@ -393,11 +425,13 @@ def _run(argv=None, exec=True):
     opts, args = parseArgs(argv)
 
     # profile manager
-    from aqt.profiles import ProfileManager
-    pm = ProfileManager(opts.base)
+    with startupProfiler.phase("profile manager"):
+        from aqt.profiles import ProfileManager
+        pm = ProfileManager(opts.base)
 
     # gl workarounds
-    setupGL(pm)
+    with startupProfiler.phase("setupGL"):
+        setupGL(pm)
 
     # opt in to full hidpi support?
     if not os.environ.get("ANKI_NOHIGHDPI"):
@@ -413,7 +447,8 @@ def _run(argv=None, exec=True):
     # create the app
     QCoreApplication.setApplicationName("Anki")
     QGuiApplication.setDesktopFileName("anki.desktop")
-    app = AnkiApp(argv)
+    with startupProfiler.phase("create app"):
+        app = AnkiApp(argv)
     if app.secondInstance():
         # we've signaled the primary instance, so we should close
         return
@@ -447,13 +482,15 @@ No usable temporary folder found. Make sure C:\\temp exists or TEMP in your \
 environment points to a valid, writable folder.""")
         return
 
-    pm.setupMeta()
+    with startupProfiler.phase("setupMeta"):
+        pm.setupMeta()
 
     if opts.profile:
         pm.openProfile(opts.profile)
 
     # i18n
-    setupLang(pm, app, opts.lang)
+    with startupProfiler.phase("setupLang"):
+        setupLang(pm, app, opts.lang)
 
     if isLin and pm.glMode() == "auto":
         from aqt.utils import gfxDriverIsBroken
@@ -463,8 +500,9 @@ environment points to a valid, writable folder.""")
             sys.exit(1)
 
     # load the main window
-    import aqt.main
-    mw = aqt.main.AnkiQt(app, pm, opts, args)
+    with startupProfiler.phase("main window"):
+        import aqt.main
+        mw = aqt.main.AnkiQt(app, pm, opts, args)
     if exec:
         app.exec()
     else:
@@ -38,14 +38,20 @@ class AddonManager(AM):
         sys.path.insert(0, self.addonsFolder())
 
     def loadAddons(self):
-        for tb, meta in super().loadAddons():
+        self.reportErrors(super().loadAddons())
+
+    def loadDeferredAddons(self):
+        self.reportErrors(super().loadDeferredAddons())
+
+    def reportErrors(self, errors):
+        for tb, meta in errors:
             showWarning(_("""\
 An add-on you installed failed to load. If problems persist, please \
 go to the Tools>Add-ons menu, and disable or delete the add-on.
 
 When loading '%(name)s':
 %(traceback)s
-""") % dict(name=meta.get("name", dir), traceback=tb))
+""") % dict(name=meta["name"], traceback=tb))
 
     def onAddonsDialog(self):
         AddonsDialog(self)
@@ -168,6 +174,9 @@ class AddonsDialog(QDialog):
         selected = set(self.selectedAddons())
         addonList.clear()
         for name, dir in self.addons:
+            loading = mgr.loadingDescription(dir)
+            if loading:
+                name += " (%s)" % loading
             item = QListWidgetItem(name, addonList)
             if not mgr.isEnabled(dir) or mgr.isIncorporated(dir):
                 item.setForeground(Qt.gray)
@@ -12,6 +12,7 @@ import unicodedata
 from operator import itemgetter
 
 import anki
+import aqt.editor
 import aqt.forms
 from anki.consts import *
 from anki.decks import DeckManager
@@ -2537,12 +2538,19 @@ Are you sure you want to continue?""")):
                 return
         self.browser.mw.checkpoint(_("Change Note Type"))
         self.browser.mw.col.modSchema(check=True)
-        self.browser.mw.progress.start()
+        progress = self.browser.mw.progress
+        win = progress.start(max=len(self.nids), label=_("Changing note type..."))
+        def onProgress(done, total):
+            progress.update(value=done)
+            return win is not None and win.wantCancel
         self.browser.model.beginReset()
-        self.targetModel.change(self.oldModel, self.nids, fmap, cmap)
+        changed = self.targetModel.change(self.oldModel, self.nids, fmap, cmap, onProgress)
         self.browser.search()
         self.browser.model.endReset()
-        self.browser.mw.progress.finish()
+        progress.finish()
+        if not changed:
+            tooltip(_("Change of note type cancelled."))
+            return
         self.browser.mw.reset()
         self.cleanup()
         QDialog.accept(self)
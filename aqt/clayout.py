@@ -606,6 +606,7 @@ Enter deck to place new %s cards in, or leave blank:""") %
                 self.note[name] = ""
             self.mw.col.db.execute("delete from notes where id = ?",
                                    self.note.id)
+            self.mw.col.tags.unindexNotes([self.note.id])
         self.model.save(templates=True)
         self.mw.reset()
         saveGeom(self, "CardLayout")
@@ -56,6 +56,10 @@ class Editor:
     """
     _links -- associate to each javascript command an action to do. ATTENTION: it is directly a function, and not a method from this class. Thus if you override the method, the function is not automatically modified.
     addMode -- Whether editor is called from addcard.py
+    dirty -- Whether the note has changes not yet saved. Keystrokes only
+    change the note in memory; it is saved saveDelay ms after the last
+    one, or as soon as a field loses focus, the note is changed or the
+    editor closed.
     currentField -- The index of the field currently selected. Or None if no fiel is selected.
     card -- the card selected in the browser/in the edit window
     """
@@ -72,6 +76,8 @@ class Editor:
         self.currentField = None
         # current card, for card layout
         self.card = None
+        self.dirty = False
+        self.setupSaveTimer()
         self.setupOuter()
         self.setupWeb()
         self.setupShortcuts()
@@ -80,6 +86,11 @@ class Editor:
     # Initial setup
     ############################################################
 
+    def setupSaveTimer(self):
+        self.saveTimer = QTimer(self.widget)
+        self.saveTimer.setSingleShot(True)
+        self.saveTimer.timeout.connect(self.onSaveTimer)
+
     def setupOuter(self):
         layout = QVBoxLayout()
         layout.setContentsMargins(0,0,0,0)
@@ -305,6 +316,7 @@ class Editor:
 
     def onBlur(self, ord, *args):
         self.onKeyOrBlur(ord, *args)
+        self.saveNote()
         self.currentField = None
         # run any filters
         if runFilter(
@@ -322,7 +334,11 @@ class Editor:
 
     def onKey(self, *args):
         self.onKeyOrBlur(*args)
-        runHook("editTimer", self.note)
+        if self.dirty:
+            # restart the delay, so that a burst of edits is saved once
+            self.saveTimer.start(self.saveDelay)
+        else:
+            runHook("editTimer", self.note)
         self.checkValid()
 
     def onKeyOrBlur(self, ord, nid, *args):
@@ -344,8 +360,7 @@ class Editor:
         txt = self.mw.col.media.escapeImages(txt, unescape=True)
         self.note.fields[ord] = txt
         if not self.addMode:
-            flushNote(self.note)
-            self.mw.requireReset()
+            self.dirty = True
 
     def onFocus(self, num):
         # focused into field?
@@ -357,6 +372,32 @@ class Editor:
             return ''
         return txt
 
+    # Saving the current note
+    ######################################################################
+
+    # ms without edit before the note is saved
+    saveDelay = 1000
+
+    def saveNote(self):
+        """Save the note if it has unsaved changes. Reset the main window
+        only if cards may have to be generated."""
+        self.saveTimer.stop()
+        if not self.dirty:
+            return
+        self.dirty = False
+        if not self.note:
+            return
+        genCards = self.note.mayGenCards()
+        flushNote(self.note)
+        if genCards:
+            self.mw.requireReset()
+
+    def onSaveTimer(self):
+        if not self.note or not self.dirty:
+            return
+        self.saveNote()
+        runHook("editTimer", self.note)
+
     # Setting/unsetting the current note
     ######################################################################
 
@@ -373,6 +414,7 @@ class Editor:
         hide -- whether to hide the current widget
         focusTo -- in which field should the focus appear
         """
+        self.saveNote()
         self.note = note
         self.currentField = None
         if self.note:
@@ -443,7 +485,10 @@ class Editor:
             self.mw.progress.timer(10, callback, False)
             return
         self.saveTags()
-        self.web.evalWithCallback("saveNow(%d)" % keepFocus, lambda res: callback())
+        def onSaved(res):
+            self.saveNote()
+            callback()
+        self.web.evalWithCallback("saveNow(%d)" % keepFocus, onSaved)
 
     def checkValid(self):
         cols = ["#fff"] * len(self.note.fields)
@@ -557,7 +602,8 @@ class Editor:
             self.mw.col.tags.split(tagsTxt))
         self.tags.setText(self.mw.col.tags.join(self.note.tags).strip())
         if not self.addMode:
-            flushNote(self.note)
+            self.dirty = True
+            self.saveNote()
         runHook("tagsUpdated", self.note)
 
     def saveAddModeVars(self):
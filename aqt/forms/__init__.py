@@ -0,0 +1,57 @@
+# This file auto-generated by build_ui.sh. Don't edit.
+import importlib
+import sys
+import types
+__all__ = [
+	"about",
+	"addcards",
+	"addfield",
+	"addmodel",
+	"addonconf",
+	"addons",
+	"batchedit",
+	"browser",
+	"browserdisp",
+	"browseropts",
+	"changemap",
+	"changemodel",
+	"clayout_top",
+	"clayout_top_cloze",
+	"customstudy",
+	"dconf",
+	"debug",
+	"dyndconf",
+	"editaddon",
+	"editcurrent",
+	"edithtml",
+	"exporting",
+	"fields",
+	"finddupes",
+	"findreplace",
+	"getaddons",
+	"importing",
+	"main",
+	"modelopts",
+	"models",
+	"preferences",
+	"preview",
+	"profiles",
+	"progress",
+	"reposition",
+	"reschedule",
+	"setgroup",
+	"setlang",
+	"stats",
+	"studydeck",
+	"taglimit",
+	"template",
+]
+
+class _LazyForms(types.ModuleType):
+    def __getattr__(self, name):
+        if name not in __all__:
+            raise AttributeError(name)
+        # importing the form sets it as an attribute of this module
+        return importlib.import_module("." + name, __name__)
+
+sys.modules[__name__].__class__ = _LazyForms
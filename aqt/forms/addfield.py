@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unsubscriptable-object,unused-import
+from anki.lang import _
+# Form implementation generated from reading ui file 'designer/addfield.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(434, 186)
+        self.horizontalLayout = QtWidgets.QHBoxLayout(Dialog)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.radioQ = QtWidgets.QRadioButton(Dialog)
+        self.radioQ.setChecked(True)
+        self.radioQ.setObjectName("radioQ")
+        self.gridLayout.addWidget(self.radioQ, 3, 1, 1, 1)
+        self.size = QtWidgets.QSpinBox(Dialog)
+        self.size.setMinimum(6)
+        self.size.setMaximum(200)
+        self.size.setObjectName("size")
+        self.gridLayout.addWidget(self.size, 2, 1, 1, 1)
+        self.label = QtWidgets.QLabel(Dialog)
+        self.label.setObjectName("label")
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+        self.label_2 = QtWidgets.QLabel(Dialog)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+        self.font = QtWidgets.QFontComboBox(Dialog)
+        self.font.setObjectName("font")
+        self.gridLayout.addWidget(self.font, 1, 1, 1, 1)
+        self.label_3 = QtWidgets.QLabel(Dialog)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout.addWidget(self.label_3, 2, 0, 1, 1)
+        self.fields = QtWidgets.QComboBox(Dialog)
+        self.fields.setObjectName("fields")
+        self.gridLayout.addWidget(self.fields, 0, 1, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.gridLayout.addItem(spacerItem, 5, 1, 1, 1)
+        self.radioA = QtWidgets.QRadioButton(Dialog)
+        self.radioA.setObjectName("radioA")
+        self.gridLayout.addWidget(self.radioA, 4, 1, 1, 1)
+        self.label_4 = QtWidgets.QLabel(Dialog)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout.addWidget(self.label_4, 3, 0, 1, 1)
+        self.horizontalLayout.addLayout(self.gridLayout)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Vertical)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.horizontalLayout.addWidget(self.buttonBox)
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+        Dialog.setTabOrder(self.fields, self.font)
+        Dialog.setTabOrder(self.font, self.size)
+        Dialog.setTabOrder(self.size, self.radioQ)
+        Dialog.setTabOrder(self.radioQ, self.radioA)
+        Dialog.setTabOrder(self.radioA, self.buttonBox)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_("Add Field"))
+        self.radioQ.setText(_("Front"))
+        self.label.setText(_("Field:"))
+        self.label_2.setText(_("Font:"))
+        self.label_3.setText(_("Size:"))
+        self.radioA.setText(_("Back"))
+        self.label_4.setText(_("Add to:"))
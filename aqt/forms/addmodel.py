@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unsubscriptable-object,unused-import
+from anki.lang import _
+# Form implementation generated from reading ui file 'designer/addmodel.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(285, 269)
+        self.vboxlayout = QtWidgets.QVBoxLayout(Dialog)
+        self.vboxlayout.setObjectName("vboxlayout")
+        self.groupBox = QtWidgets.QGroupBox(Dialog)
+        self.groupBox.setTitle("")
+        self.groupBox.setObjectName("groupBox")
+        self.vboxlayout1 = QtWidgets.QVBoxLayout(self.groupBox)
+        self.vboxlayout1.setObjectName("vboxlayout1")
+        self.models = QtWidgets.QListWidget(self.groupBox)
+        self.models.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.models.setTabKeyNavigation(True)
+        self.models.setObjectName("models")
+        self.vboxlayout1.addWidget(self.models)
+        self.vboxlayout.addWidget(self.groupBox)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Help|QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.vboxlayout.addWidget(self.buttonBox)
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_("Add Note Type"))
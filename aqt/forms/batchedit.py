@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unsubscriptable-object,unused-import
+from anki.lang import _
+# Form implementation generated from reading ui file 'designer/batchedit.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(821, 572)
+        self.verticalLayoutWidget = QtWidgets.QWidget(Dialog)
+        self.verticalLayoutWidget.setGeometry(QtCore.QRect(0, 0, 801, 561))
+        self.verticalLayoutWidget.setObjectName("verticalLayoutWidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.verticalLayoutWidget)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label = QtWidgets.QLabel(self.verticalLayoutWidget)
+        self.label.setObjectName("label")
+        self.verticalLayout.addWidget(self.label)
+        self.textToAdd = QtWidgets.QTextEdit(self.verticalLayoutWidget)
+        self.textToAdd.setObjectName("textToAdd")
+        self.verticalLayout.addWidget(self.textToAdd)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_3 = QtWidgets.QLabel(self.verticalLayoutWidget)
+        self.label_3.setObjectName("label_3")
+        self.horizontalLayout_2.addWidget(self.label_3)
+        self.field = QtWidgets.QComboBox(self.verticalLayoutWidget)
+        self.field.setObjectName("field")
+        self.horizontalLayout_2.addWidget(self.field)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.insertAsHtml = QtWidgets.QCheckBox(self.verticalLayoutWidget)
+        self.insertAsHtml.setObjectName("insertAsHtml")
+        self.horizontalLayout.addWidget(self.insertAsHtml)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem1)
+        self.buttonBox = QtWidgets.QDialogButtonBox(self.verticalLayoutWidget)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel)
+        self.buttonBox.setObjectName("buttonBox")
+        self.horizontalLayout.addWidget(self.buttonBox)
+        self.addAfter = QtWidgets.QPushButton(self.verticalLayoutWidget)
+        self.addAfter.setObjectName("addAfter")
+        self.horizontalLayout.addWidget(self.addAfter)
+        self.addBefore = QtWidgets.QPushButton(self.verticalLayoutWidget)
+        self.addBefore.setObjectName("addBefore")
+        self.horizontalLayout.addWidget(self.addBefore)
+        self.replace = QtWidgets.QPushButton(self.verticalLayoutWidget)
+        self.replace.setObjectName("replace")
+        self.horizontalLayout.addWidget(self.replace)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_("Dialog"))
+        self.label.setText(_("Content to add to or replace with:"))
+        self.label_3.setText(_("In this field:"))
+        self.insertAsHtml.setText(_("Insert as HTML"))
+        self.addAfter.setText(_("Add &after"))
+        self.addBefore.setText(_("Add &before"))
+        self.replace.setText(_("&Replace"))
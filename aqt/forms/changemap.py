@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unsubscriptable-object,unused-import
+from anki.lang import _
+# Form implementation generated from reading ui file 'designer/changemap.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ChangeMap(object):
+    def setupUi(self, ChangeMap):
+        ChangeMap.setObjectName("ChangeMap")
+        ChangeMap.resize(391, 360)
+        self.vboxlayout = QtWidgets.QVBoxLayout(ChangeMap)
+        self.vboxlayout.setObjectName("vboxlayout")
+        self.label = QtWidgets.QLabel(ChangeMap)
+        self.label.setWordWrap(True)
+        self.label.setObjectName("label")
+        self.vboxlayout.addWidget(self.label)
+        self.fields = QtWidgets.QListWidget(ChangeMap)
+        self.fields.setObjectName("fields")
+        self.vboxlayout.addWidget(self.fields)
+        self.buttonBox = QtWidgets.QDialogButtonBox(ChangeMap)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.vboxlayout.addWidget(self.buttonBox)
+
+        self.retranslateUi(ChangeMap)
+        self.buttonBox.accepted.connect(ChangeMap.accept) # type: ignore
+        self.buttonBox.rejected.connect(ChangeMap.reject) # type: ignore
+        self.fields.doubleClicked['QModelIndex'].connect(ChangeMap.accept) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(ChangeMap)
+
+    def retranslateUi(self, ChangeMap):
+        _translate = QtCore.QCoreApplication.translate
+        ChangeMap.setWindowTitle(_("Import"))
+        self.label.setText(_("Target field:"))
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unsubscriptable-object,unused-import
+from anki.lang import _
+# Form implementation generated from reading ui file 'designer/customstudy.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(351, 460)
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.radioAhead = QtWidgets.QRadioButton(Dialog)
+        self.radioAhead.setObjectName("radioAhead")
+        self.gridLayout.addWidget(self.radioAhead, 3, 0, 1, 1)
+        self.radioForgot = QtWidgets.QRadioButton(Dialog)
+        self.radioForgot.setObjectName("radioForgot")
+        self.gridLayout.addWidget(self.radioForgot, 2, 0, 1, 1)
+        self.radioNew = QtWidgets.QRadioButton(Dialog)
+        self.radioNew.setObjectName("radioNew")
+        self.gridLayout.addWidget(self.radioNew, 0, 0, 1, 1)
+        self.radioRev = QtWidgets.QRadioButton(Dialog)
+        self.radioRev.setObjectName("radioRev")
+        self.gridLayout.addWidget(self.radioRev, 1, 0, 1, 1)
+        self.radioCram = QtWidgets.QRadioButton(Dialog)
+        self.radioCram.setObjectName("radioCram")
+        self.gridLayout.addWidget(self.radioCram, 5, 0, 1, 1)
+        self.radioPreview = QtWidgets.QRadioButton(Dialog)
+        self.radioPreview.setObjectName("radioPreview")
+        self.gridLayout.addWidget(self.radioPreview, 4, 0, 1, 1)
+        self.verticalLayout.addLayout(self.gridLayout)
+        self.groupBox = QtWidgets.QGroupBox(Dialog)
+        self.groupBox.setTitle("")
+        self.groupBox.setObjectName("groupBox")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.title = QtWidgets.QLabel(self.groupBox)
+        self.title.setText("...")
+        self.title.setObjectName("title")
+        self.verticalLayout_2.addWidget(self.title)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.preSpin = QtWidgets.QLabel(self.groupBox)
+        self.preSpin.setText("...")
+        self.preSpin.setObjectName("preSpin")
+        self.horizontalLayout.addWidget(self.preSpin)
+        self.spin = QtWidgets.QSpinBox(self.groupBox)
+        self.spin.setObjectName("spin")
+        self.horizontalLayout.addWidget(self.spin)
+        self.postSpin = QtWidgets.QLabel(self.groupBox)
+        self.postSpin.setText("...")
+        self.postSpin.setObjectName("postSpin")
+        self.horizontalLayout.addWidget(self.postSpin)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+        self.cardType = QtWidgets.QListWidget(self.groupBox)
+        self.cardType.setObjectName("cardType")
+        item = QtWidgets.QListWidgetItem()
+        self.cardType.addItem(item)
+        item = QtWidgets.QListWidgetItem()
+        self.cardType.addItem(item)
+        item = QtWidgets.QListWidgetItem()
+        self.cardType.addItem(item)
+        item = QtWidgets.QListWidgetItem()
+        self.cardType.addItem(item)
+        self.verticalLayout_2.addWidget(self.cardType)
+        self.verticalLayout.addWidget(self.groupBox)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem1)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+
+        self.retranslateUi(Dialog)
+        self.cardType.setCurrentRow(0)
+        self.buttonBox.accepted.connect(Dialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+        Dialog.setTabOrder(self.radioNew, self.radioRev)
+        Dialog.setTabOrder(self.radioRev, self.radioForgot)
+        Dialog.setTabOrder(self.radioForgot, self.radioAhead)
+        Dialog.setTabOrder(self.radioAhead, self.radioPreview)
+        Dialog.setTabOrder(self.radioPreview, self.radioCram)
+        Dialog.setTabOrder(self.radioCram, self.spin)
+        Dialog.setTabOrder(self.spin, self.cardType)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_("Custom Study"))
+        self.radioAhead.setText(_("Review ahead"))
+        self.radioForgot.setText(_("Review forgotten cards"))
+        self.radioNew.setText(_("Increase today\'s new card limit"))
+        self.radioRev.setText(_("Increase today\'s review card limit"))
+        self.radioCram.setText(_("Study by card state or tag"))
+        self.radioPreview.setText(_("Preview new cards"))
+        __sortingEnabled = self.cardType.isSortingEnabled()
+        self.cardType.setSortingEnabled(False)
+        item = self.cardType.item(0)
+        item.setText(_("New cards only"))
+        item = self.cardType.item(1)
+        item.setText(_("Due cards only"))
+        item = self.cardType.item(2)
+        item.setText(_("All review cards in random order"))
+        item = self.cardType.item(3)
+        item.setText(_("All cards in random order (don\'t reschedule)"))
+        self.cardType.setSortingEnabled(__sortingEnabled)
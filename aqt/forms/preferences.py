@@ -0,0 +1,690 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unsubscriptable-object,unused-import
+from anki.lang import _
+# Form implementation generated from reading ui file 'designer/preferences.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Preferences(object):
+    def setupUi(self, Preferences):
+        Preferences.setObjectName("Preferences")
+        Preferences.resize(423, 508)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(Preferences)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.Color = QtWidgets.QTabWidget(Preferences)
+        self.Color.setFocusPolicy(QtCore.Qt.StrongFocus)
+        self.Color.setObjectName("Color")
+        self.tab_1 = QtWidgets.QWidget()
+        self.tab_1.setObjectName("tab_1")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.tab_1)
+        self.verticalLayout.setContentsMargins(12, 12, 12, 12)
+        self.verticalLayout.setSpacing(12)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label = QtWidgets.QLabel(self.tab_1)
+        self.label.setObjectName("label")
+        self.horizontalLayout_2.addWidget(self.label)
+        self.lang = QtWidgets.QComboBox(self.tab_1)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lang.sizePolicy().hasHeightForWidth())
+        self.lang.setSizePolicy(sizePolicy)
+        self.lang.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.lang.setObjectName("lang")
+        self.horizontalLayout_2.addWidget(self.lang)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.hwAccel = QtWidgets.QCheckBox(self.tab_1)
+        self.hwAccel.setObjectName("hwAccel")
+        self.verticalLayout.addWidget(self.hwAccel)
+        self.estTimes = QtWidgets.QCheckBox(self.tab_1)
+        self.estTimes.setObjectName("estTimes")
+        self.verticalLayout.addWidget(self.estTimes)
+        self.dueCounts = QtWidgets.QCheckBox(self.tab_1)
+        self.dueCounts.setObjectName("dueCounts")
+        self.verticalLayout.addWidget(self.dueCounts)
+        self.pastePNG = QtWidgets.QCheckBox(self.tab_1)
+        self.pastePNG.setObjectName("pastePNG")
+        self.verticalLayout.addWidget(self.pastePNG)
+        self.nightMode = QtWidgets.QCheckBox(self.tab_1)
+        self.nightMode.setObjectName("nightMode")
+        self.verticalLayout.addWidget(self.nightMode)
+        self.dayLearnFirst = QtWidgets.QCheckBox(self.tab_1)
+        self.dayLearnFirst.setObjectName("dayLearnFirst")
+        self.verticalLayout.addWidget(self.dayLearnFirst)
+        self.newSched = QtWidgets.QCheckBox(self.tab_1)
+        self.newSched.setObjectName("newSched")
+        self.verticalLayout.addWidget(self.newSched)
+        self.addToCur = QtWidgets.QComboBox(self.tab_1)
+        self.addToCur.setObjectName("addToCur")
+        self.addToCur.addItem("")
+        self.addToCur.addItem("")
+        self.verticalLayout.addWidget(self.addToCur)
+        self.newSpread = QtWidgets.QComboBox(self.tab_1)
+        self.newSpread.setObjectName("newSpread")
+        self.verticalLayout.addWidget(self.newSpread)
+        self.gridLayout_4 = QtWidgets.QGridLayout()
+        self.gridLayout_4.setSpacing(12)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.label_23 = QtWidgets.QLabel(self.tab_1)
+        self.label_23.setObjectName("label_23")
+        self.gridLayout_4.addWidget(self.label_23, 0, 0, 1, 1)
+        self.rollover = QtWidgets.QSpinBox(self.tab_1)
+        self.rollover.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.rollover.setMaximum(23)
+        self.rollover.setObjectName("rollover")
+        self.gridLayout_4.addWidget(self.rollover, 0, 1, 1, 1)
+        self.label_24 = QtWidgets.QLabel(self.tab_1)
+        self.label_24.setObjectName("label_24")
+        self.gridLayout_4.addWidget(self.label_24, 1, 0, 1, 1)
+        self.collapseTime = QtWidgets.QSpinBox(self.tab_1)
+        self.collapseTime.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.collapseTime.setMaximum(999)
+        self.collapseTime.setObjectName("collapseTime")
+        self.gridLayout_4.addWidget(self.collapseTime, 1, 1, 1, 1)
+        self.label_29 = QtWidgets.QLabel(self.tab_1)
+        self.label_29.setObjectName("label_29")
+        self.gridLayout_4.addWidget(self.label_29, 1, 2, 1, 1)
+        self.label_30 = QtWidgets.QLabel(self.tab_1)
+        self.label_30.setObjectName("label_30")
+        self.gridLayout_4.addWidget(self.label_30, 2, 0, 1, 1)
+        self.timeLim = QtWidgets.QSpinBox(self.tab_1)
+        self.timeLim.setMaximum(9999)
+        self.timeLim.setObjectName("timeLim")
+        self.gridLayout_4.addWidget(self.timeLim, 2, 1, 1, 1)
+        self.label_39 = QtWidgets.QLabel(self.tab_1)
+        self.label_39.setObjectName("label_39")
+        self.gridLayout_4.addWidget(self.label_39, 2, 2, 1, 1)
+        self.label_40 = QtWidgets.QLabel(self.tab_1)
+        self.label_40.setObjectName("label_40")
+        self.gridLayout_4.addWidget(self.label_40, 0, 2, 1, 1)
+        self.verticalLayout.addLayout(self.gridLayout_4)
+        spacerItem = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.Color.addTab(self.tab_1, "")
+        self.tab_2 = QtWidgets.QWidget()
+        self.tab_2.setObjectName("tab_2")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.tab_2)
+        self.verticalLayout_4.setContentsMargins(12, 12, 12, 12)
+        self.verticalLayout_4.setSpacing(12)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.hboxlayout = QtWidgets.QHBoxLayout()
+        self.hboxlayout.setSpacing(10)
+        self.hboxlayout.setObjectName("hboxlayout")
+        self.vboxlayout = QtWidgets.QVBoxLayout()
+        self.vboxlayout.setObjectName("vboxlayout")
+        self.syncLabel = QtWidgets.QLabel(self.tab_2)
+        self.syncLabel.setWordWrap(True)
+        self.syncLabel.setOpenExternalLinks(True)
+        self.syncLabel.setObjectName("syncLabel")
+        self.vboxlayout.addWidget(self.syncLabel)
+        self.syncMedia = QtWidgets.QCheckBox(self.tab_2)
+        self.syncMedia.setObjectName("syncMedia")
+        self.vboxlayout.addWidget(self.syncMedia)
+        self.syncAddons = QtWidgets.QCheckBox(self.tab_2)
+        self.syncAddons.setObjectName("syncAddons")
+        self.vboxlayout.addWidget(self.syncAddons)
+        self.autoSync = QtWidgets.QCheckBox(self.tab_2)
+        self.autoSync.setObjectName("autoSync")
+        self.vboxlayout.addWidget(self.autoSync)
+        self.fullSync = QtWidgets.QCheckBox(self.tab_2)
+        self.fullSync.setObjectName("fullSync")
+        self.vboxlayout.addWidget(self.fullSync)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.syncDeauth = QtWidgets.QPushButton(self.tab_2)
+        self.syncDeauth.setAutoDefault(False)
+        self.syncDeauth.setObjectName("syncDeauth")
+        self.horizontalLayout.addWidget(self.syncDeauth)
+        self.syncUser = QtWidgets.QLabel(self.tab_2)
+        self.syncUser.setText("")
+        self.syncUser.setObjectName("syncUser")
+        self.horizontalLayout.addWidget(self.syncUser)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 1, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem1)
+        self.vboxlayout.addLayout(self.horizontalLayout)
+        self.hboxlayout.addLayout(self.vboxlayout)
+        self.verticalLayout_4.addLayout(self.hboxlayout)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_4.addItem(spacerItem2)
+        self.Color.addTab(self.tab_2, "")
+        self.tab = QtWidgets.QWidget()
+        self.tab.setObjectName("tab")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.tab)
+        self.verticalLayout_3.setContentsMargins(12, 12, 12, 12)
+        self.verticalLayout_3.setSpacing(12)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.label_9 = QtWidgets.QLabel(self.tab)
+        self.label_9.setWordWrap(True)
+        self.label_9.setObjectName("label_9")
+        self.verticalLayout_3.addWidget(self.label_9)
+        self.gridLayout_2 = QtWidgets.QGridLayout()
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.label_10 = QtWidgets.QLabel(self.tab)
+        self.label_10.setObjectName("label_10")
+        self.gridLayout_2.addWidget(self.label_10, 0, 0, 1, 1)
+        self.numBackups = QtWidgets.QSpinBox(self.tab)
+        self.numBackups.setMinimumSize(QtCore.QSize(60, 0))
+        self.numBackups.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.numBackups.setObjectName("numBackups")
+        self.gridLayout_2.addWidget(self.numBackups, 0, 1, 1, 1)
+        self.label_11 = QtWidgets.QLabel(self.tab)
+        self.label_11.setObjectName("label_11")
+        self.gridLayout_2.addWidget(self.label_11, 0, 2, 1, 1)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_2.addItem(spacerItem3, 0, 3, 1, 1)
+        self.verticalLayout_3.addLayout(self.gridLayout_2)
+        self.longTermBackUp = QtWidgets.QCheckBox(self.tab)
+        self.longTermBackUp.setChecked(True)
+        self.longTermBackUp.setObjectName("longTermBackUp")
+        self.verticalLayout_3.addWidget(self.longTermBackUp)
+        self.openBackupFolder = QtWidgets.QLabel(self.tab)
+        self.openBackupFolder.setObjectName("openBackupFolder")
+        self.verticalLayout_3.addWidget(self.openBackupFolder)
+        self.label_4 = QtWidgets.QLabel(self.tab)
+        self.label_4.setWordWrap(True)
+        self.label_4.setObjectName("label_4")
+        self.verticalLayout_3.addWidget(self.label_4)
+        spacerItem4 = QtWidgets.QSpacerItem(20, 59, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_3.addItem(spacerItem4)
+        self.label_21 = QtWidgets.QLabel(self.tab)
+        self.label_21.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_21.setObjectName("label_21")
+        self.verticalLayout_3.addWidget(self.label_21)
+        self.Color.addTab(self.tab, "")
+        self.tab_4 = QtWidgets.QWidget()
+        self.tab_4.setObjectName("tab_4")
+        self.verticalLayout1 = QtWidgets.QVBoxLayout(self.tab_4)
+        self.verticalLayout1.setContentsMargins(12, 12, 12, 12)
+        self.verticalLayout1.setSpacing(12)
+        self.verticalLayout1.setObjectName("verticalLayout1")
+        self.label_12 = QtWidgets.QLabel(self.tab_4)
+        self.label_12.setWordWrap(True)
+        self.label_12.setObjectName("label_12")
+        self.verticalLayout1.addWidget(self.label_12)
+        self.allowDuplicateFirstField = QtWidgets.QCheckBox(self.tab_4)
+        self.allowDuplicateFirstField.setChecked(True)
+        self.allowDuplicateFirstField.setObjectName("allowDuplicateFirstField")
+        self.verticalLayout1.addWidget(self.allowDuplicateFirstField)
+        self.label_121 = QtWidgets.QLabel(self.tab_4)
+        self.label_121.setWordWrap(True)
+        self.label_121.setObjectName("label_121")
+        self.verticalLayout1.addWidget(self.label_121)
+        self.line = QtWidgets.QFrame(self.tab_4)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout1.addWidget(self.line)
+        self.allowEmptyFirstField = QtWidgets.QCheckBox(self.tab_4)
+        self.allowEmptyFirstField.setChecked(True)
+        self.allowEmptyFirstField.setObjectName("allowEmptyFirstField")
+        self.verticalLayout1.addWidget(self.allowEmptyFirstField)
+        self.compileLaTeX = QtWidgets.QCheckBox(self.tab_4)
+        self.compileLaTeX.setObjectName("compileLaTeX")
+        self.verticalLayout1.addWidget(self.compileLaTeX)
+        self.browserOnMissingMedia = QtWidgets.QCheckBox(self.tab_4)
+        self.browserOnMissingMedia.setObjectName("browserOnMissingMedia")
+        self.verticalLayout1.addWidget(self.browserOnMissingMedia)
+        self.label_2 = QtWidgets.QLabel(self.tab_4)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout1.addWidget(self.label_2)
+        self.preserveCreation = QtWidgets.QCheckBox(self.tab_4)
+        self.preserveCreation.setObjectName("preserveCreation")
+        self.verticalLayout1.addWidget(self.preserveCreation)
+        self.exportSiblings = QtWidgets.QCheckBox(self.tab_4)
+        self.exportSiblings.setObjectName("exportSiblings")
+        self.verticalLayout1.addWidget(self.exportSiblings)
+        self.preserveReviewInfo = QtWidgets.QCheckBox(self.tab_4)
+        self.preserveReviewInfo.setObjectName("preserveReviewInfo")
+        self.verticalLayout1.addWidget(self.preserveReviewInfo)
+        self.copyLog = QtWidgets.QCheckBox(self.tab_4)
+        self.copyLog.setObjectName("copyLog")
+        self.verticalLayout1.addWidget(self.copyLog)
+        self.keepEmptyNote = QtWidgets.QCheckBox(self.tab_4)
+        self.keepEmptyNote.setObjectName("keepEmptyNote")
+        self.verticalLayout1.addWidget(self.keepEmptyNote)
+        self.label_21 = QtWidgets.QLabel(self.tab_4)
+        self.label_21.setObjectName("label_21")
+        self.verticalLayout1.addWidget(self.label_21)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.AddCardsMultipleTime = QtWidgets.QCheckBox(self.tab_4)
+        self.AddCardsMultipleTime.setObjectName("AddCardsMultipleTime")
+        self.horizontalLayout_3.addWidget(self.AddCardsMultipleTime)
+        self.BrowserMultipleTime = QtWidgets.QCheckBox(self.tab_4)
+        self.BrowserMultipleTime.setObjectName("BrowserMultipleTime")
+        self.horizontalLayout_3.addWidget(self.BrowserMultipleTime)
+        self.EditCurrentMultipleTime = QtWidgets.QCheckBox(self.tab_4)
+        self.EditCurrentMultipleTime.setObjectName("EditCurrentMultipleTime")
+        self.horizontalLayout_3.addWidget(self.EditCurrentMultipleTime)
+        self.OtherWindowsMultipleTime = QtWidgets.QCheckBox(self.tab_4)
+        self.OtherWindowsMultipleTime.setObjectName("OtherWindowsMultipleTime")
+        self.horizontalLayout_3.addWidget(self.OtherWindowsMultipleTime)
+        self.verticalLayout1.addLayout(self.horizontalLayout_3)
+        spacerItem5 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout1.addItem(spacerItem5)
+        self.label_5 = QtWidgets.QLabel(self.tab_4)
+        self.label_5.setScaledContents(False)
+        self.label_5.setWordWrap(True)
+        self.label_5.setObjectName("label_5")
+        self.verticalLayout1.addWidget(self.label_5)
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setRowWrapPolicy(QtWidgets.QFormLayout.WrapLongRows)
+        self.formLayout.setObjectName("formLayout")
+        self.label_22 = QtWidgets.QLabel(self.tab_4)
+        self.label_22.setObjectName("label_22")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label_22)
+        self.factorAddDay = QtWidgets.QDoubleSpinBox(self.tab_4)
+        self.factorAddDay.setMaximum(1.0)
+        self.factorAddDay.setSingleStep(0.1)
+        self.factorAddDay.setProperty("value", 0.33)
+        self.factorAddDay.setObjectName("factorAddDay")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.factorAddDay)
+        self.label_3 = QtWidgets.QLabel(self.tab_4)
+        self.label_3.setObjectName("label_3")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_3)
+        self.factorRemoveDay = QtWidgets.QDoubleSpinBox(self.tab_4)
+        self.factorRemoveDay.setMaximum(1.0)
+        self.factorRemoveDay.setSingleStep(0.1)
+        self.factorRemoveDay.setProperty("value", 0.33)
+        self.factorRemoveDay.setObjectName("factorRemoveDay")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.factorRemoveDay)
+        self.verticalLayout1.addLayout(self.formLayout)
+        self.Color.addTab(self.tab_4, "")
+        self.tab_41 = QtWidgets.QWidget()
+        self.tab_41.setObjectName("tab_41")
+        self.verticalLayout2 = QtWidgets.QVBoxLayout(self.tab_41)
+        self.verticalLayout2.setContentsMargins(12, 12, 12, 12)
+        self.verticalLayout2.setSpacing(12)
+        self.verticalLayout2.setObjectName("verticalLayout2")
+        self.label_23 = QtWidgets.QLabel(self.tab_41)
+        self.label_23.setObjectName("label_23")
+        self.verticalLayout2.addWidget(self.label_23)
+        self.newLineInBatchEdit = QtWidgets.QCheckBox(self.tab_41)
+        self.newLineInBatchEdit.setObjectName("newLineInBatchEdit")
+        self.verticalLayout2.addWidget(self.newLineInBatchEdit)
+        spacerItem6 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout2.addItem(spacerItem6)
+        self.Color.addTab(self.tab_41, "")
+        self.tab_5 = QtWidgets.QWidget()
+        self.tab_5.setObjectName("tab_5")
+        self.verticalLayout3 = QtWidgets.QVBoxLayout(self.tab_5)
+        self.verticalLayout3.setContentsMargins(12, 12, 12, 12)
+        self.verticalLayout3.setSpacing(12)
+        self.verticalLayout3.setObjectName("verticalLayout3")
+        self.label_31 = QtWidgets.QLabel(self.tab_5)
+        self.label_31.setObjectName("label_31")
+        self.verticalLayout3.addWidget(self.label_31)
+        self.minutesInBrowser = QtWidgets.QCheckBox(self.tab_5)
+        self.minutesInBrowser.setObjectName("minutesInBrowser")
+        self.verticalLayout3.addWidget(self.minutesInBrowser)
+        self.deckOverview = QtWidgets.QCheckBox(self.tab_5)
+        self.deckOverview.setObjectName("deckOverview")
+        self.verticalLayout3.addWidget(self.deckOverview)
+        self.keepSeenCard = QtWidgets.QCheckBox(self.tab_5)
+        self.keepSeenCard.setObjectName("keepSeenCard")
+        self.verticalLayout3.addWidget(self.keepSeenCard)
+        self.label_51 = QtWidgets.QLabel(self.tab_5)
+        self.label_51.setObjectName("label_51")
+        self.verticalLayout3.addWidget(self.label_51)
+        self.filesToKeep = QtWidgets.QLineEdit(self.tab_5)
+        self.filesToKeep.setObjectName("filesToKeep")
+        self.verticalLayout3.addWidget(self.filesToKeep)
+        self.horizontalLayout_31 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_31.setObjectName("horizontalLayout_31")
+        self.label_52 = QtWidgets.QLabel(self.tab_5)
+        self.label_52.setObjectName("label_52")
+        self.horizontalLayout_31.addWidget(self.label_52)
+        self.browserFromReviewer = QtWidgets.QComboBox(self.tab_5)
+        self.browserFromReviewer.setObjectName("browserFromReviewer")
+        self.browserFromReviewer.addItem("")
+        self.browserFromReviewer.addItem("")
+        self.browserFromReviewer.addItem("")
+        self.horizontalLayout_31.addWidget(self.browserFromReviewer)
+        self.verticalLayout3.addLayout(self.horizontalLayout_31)
+        self.horizontalLayout_32 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_32.setObjectName("horizontalLayout_32")
+        self.label_53 = QtWidgets.QLabel(self.tab_5)
+        self.label_53.setObjectName("label_53")
+        self.horizontalLayout_32.addWidget(self.label_53)
+        self.fontSize = QtWidgets.QSpinBox(self.tab_5)
+        self.fontSize.setObjectName("fontSize")
+        self.horizontalLayout_32.addWidget(self.fontSize)
+        self.verticalLayout3.addLayout(self.horizontalLayout_32)
+        spacerItem7 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout3.addItem(spacerItem7)
+        self.Color.addTab(self.tab_5, "")
+        self.tab_42 = QtWidgets.QWidget()
+        self.tab_42.setObjectName("tab_42")
+        self.verticalLayout_31 = QtWidgets.QGridLayout(self.tab_42)
+        self.verticalLayout_31.setContentsMargins(12, 12, 12, 12)
+        self.verticalLayout_31.setObjectName("verticalLayout_31")
+        self.label_24 = QtWidgets.QLabel(self.tab_42)
+        self.label_24.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_24.setObjectName("label_24")
+        self.verticalLayout_31.addWidget(self.label_24, 0, 0, 1, 1)
+        self.newButton = QtWidgets.QPushButton(self.tab_42)
+        self.newButton.setText("")
+        self.newButton.setObjectName("newButton")
+        self.verticalLayout_31.addWidget(self.newButton, 0, 1, 1, 1)
+        self.label_25 = QtWidgets.QLabel(self.tab_42)
+        self.label_25.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_25.setObjectName("label_25")
+        self.verticalLayout_31.addWidget(self.label_25, 1, 0, 1, 1)
+        self.dueButton = QtWidgets.QPushButton(self.tab_42)
+        self.dueButton.setText("")
+        self.dueButton.setObjectName("dueButton")
+        self.verticalLayout_31.addWidget(self.dueButton, 1, 1, 1, 1)
+        self.label_26 = QtWidgets.QLabel(self.tab_42)
+        self.label_26.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_26.setObjectName("label_26")
+        self.verticalLayout_31.addWidget(self.label_26, 2, 0, 1, 1)
+        self.learnButton = QtWidgets.QPushButton(self.tab_42)
+        self.learnButton.setText("")
+        self.learnButton.setObjectName("learnButton")
+        self.verticalLayout_31.addWidget(self.learnButton, 2, 1, 1, 1)
+        self.label_27 = QtWidgets.QLabel(self.tab_42)
+        self.label_27.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_27.setObjectName("label_27")
+        self.verticalLayout_31.addWidget(self.label_27, 4, 0, 1, 1)
+        self.revButton = QtWidgets.QPushButton(self.tab_42)
+        self.revButton.setText("")
+        self.revButton.setObjectName("revButton")
+        self.verticalLayout_31.addWidget(self.revButton, 4, 1, 1, 1)
+        self.label_28 = QtWidgets.QLabel(self.tab_42)
+        self.label_28.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_28.setObjectName("label_28")
+        self.verticalLayout_31.addWidget(self.label_28, 5, 0, 1, 1)
+        self.gradButton = QtWidgets.QPushButton(self.tab_42)
+        self.gradButton.setText("")
+        self.gradButton.setObjectName("gradButton")
+        self.verticalLayout_31.addWidget(self.gradButton, 5, 1, 1, 1)
+        self.label_29 = QtWidgets.QLabel(self.tab_42)
+        self.label_29.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_29.setObjectName("label_29")
+        self.verticalLayout_31.addWidget(self.label_29, 6, 0, 1, 1)
+        self.youngButton = QtWidgets.QPushButton(self.tab_42)
+        self.youngButton.setText("")
+        self.youngButton.setObjectName("youngButton")
+        self.verticalLayout_31.addWidget(self.youngButton, 6, 1, 1, 1)
+        self.label_210 = QtWidgets.QLabel(self.tab_42)
+        self.label_210.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_210.setObjectName("label_210")
+        self.verticalLayout_31.addWidget(self.label_210, 7, 0, 1, 1)
+        self.matureButton = QtWidgets.QPushButton(self.tab_42)
+        self.matureButton.setText("")
+        self.matureButton.setObjectName("matureButton")
+        self.verticalLayout_31.addWidget(self.matureButton, 7, 1, 1, 1)
+        self.label_211 = QtWidgets.QLabel(self.tab_42)
+        self.label_211.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_211.setObjectName("label_211")
+        self.verticalLayout_31.addWidget(self.label_211, 8, 0, 1, 1)
+        self.unseenButton = QtWidgets.QPushButton(self.tab_42)
+        self.unseenButton.setText("")
+        self.unseenButton.setObjectName("unseenButton")
+        self.verticalLayout_31.addWidget(self.unseenButton, 8, 1, 1, 1)
+        self.label_212 = QtWidgets.QLabel(self.tab_42)
+        self.label_212.setToolTip("")
+        self.label_212.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_212.setObjectName("label_212")
+        self.verticalLayout_31.addWidget(self.label_212, 9, 0, 1, 1)
+        self.suspButton = QtWidgets.QPushButton(self.tab_42)
+        self.suspButton.setText("")
+        self.suspButton.setObjectName("suspButton")
+        self.verticalLayout_31.addWidget(self.suspButton, 9, 1, 1, 1)
+        self.label_213 = QtWidgets.QLabel(self.tab_42)
+        self.label_213.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_213.setObjectName("label_213")
+        self.verticalLayout_31.addWidget(self.label_213, 10, 0, 1, 1)
+        self.userBuriedButton = QtWidgets.QPushButton(self.tab_42)
+        self.userBuriedButton.setText("")
+        self.userBuriedButton.setObjectName("userBuriedButton")
+        self.verticalLayout_31.addWidget(self.userBuriedButton, 10, 1, 1, 1)
+        self.label_214 = QtWidgets.QLabel(self.tab_42)
+        self.label_214.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_214.setObjectName("label_214")
+        self.verticalLayout_31.addWidget(self.label_214, 11, 0, 1, 1)
+        self.schedBuriedButton = QtWidgets.QPushButton(self.tab_42)
+        self.schedBuriedButton.setText("")
+        self.schedBuriedButton.setObjectName("schedBuriedButton")
+        self.verticalLayout_31.addWidget(self.schedBuriedButton, 11, 1, 1, 1)
+        self.label_215 = QtWidgets.QLabel(self.tab_42)
+        self.label_215.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_215.setObjectName("label_215")
+        self.verticalLayout_31.addWidget(self.label_215, 13, 0, 1, 1)
+        self.cramButton = QtWidgets.QPushButton(self.tab_42)
+        self.cramButton.setText("")
+        self.cramButton.setObjectName("cramButton")
+        self.verticalLayout_31.addWidget(self.cramButton, 13, 1, 1, 1)
+        self.label_216 = QtWidgets.QLabel(self.tab_42)
+        self.label_216.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_216.setObjectName("label_216")
+        self.verticalLayout_31.addWidget(self.label_216, 14, 0, 1, 1)
+        self.cumButton = QtWidgets.QPushButton(self.tab_42)
+        self.cumButton.setText("")
+        self.cumButton.setObjectName("cumButton")
+        self.verticalLayout_31.addWidget(self.cumButton, 14, 1, 1, 1)
+        self.relearnButton = QtWidgets.QPushButton(self.tab_42)
+        self.relearnButton.setText("")
+        self.relearnButton.setObjectName("relearnButton")
+        self.verticalLayout_31.addWidget(self.relearnButton, 3, 1, 1, 1)
+        self.label_32 = QtWidgets.QLabel(self.tab_42)
+        self.label_32.setObjectName("label_32")
+        self.verticalLayout_31.addWidget(self.label_32, 3, 0, 1, 1)
+        self.label_54 = QtWidgets.QLabel(self.tab_42)
+        self.label_54.setObjectName("label_54")
+        self.verticalLayout_31.addWidget(self.label_54, 15, 0, 1, 1)
+        self.ivlButton = QtWidgets.QPushButton(self.tab_42)
+        self.ivlButton.setText("")
+        self.ivlButton.setObjectName("ivlButton")
+        self.verticalLayout_31.addWidget(self.ivlButton, 15, 1, 1, 1)
+        self.label_217 = QtWidgets.QLabel(self.tab_42)
+        self.label_217.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        self.label_217.setObjectName("label_217")
+        self.verticalLayout_31.addWidget(self.label_217, 21, 0, 1, 1)
+        self.markedButton = QtWidgets.QPushButton(self.tab_42)
+        self.markedButton.setText("")
+        self.markedButton.setObjectName("markedButton")
+        self.verticalLayout_31.addWidget(self.markedButton, 21, 1, 1, 1)
+        self.label_6 = QtWidgets.QLabel(self.tab_42)
+        self.label_6.setObjectName("label_6")
+        self.verticalLayout_31.addWidget(self.label_6, 16, 0, 1, 1)
+        self.hourButton = QtWidgets.QPushButton(self.tab_42)
+        self.hourButton.setText("")
+        self.hourButton.setObjectName("hourButton")
+        self.verticalLayout_31.addWidget(self.hourButton, 16, 1, 1, 1)
+        self.label_61 = QtWidgets.QLabel(self.tab_42)
+        self.label_61.setObjectName("label_61")
+        self.verticalLayout_31.addWidget(self.label_61, 17, 0, 1, 1)
+        self.flag1Button = QtWidgets.QPushButton(self.tab_42)
+        self.flag1Button.setText("")
+        self.flag1Button.setObjectName("flag1Button")
+        self.verticalLayout_31.addWidget(self.flag1Button, 17, 1, 1, 1)
+        self.label_62 = QtWidgets.QLabel(self.tab_42)
+        self.label_62.setObjectName("label_62")
+        self.verticalLayout_31.addWidget(self.label_62, 18, 0, 1, 1)
+        self.flag2Button = QtWidgets.QPushButton(self.tab_42)
+        self.flag2Button.setText("")
+        self.flag2Button.setObjectName("flag2Button")
+        self.verticalLayout_31.addWidget(self.flag2Button, 18, 1, 1, 1)
+        self.label_63 = QtWidgets.QLabel(self.tab_42)
+        self.label_63.setObjectName("label_63")
+        self.verticalLayout_31.addWidget(self.label_63, 19, 0, 1, 1)
+        self.flag3Button = QtWidgets.QPushButton(self.tab_42)
+        self.flag3Button.setText("")
+        self.flag3Button.setObjectName("flag3Button")
+        self.verticalLayout_31.addWidget(self.flag3Button, 19, 1, 1, 1)
+        self.label_64 = QtWidgets.QLabel(self.tab_42)
+        self.label_64.setObjectName("label_64")
+        self.verticalLayout_31.addWidget(self.label_64, 20, 0, 1, 1)
+        self.flag4Button = QtWidgets.QPushButton(self.tab_42)
+        self.flag4Button.setText("")
+        self.flag4Button.setObjectName("flag4Button")
+        self.verticalLayout_31.addWidget(self.flag4Button, 20, 1, 1, 1)
+        self.label_7 = QtWidgets.QLabel(self.tab_42)
+        self.label_7.setObjectName("label_7")
+        self.verticalLayout_31.addWidget(self.label_7, 12, 0, 1, 1)
+        self.buriedButton = QtWidgets.QPushButton(self.tab_42)
+        self.buriedButton.setText("")
+        self.buriedButton.setObjectName("buriedButton")
+        self.verticalLayout_31.addWidget(self.buriedButton, 12, 1, 1, 1)
+        self.Color.addTab(self.tab_42, "")
+        self.verticalLayout_2.addWidget(self.Color)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Preferences)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Close|QtWidgets.QDialogButtonBox.Help)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+        self.retranslateUi(Preferences)
+        self.Color.setCurrentIndex(0)
+        self.buttonBox.accepted.connect(Preferences.accept) # type: ignore
+        self.buttonBox.rejected.connect(Preferences.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Preferences)
+        Preferences.setTabOrder(self.lang, self.hwAccel)
+        Preferences.setTabOrder(self.hwAccel, self.estTimes)
+        Preferences.setTabOrder(self.estTimes, self.dueCounts)
+        Preferences.setTabOrder(self.dueCounts, self.pastePNG)
+        Preferences.setTabOrder(self.pastePNG, self.nightMode)
+        Preferences.setTabOrder(self.nightMode, self.dayLearnFirst)
+        Preferences.setTabOrder(self.dayLearnFirst, self.newSched)
+        Preferences.setTabOrder(self.newSched, self.addToCur)
+        Preferences.setTabOrder(self.addToCur, self.newSpread)
+        Preferences.setTabOrder(self.newSpread, self.rollover)
+        Preferences.setTabOrder(self.rollover, self.collapseTime)
+        Preferences.setTabOrder(self.collapseTime, self.timeLim)
+        Preferences.setTabOrder(self.timeLim, self.numBackups)
+        Preferences.setTabOrder(self.numBackups, self.autoSync)
+        Preferences.setTabOrder(self.autoSync, self.Color)
+        Preferences.setTabOrder(self.Color, self.fullSync)
+        Preferences.setTabOrder(self.fullSync, self.syncMedia)
+        Preferences.setTabOrder(self.syncMedia, self.syncDeauth)
+
+    def retranslateUi(self, Preferences):
+        _translate = QtCore.QCoreApplication.translate
+        Preferences.setWindowTitle(_("Preferences"))
+        self.label.setText(_("Interface language:"))
+        self.hwAccel.setText(_("Hardware acceleration (faster, may cause display issues)"))
+        self.estTimes.setText(_("Show next review time above answer buttons"))
+        self.dueCounts.setText(_("Show remaining card count during review"))
+        self.pastePNG.setText(_("Paste clipboard images as PNG"))
+        self.nightMode.setText(_("Show cards as white on black (night mode)"))
+        self.dayLearnFirst.setText(_("Show learning cards with larger steps before reviews"))
+        self.newSched.setText(_("Anki 2.1 scheduler"))
+        self.addToCur.setItemText(0, _("When adding, default to current deck"))
+        self.addToCur.setItemText(1, _("Change deck depending on note type"))
+        self.label_23.setText(_("Next day starts at"))
+        self.label_24.setText(_("Learn ahead limit"))
+        self.label_29.setText(_("mins"))
+        self.label_30.setText(_("Timebox time limit"))
+        self.label_39.setText(_("mins"))
+        self.label_40.setText(_("hours past midnight"))
+        self.Color.setTabText(self.Color.indexOf(self.tab_1), _("Basic"))
+        self.syncLabel.setText(_("<b>Synchronisation</b>"))
+        self.syncMedia.setText(_("Synchronize audio and images too"))
+        self.syncAddons.setText(_("Synchronize add-ons too"))
+        self.autoSync.setText(_("Automatically sync on profile open/close"))
+        self.fullSync.setText(_("On next sync, force changes in one direction"))
+        self.syncDeauth.setText(_("Deauthorize"))
+        self.Color.setTabText(self.Color.indexOf(self.tab_2), _("Network"))
+        self.label_9.setText(_("<b>Backups</b><br>Anki will create a backup of your collection each time it is closed or synchronized."))
+        self.label_10.setText(_("Keep"))
+        self.label_11.setText(_("backups"))
+        self.longTermBackUp.setText(_("Also keep some long term back-ups"))
+        self.openBackupFolder.setText(_("You can restore backups via File>Switch Profile."))
+        self.label_4.setText(_("Note: Media is not backed up. Please create a periodic backup of your Anki folder to be safe."))
+        self.label_21.setText(_("Some settings will take effect after you restart Anki."))
+        self.Color.setTabText(self.Color.indexOf(self.tab), _("Backups"))
+        self.label_12.setText(_("<html><head/><body><p>Configure how and when anki generate cards</p></body></html>"))
+        self.allowDuplicateFirstField.setText(_("Allow duplicate of first field in imports"))
+        self.label_121.setText(_("<html><head/><body><p>Configure how and when anki generate cards</p></body></html>"))
+        self.allowEmptyFirstField.setText(_("Allow empty first field"))
+        self.compileLaTeX.setText(_("Compile LaTeX as soon as it is written"))
+        self.browserOnMissingMedia.setText(_("In case of missing media, show  the notes in the browser."))
+        self.label_2.setText(_("This option adds a tag LaTeXError to cards with faulty LaTeX. "))
+        self.preserveCreation.setText(_("Note copy: preserve date of creation"))
+        self.exportSiblings.setText(_("Export siblings of exported cards"))
+        self.preserveReviewInfo.setText(_("Note copy: preserve easyness, interval, due date, ..."))
+        self.copyLog.setText(_("Note copy: Copy log"))
+        self.keepEmptyNote.setText(_("When a note has no more card, warns instead of deleting it."))
+        self.label_21.setText(_("<html><head/><body><p><span style=\" font-weight:600;\">Which window can be opened multiple time</span></p></body></html>"))
+        self.AddCardsMultipleTime.setText(_("Add Cards"))
+        self.BrowserMultipleTime.setText(_("Browser"))
+        self.EditCurrentMultipleTime.setText(_("Edit Cards"))
+        self.OtherWindowsMultipleTime.setText(_("Other"))
+        self.label_5.setText(_("When you post pone cards, how much should anki take into account the fact this postponing to compute the new delays ?"))
+        self.label_22.setText(_("When adding days"))
+        self.label_3.setText(_("When removing days"))
+        self.Color.setTabText(self.Color.indexOf(self.tab_4), _("Processing"))
+        self.label_23.setText(_("Configure the different action you can take to edit cards"))
+        self.newLineInBatchEdit.setText(_("Add new line when batch editing fields"))
+        self.Color.setTabText(self.Color.indexOf(self.tab_41), _("Edition"))
+        self.label_31.setText(_("Configure the graphical user interface."))
+        self.minutesInBrowser.setText(_("Show hours and minutes in the Browser"))
+        self.deckOverview.setText(_("See overview before reviewing."))
+        self.keepSeenCard.setToolTip(_("When you do \"Check > Cards...\", you won\'t delete cards you already reviewed once. This will allow you to correct their template if necessary without loosing your review history."))
+        self.keepSeenCard.setText(_("Delete empty cards only if they are new"))
+        self.label_51.setText(_("Files to keep in add-on folder, space separated:"))
+        self.filesToKeep.setText(_("user_files .git .gitignore .svn .github"))
+        self.label_52.setText(_("When opening the browser, show:"))
+        self.browserFromReviewer.setItemText(0, _("Current Card"))
+        self.browserFromReviewer.setItemText(1, _("Current Note"))
+        self.browserFromReviewer.setItemText(2, _("Current Deck"))
+        self.label_53.setText(_("Font size:"))
+        self.Color.setTabText(self.Color.indexOf(self.tab_5), _("Interface"))
+        self.label_24.setToolTip(_("Cards that you are supposed to see today"))
+        self.label_24.setText(_("New cards"))
+        self.label_25.setToolTip(_("Cards you\'ll see today, and that you have already\n"
+"           seen (sum of review, and learning)."))
+        self.label_25.setText(_("Due cards"))
+        self.label_26.setToolTip(_("Cards that you have recently seen and that you\'ll\n"
+"           see again soon. Either a new card which has not graduated,\n"
+"           or a review which you forgot."))
+        self.label_26.setText(_("Cards in learning"))
+        self.label_27.setToolTip(_("Cards which have already graduated, that you are\n"
+"           supposed to see today, and have not already seen."))
+        self.label_27.setText(_("Today\'s revisition"))
+        self.label_28.setToolTip(_("Cards which are not new, nor in learning."))
+        self.label_28.setText(_("Graduated cards"))
+        self.label_29.setToolTip(_("Cards whose interval is less than three weeks."))
+        self.label_29.setText(_("Young cards"))
+        self.label_210.setToolTip(_("Cards whose interval is at least three weeks."))
+        self.label_210.setText(_("Mature cards"))
+        self.label_211.setToolTip(_("Cards which you never saw (or which you buried\n"
+"           before they graduated)"))
+        self.label_211.setText(_("Unseen cards"))
+        self.label_212.setText(_("Suspended cards"))
+        self.label_213.setToolTip(_("Cards such that you pressed «bury» today on them"))
+        self.label_213.setText(_("Manually buried cards"))
+        self.label_214.setToolTip(_("Cards which were buried because you reviewed one of\n"
+"           their siblings."))
+        self.label_214.setText(_("Automatically buried cards"))
+        self.label_215.setToolTip(_("A card which is currently in a filtered deck."))
+        self.label_215.setText(_("Filtered cards"))
+        self.label_216.setToolTip(_("Colour used to show a sum over the history of your deck"))
+        self.label_216.setText(_("Cumulative"))
+        self.label_32.setText(_("Cards forgotten"))
+        self.label_54.setToolTip(_("Only used in stats"))
+        self.label_54.setText(_("Intervals"))
+        self.label_217.setToolTip(_("Notes on which you pressed «mark»."))
+        self.label_217.setText(_("Marked cards"))
+        self.label_6.setToolTip(_("Only used in stats."))
+        self.label_6.setText(_("Hour"))
+        self.label_61.setToolTip(_("Flag 1."))
+        self.label_61.setText(_("Flag 1"))
+        self.label_62.setToolTip(_("Flag 2."))
+        self.label_62.setText(_("Flag 2"))
+        self.label_63.setToolTip(_("Flag 3."))
+        self.label_63.setText(_("Flag 3"))
+        self.label_64.setToolTip(_("Flag 4."))
+        self.label_64.setText(_("Flag 4"))
+        self.label_7.setText(_("Buried cards"))
+        self.Color.setTabText(self.Color.indexOf(self.tab_42), _("Colours"))
@@ -165,6 +165,11 @@ you can enter it here. Use \\t to represent tab."""),
         self.mw.col.decks.get(did).select()
         self.mw.progress.start(immediate=True)
         self.mw.checkpoint(_("Import"))
+        importedNotes = lambda cnt: self.mw.progress.update(
+                label=ngettext("Processed %d note",
+                               "Processed %d notes", cnt) % cnt
+                )
+        addHook("importedNotes", importedNotes)
         try:
             self.importer.run()
         except UnicodeDecodeError:
@@ -182,6 +187,7 @@ you can enter it here. Use \\t to represent tab."""),
             showText(msg)
             return
         finally:
+            remHook("importedNotes", importedNotes)
             self.mw.progress.finish()
         txt = _("Importing complete.") + "\n"
         if self.importer.log:
@@ -11,7 +11,6 @@ import sys
 import time
 import traceback
 import zipfile
-from threading import Thread
 from typing import Optional
 
 from send2trash import send2trash
@@ -21,15 +20,18 @@ import aqt
 import aqt.decks
 import aqt.mediasrv
 import aqt.progress
-import aqt.stats
 import aqt.toolbar
 import aqt.webview
 from anki import Collection
+from anki.backups import (BackupThread, IncrementalBackups,
+                          IncrementalBackupThread, snapshot)
 from anki.collection import _Collection
 from anki.hooks import addHook, runFilter, runHook
 from anki.lang import _, ngettext
+from anki.profiler import startupProfiler
 from anki.storage import Collection
-from anki.utils import devMode, ids2str, intTime, isMac, isWin, splitFields
+from anki.utils import (devMode, ids2str, intTime, isMac, isWin, splitFields,
+                        tmpfile)
 from aqt.qt import *
 from aqt.qt import sip
 from aqt.utils import (askUser, checkInvalidFilename, getFile, getOnlyText,
@@ -62,14 +64,19 @@ class AnkiQt(QMainWindow):
         self.state = "startup"
         self.opts = opts
         self.col: Optional[_Collection] = None
+        # sizes and durations of the last backup, see doBackup
+        self.backupMetrics = {}
+        self._incrementalBackupThread = None
         aqt.mw = self
         self.app = app
         self.pm = profileManager
         # init rest of app
         self.safeMode = self.app.queryKeyboardModifiers() & Qt.ShiftModifier
         try:
-            self.setupUI()
-            self.setupAddons()
+            with startupProfiler.phase("setupUI"):
+                self.setupUI()
+            with startupProfiler.phase("setupAddons"):
+                self.setupAddons()
         except:
             showInfo(_("Error during startup:\n%s") % traceback.format_exc())
             sys.exit(1)
@@ -184,6 +191,8 @@ class AnkiQt(QMainWindow):
         self.profileDiag.show()
         self.profileDiag.activateWindow()
         self.profileDiag.raise_()
+        # no profile to load, startup is over
+        startupProfiler.finish()
 
     def refreshProfilesList(self):
         profileForm = self.profileForm
@@ -259,9 +268,16 @@ Replace your collection with an earlier backup?"""),
         def doOpen(path):
             self._openBackup(path)
         getFile(self.profileDiag, _("Revert to backup"),
-                cb=doOpen, filter="*.colpkg", dir=self.pm.backupFolder())
+                cb=doOpen, filter="*.colpkg *.colinc",
+                dir=self.pm.backupFolder())
 
     def _openBackup(self, path):
+        if path.endswith(IncrementalBackups.extension):
+            try:
+                path = self._packageIncrementalBackup(path)
+            except Exception as e:
+                showWarning(_("Unable to restore this backup: %s") % e)
+                return
         try:
             # move the existing collection to the trash, as it may not open
             self.pm.trashCollection()
@@ -278,11 +294,26 @@ close the profile or restart Anki."""))
 
         self.onOpenProfile()
 
+    def _packageIncrementalBackup(self, path):
+        """The path of a temporary package containing the collection saved
+        in the incremental backup path."""
+        colPath = tmpfile(suffix=".anki2")
+        IncrementalBackups(self.pm.backupFolder()).restore(path, colPath)
+        packagePath = tmpfile(suffix=".colpkg")
+        zip = zipfile.ZipFile(packagePath, "w", zipfile.ZIP_STORED)
+        zip.write(colPath, "collection.anki2")
+        zip.writestr("media", "{}")
+        zip.close()
+        os.unlink(colPath)
+        return packagePath
+
     def loadProfile(self, onsuccess=None):
-        self.maybeAutoSync()
+        with startupProfiler.phase("maybeAutoSync"):
+            self.maybeAutoSync()
 
-        if not self.loadCollection():
-            return
+        with startupProfiler.phase("loadCollection"):
+            if not self.loadCollection():
+                return
 
         # show main window
         if self.pm.profile['mainWindowState']:
@@ -293,15 +324,23 @@ close the profile or restart Anki."""))
         # font size
         self.changeFontSize()
         # show and raise window for osx
-        self.show()
-        self.activateWindow()
-        self.raise_()
+        with startupProfiler.phase("show main window"):
+            self.show()
+            self.activateWindow()
+            self.raise_()
+        # the window is shown, the add-ons which can wait are loaded,
+        # before the hooks of the profile
+        with startupProfiler.phase("deferred add-ons"):
+            self.addonManager.loadDeferredAddons()
 
         # import pending?
         if self.pendingImport:
             self.handleImport(self.pendingImport)
             self.pendingImport = None
-        runHook("profileLoaded")
+        with startupProfiler.phase("profileLoaded hooks"):
+            runHook("profileLoaded")
+        # the first profile is loaded, startup is over
+        startupProfiler.finish()
         if onsuccess:
             onsuccess()
 
@@ -394,7 +433,8 @@ Debug info:
 
         def DeckManager(*args, **kwargs):
             return aqt.decks.DeckManager(self, *args, **kwargs)
-        self.col = Collection(cpath, log=True, DeckManager=DeckManager)
+        self.col = Collection(cpath, log=True, DeckManager=DeckManager,
+                              dbProfile=self.pm.profile.get('dbProfile'))
         self.col.decks.mw = self
 
         self.setEnabled(True)
@@ -447,20 +487,8 @@ from the profile screen."))
     # Backup and auto-optimize
     ##########################################################################
 
-    class BackupThread(Thread):
-        def __init__(self, path, data):
-            Thread.__init__(self)
-            self.path = path
-            self.data = data
-            # create the file in calling thread to ensure the same
-            # file is not created twice
-            open(self.path, "wb").close()
-
-        def run(self):
-            zip = zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED)
-            zip.writestr("collection.anki2", self.data)
-            zip.writestr("media", "{}")
-            zip.close()
+    # where add-ons expect it
+    BackupThread = BackupThread
 
     def backup(self):
         if not self.pm.profile['numBackups'] or devMode:
@@ -484,23 +512,62 @@ from the profile screen."))
                                      f"backup-daily-{self.year:02d}-{self.month:02d}-{self.day:02d}.colpkg",})
         filesToCreate = {time.strftime(pattern, time.localtime(time.time()))
                          for pattern in patternsToCreate}
-        with open(self.pm.collectionPath(), "rb") as file:
-            data = file.read()
-        for fname in filesToCreate:
-            newpath = os.path.join(self.pm.backupFolder(), fname)
-            if not os.path.exists(newpath):
-                self.BackupThread(newpath, data).start()
+        newpaths = [os.path.join(self.pm.backupFolder(), fname)
+                    for fname in sorted(filesToCreate)]
+        newpaths = [newpath for newpath in newpaths
+                    if not os.path.exists(newpath)]
+        if not newpaths:
+            return
+        if self.pm.profile.get('incrementalBackup', False):
+            self.doIncrementalBackup(newpaths)
+            return
+        # copy the collection in the calling thread, so that it can't
+        # change before the copy ends. No need to hold it in memory.
+        startTime = time.time()
+        copy = snapshot(self.pm.collectionPath())
+        self.backupMetrics = dict(
+            collectionBytes=os.path.getsize(copy),
+            snapshotSeconds=time.time() - startTime,
+            files=len(newpaths))
+        self.BackupThread(newpaths[0], copy, newpaths[1:],
+                          self.backupMetrics).start()
+
+    def doIncrementalBackup(self, newpaths):
+        """Save the collection as blocks shared between backups. The
+        snapshot is taken in the calling thread; the blocks, which are
+        all new in the first backup, are compressed and saved in a
+        thread."""
+        newpaths = [os.path.splitext(path)[0] + IncrementalBackups.extension
+                    for path in newpaths]
+        newpaths = [newpath for newpath in newpaths
+                    if not os.path.exists(newpath)]
+        if not newpaths:
+            return
+        startTime = time.time()
+        copy = snapshot(self.pm.collectionPath())
+        self.backupMetrics = dict(
+            snapshotSeconds=time.time() - startTime,
+            files=len(newpaths))
+        self._incrementalBackupThread = IncrementalBackupThread(
+            IncrementalBackups(self.pm.backupFolder()), copy, newpaths,
+            self.backupMetrics)
+        self._incrementalBackupThread.start()
 
     def cleanBackup(self):
         self.cleanRecentBackup()
         self.cleanLongTermBackup()
+        # the blocks of the incremental backups deleted above. A thread
+        # saving a backup prunes them itself once done.
+        thread = self._incrementalBackupThread
+        if not (thread and thread.is_alive()):
+            IncrementalBackups(self.pm.backupFolder()).prune()
 
     def cleanRecentBackup(self):
         # find existing backups
         backups = [file
-                   for file in os.listdir(self.pm.backupFolder())
+                   for file in self._backupFiles()
                    # only look for new-style format
-                   if not re.match(r"backup-\d{4}-\d{2}-.+.colpkg", file)]
+                   if not re.match(r"backup-\d{4}-\d{2}-.+.colpkg", self._asColpkg(file))]
         backups.sort()
 
         # remove old ones
@@ -532,11 +599,25 @@ from the profile screen."))
                     daysToKeep.append((self.year, self.month-1, self.day-nbDay+nbDayPreviousMonth))
         filesToKeep = ([f"backup-monthly-{yearToHave:02d}-{monthToHave:02d}.colpkg" for yearToHave, monthToHave in monthsToKeep]+
                        [f"backup-daily-{yearToHave:02d}-{monthToHave:02d}-{dayToHave:02d}.colpkg" for yearToHave, monthToHave, dayToHave in daysToKeep])
-        for file in os.listdir(self.pm.backupFolder()):
-            if (file.startswith("backup-monthy-") or file.startswith("backup-daily-")) and file not in filesToKeep:
+        for file in self._backupFiles():
+            if (file.startswith("backup-monthy-") or file.startswith("backup-daily-")) and self._asColpkg(file) not in filesToKeep:
                 oldpath = os.path.join(self.pm.backupFolder(), file)
                 os.unlink(oldpath)
 
+    def _backupFiles(self):
+        "The files of the backup folder, without the blocks folder."
+        folder = self.pm.backupFolder()
+        return [file for file in os.listdir(folder)
+                if os.path.isfile(os.path.join(folder, file))]
+
+    def _asColpkg(self, file):
+        """The name of the package of the backup file, so that incremental
+        backups are kept and removed as packages are."""
+        name, ext = os.path.splitext(file)
+        if ext == IncrementalBackups.extension:
+            return name + ".colpkg"
+        return file
+
     def maybeOptimize(self):
         # have two weeks passed?
         if (intTime() - self.pm.profile['lastOptimize']) < 86400*14:
@@ -943,6 +1024,15 @@ QTreeWidget {
             runHook("revertedState", name)
         self.maybeEnableUndo()
 
+    def onRedo(self):
+        name = self.col.redoName()
+        if not name:
+            return
+        self.col.redo()
+        self.reset()
+        tooltip(_("Redone '%s'.") % name.lower())
+        self.maybeEnableUndo()
+
     def maybeEnableUndo(self):
         """Enable undo in the GUI if something can be undone. Call the hook undoState(somethingCanBeUndone)."""
         if self.col and self.col.undoName():#Whether something can be undone
@@ -954,9 +1044,15 @@ QTreeWidget {
             self.form.actionUndo.setText(_("Undo"))
             self.form.actionUndo.setEnabled(False)
             runHook("undoState", False)
+        redoName = self.col and self.col.redoName()
+        if redoName:
+            self.form.actionRedo.setText(_("Redo %s") % redoName)
+        else:
+            self.form.actionRedo.setText(_("Redo"))
+        self.form.actionRedo.setEnabled(bool(redoName))
 
     def checkpoint(self, name):
-        self.col.save(name)
+        self.col.checkpoint(name)
         self.maybeEnableUndo()
 
     def autosave(self):
@@ -1122,10 +1218,13 @@ QTreeWidget {
         menu.actionPostpone_Reviews.triggered.connect(self.onPostpone_Reviews)
         menu.actionAbout.triggered.connect(self.onAbout)
         menu.actionUndo.triggered.connect(self.onUndo)
+        menu.actionRedo.triggered.connect(self.onRedo)
         if qtminor < 11:
             menu.actionUndo.setShortcut(QKeySequence(_("Ctrl+Alt+Z")))
         menu.actionFullDatabaseCheck.triggered.connect(self.onCheckDB)
         menu.actionCheckMediaDatabase.triggered.connect(self.onCheckMediaDB)
+        menu.actionRenderLatex.triggered.connect(self.onRenderLatex)
+        menu.actionCheckBackups.triggered.connect(self.onCheckBackups)
         menu.actionDocumentation.triggered.connect(self.onDocumentation)
         menu.actionDonate.triggered.connect(self.onDonate)
         menu.actionStudyDeck.triggered.connect(self.onStudyDeck)
@@ -1278,6 +1377,40 @@ will be lost. Continue?"""))
                 continue
         return ret
 
+    def onCheckBackups(self):
+        self.progress.start(immediate=True)
+        try:
+            problems = IncrementalBackups(self.pm.backupFolder()).verify()
+        finally:
+            self.progress.finish()
+        if problems:
+            showText(_("Some backups can not be restored:") + "\n\n" +
+                     "\n".join(problems))
+        else:
+            tooltip(_("No problem found in backups."))
+
+    def onRenderLatex(self):
+        "Generate the missing LaTeX images, in the background."
+        self.progress.start(immediate=True)
+        try:
+            futures = self.col.latex.prerender()
+        finally:
+            self.progress.finish()
+        if not futures:
+            tooltip(_("No LaTeX image is missing."))
+            return
+        tooltip(_("Rendering %d LaTeX images in the background.") % len(futures))
+        def onTimer():
+            if not all(future.done() for future in futures):
+                self.progress.timer(1000, onTimer, False)
+                return
+            failed = sum(1 for future in futures
+                         if future.cancelled() or future.exception() or
+                         future.result()[0])
+            tooltip(_("LaTeX images rendered: %(done)d, failed: %(failed)d.") % dict(
+                done=len(futures) - failed, failed=failed))
+        self.progress.timer(1000, onTimer, False)
+
     def onCheckMediaDB(self):
         self.progress.start(immediate=True)
         (nohave, unused, warnings) = self.col.media.check()
@@ -1512,6 +1645,8 @@ will be lost. Continue?"""))
         bcard = self._debugBrowserCard
         mw = self
         pp = pprint.pprint
+        # e.g. hooks.startHookProfile(), then print(hooks.hookProfileReport())
+        hooks = anki.hooks
         self._captureOutput(True)
         try:
             # pylint: disable=exec-used
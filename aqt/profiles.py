@@ -60,6 +60,8 @@ profileConf: Dict[str,Any] = dict(
     # importing
     allowHTML=False,
     importMode=1,
+    # the performance profile of the collection, see anki.db.dbProfiles
+    dbProfile=None,
 )
 
 class ProfileManager(PM):
@@ -301,7 +303,7 @@ and no other programs are accessing your profile folders, then try again."""))
                     self.db.close()
                 except:
                     pass
-            for suffix in ("", "-journal"):
+            for suffix in ("", "-journal", "-wal", "-shm"):
                 fpath = path + suffix
                 if os.path.exists(fpath):
                     os.unlink(fpath)
@@ -312,6 +314,8 @@ profiles, please add them back using the same names to recover your cards.""")
         try:
             self.db = DB(path)
             assert self.db.scalar("pragma integrity_check") == "ok"
+            # read before any profile, thus with the default profile
+            self.db.applyProfile()
             self.db.execute("""
 create table if not exists profiles
 (name text primary key, data text not null);""")
@@ -2,7 +2,6 @@
 # Copyright: Ankitects Pty Ltd and contributors
 # License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
 
-import difflib
 import html
 import html.parser
 import json
@@ -13,6 +12,7 @@ from typing import List
 import aqt
 from anki.cards import Card
 from anki.consts import *
+from anki.diff import matchingBlocks
 from anki.hooks import addHook, runFilter, runHook
 from anki.lang import _, ngettext
 from anki.sound import clearAudioQueue, play, playFromText
@@ -399,7 +399,6 @@ Please run Tools>Empty Cards""")
         # compare in NFC form so accents appear correct
         given = ucd.normalize("NFC", given)
         correct = ucd.normalize("NFC", correct)
-        matcher = difflib.SequenceMatcher(None, given, correct, autojunk=False)
         givenElems = []
         correctElems = []
         givenPoint = 0
@@ -411,7 +410,7 @@ Please run Tools>Empty Cards""")
         def logGood(start, cnt, str, array):
             if cnt:
                 array.append((True, str[start:start+cnt]))
-        for x, y, cnt in matcher.get_matching_blocks():
+        for x, y, cnt in matchingBlocks(given, correct):
             # if anything was missed in correct, pad given
             if cnt and y-offby > x:
                 givenElems.append((False, "-"*(y-x-offby)))
@@ -433,12 +432,12 @@ Please run Tools>Empty Cards""")
         correct -- correct answer
         showBad -- unused."""
         givenElems, correctElems = self.tokenizeComparison(given, correct)
-        def good(html):
-            return "<span class=typeGood>"+html.escape(html)+"</span>"
-        def bad(html):
-            return "<span class=typeBad>"+html.escape(html)+"</span>"
-        def missed(html):
-            return "<span class=typeMissed>"+html.escape(html)+"</span>"
+        def good(s):
+            return "<span class=typeGood>"+html.escape(s)+"</span>"
+        def bad(s):
+            return "<span class=typeBad>"+html.escape(s)+"</span>"
+        def missed(s):
+            return "<span class=typeMissed>"+html.escape(s)+"</span>"
         if given == correct:
             res = good(given)
         else:
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 # License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
 
+import json
 import os
 import time
 
@@ -84,7 +85,11 @@ class DeckStats(QDialog):
         self.mw.progress.start(immediate=True, parent=self)
         stats = self.mw.col.stats()
         stats.wholeCollection = self.wholeCollection
-        self.report = stats.report(type=self.period)
-        self.form.web.stdHtml("<html><body>"+self.report+"</body></html>",
+        self.form.web.stdHtml("<html><body><center id=stats></center></body></html>",
                               js=["jquery.js", "plot.js"])
+        def onSection(html):
+            # show each section as soon as it is computed
+            self.form.web.eval("$('#stats').append(%s);" % json.dumps(html))
+            self.mw.progress.update()
+        self.report = stats.report(type=self.period, onSection=onSection)
         self.mw.progress.finish()
@@ -1,10 +1,14 @@
+import json
 import os.path
+import sys
 from tempfile import TemporaryDirectory
 from zipfile import ZipFile
 
 from mock import MagicMock
 from nose.tools import assert_equals
 
+from anki import addons
+from anki.hooks import addHook, runHook
 from anki.utils import correctJson, readableJson
 from aqt.addons import AddonManager
 
@@ -73,6 +77,59 @@ def test_conflictsMustBeStrings():
     )
 
 
+def test_readLoading():
+    assertReadManifest(
+        '{"package": "a", "name": "b", "loading": "lazy", "loadOnHooks": ["c"]}',
+        {"package": "a", "name": "b", "loading": "lazy", "loadOnHooks": ["c"]}
+    )
+    assertReadManifest(
+        '{"package": "a", "name": "b", "loading": "later"}',
+        {}
+    )
+
+
+def test_loadingPolicies():
+    loaded = []
+    sys.modules["addonLoadLog"] = loaded
+    with TemporaryDirectory() as td:
+        for dir, meta in [("testAddonB", {}),
+                          ("testAddonA", {}),
+                          ("testAddonDeferred", {"loading": "deferred"}),
+                          ("testAddonLazy", {"loading": "lazy", "loadOnHooks": ["testAddonHook"]}),
+                          ("testAddonDisabled", {"disabled": True})]:
+            os.mkdir(os.path.join(td, dir))
+            with open(os.path.join(td, dir, "__init__.py"), "w") as file:
+                file.write("import addonLoadLog\naddonLoadLog.append(%r)\n" % dir)
+                if dir == "testAddonLazy":
+                    file.write("from anki.hooks import addHook\n"
+                               "addHook('testAddonHook', lambda: addonLoadLog.append('hook'))\n")
+            with open(os.path.join(td, dir, "meta.json"), "w") as file:
+                file.write(json.dumps(meta))
+        adm = addons.AddonManager(MagicMock())
+        adm.mw = MagicMock()
+        adm.mw.pm.addonFolder.return_value = td
+        sys.path.insert(0, td)
+        try:
+            assert_equals(adm.loadAddons(), [])
+            # in the order of the folders
+            assert_equals(loaded, ["testAddonA", "testAddonB"])
+            assert_equals(adm.loadingDescription("testAddonDeferred"), "deferred")
+            assert_equals(adm.loadingDescription("testAddonLazy"), "lazy, not used yet")
+            assert_equals(adm.loadingDescription("testAddonDisabled"), None)
+            assert_equals(adm.loadDeferredAddons(), [])
+            assert_equals(loaded[2:], ["testAddonDeferred"])
+            # the lazy add-on is loaded by its hook, and receives it
+            runHook("testAddonHook")
+            runHook("testAddonHook")
+            assert_equals(loaded[3:], ["testAddonLazy", "hook", "hook"])
+            assert set(adm.loadTimes) == {"testAddonA", "testAddonB",
+                                          "testAddonDeferred", "testAddonLazy"}
+            assert adm.loadingDescription("testAddonA").startswith("loaded in")
+        finally:
+            sys.path.remove(td)
+            del sys.modules["addonLoadLog"]
+
+
 def assertReadManifest(contents, expectedManifest, nameInZip="manifest.json"):
     with TemporaryDirectory() as td:
         zfn = os.path.join(td, "addon.zip")
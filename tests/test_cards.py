@@ -104,3 +104,29 @@ def test_gendeck():
     f['Text'] += '{{c4::four}}'
     f.flush()
     assert f.cards()[3].did == newId
+
+def test_genOnlyWhenFieldsEmptied():
+    d = getEmptyCol()
+    f = d.newNote()
+    f['Front'] = '1'
+    f['Back'] = ''
+    d.addNote(f)
+    calls = []
+    genCards = d.genCards
+    d.genCards = lambda nids: calls.append(nids) or genCards(nids)
+    # editing a non-empty field can't generate cards
+    f['Front'] = '12'
+    assert not f.mayGenCards()
+    f.flush()
+    assert not calls
+    assert d.db.scalar("select flds from notes") == "12\x1f"
+    # filling an empty field may
+    f['Back'] = '2'
+    assert f.mayGenCards()
+    f.flush()
+    assert calls == [[f.id]]
+    # a loaded note compares with its saved fields
+    f = d.getNote(f.id)
+    f['Back'] = '3'
+    f.flush()
+    assert len(calls) == 1
@@ -1,10 +1,21 @@
 # coding: utf-8
 
+import json
 import os
+import sqlite3
 import tempfile
+import zipfile
+from types import SimpleNamespace
 
 from anki import Collection as aopen
+from anki.consts import INDEX_VERSION
+from anki.backups import (BackupThread, IncrementalBackups,
+                          IncrementalBackupThread, snapshot)
+from anki.db import DB
+from anki.fixing import FixingManager
+from anki.indexadvisor import indexAdvisor
 from anki.stdmodels import addBasicModel, models
+from anki.utils import isWin
 from tests.shared import assertException, getEmptyCol
 
 newPath = None
@@ -109,6 +120,309 @@ def test_addDelTags():
     f.load()
     assert f.tags[0] == "aaa"
     assert len(f.tags) == 2
+    # case follows the registered tags
+    assert deck.tags.canonify(["FOO", "'Aaa'"]) == ["aaa", "foo"]
+    deck.tags.bulkAdd([f.id, f2.id], "foo Bbb")
+    f.load(); f2.load()
+    assert f.tags == ["Bbb", "aaa", "foo"]
+    assert f2.tags == ["Bbb", "foo"]
+    # removal ignores case and accepts wildcards
+    deck.tags.bulkRem([f.id, f2.id], "b* AAA")
+    f.load(); f2.load()
+    assert f.tags == ["foo"]
+    assert f2.tags == ["foo"]
+
+def test_tagIndex():
+    deck = getEmptyCol()
+    f = deck.newNote()
+    f['Front'] = "1"
+    f.tags = ["lang::fr", "verb"]
+    deck.addNote(f)
+    f2 = deck.newNote()
+    f2['Front'] = "2"
+    f2.tags = ["lang::de"]
+    deck.addNote(f2)
+    index = lambda: sorted(deck.db.all("select nid, tag from note_tags"))
+    assert index() == sorted([(f.id, "lang::fr"), (f.id, "verb"),
+                              (f2.id, "lang::de")])
+    # hierarchical and case insensitive searches
+    assert len(deck.findNotes("tag:lang::*")) == 2
+    assert deck.findNotes("tag:LANG::FR") == [f.id]
+    # bulk changes are indexed
+    deck.tags.bulkRem([f.id, f2.id], "lang::*")
+    deck.tags.bulkAdd([f2.id], "noun")
+    assert index() == [(f.id, "verb"), (f2.id, "noun")]
+    assert sorted(deck.tags.byDeck(1)) == ["noun", "verb"]
+    deck.remNotes([f.id])
+    assert index() == [(f2.id, "noun")]
+    # the index is rebuilt if the collection was changed by another program
+    deck.close()
+    db = DB(deck.path)
+    db.execute("update notes set tags = ' other '")
+    db.execute("update col set mod = mod + 1")
+    db.commit()
+    db.close()
+    deck = aopen(deck.path)
+    assert index() == [(f2.id, "other")]
+    deck.close()
+
+def test_backup():
+    deck = getEmptyCol()
+    f = deck.newNote()
+    f['Front'] = "1"
+    deck.addNote(f)
+    deck.save()
+    # a snapshot of the collection while it is open
+    copy = snapshot(deck.path)
+    db = DB(copy)
+    assert db.scalar("select count() from notes") == 1
+    db.close()
+    # compressed once, linked to the other names
+    folder = tempfile.mkdtemp()
+    first = os.path.join(folder, "backup-1.colpkg")
+    second = os.path.join(folder, "backup-daily.colpkg")
+    metrics = {}
+    thread = BackupThread(first, copy, [second], metrics)
+    thread.start()
+    thread.join()
+    assert not os.path.exists(copy)
+    assert zipfile.ZipFile(second).namelist() == ["collection.anki2", "media"]
+    assert metrics['backupBytes'] == os.path.getsize(second)
+    assert metrics['linked'] + (not os.path.samefile(first, second)) == 1
+    # without sqlite's backup, the file is copied, with the commits only
+    # in its -wal file
+    path = os.path.join(folder, "wal.anki2")
+    conn = sqlite3.connect(path)
+    conn.execute("pragma journal_mode = wal")
+    conn.execute("pragma wal_autocheckpoint = 0")
+    conn.execute("create table t (x)")
+    conn.execute("insert into t values (1)")
+    conn.commit()
+    db = DB(path)
+    db._copyTo(copy)
+    db.close()
+    conn.close()
+    assert not os.path.exists(copy + "-wal")
+    db = DB(copy)
+    assert db.scalar("select x from t") == 1
+    assert db.scalar("pragma journal_mode") == "delete"
+    db.close()
+    deck.close()
+
+def test_incrementalBackups():
+    deck = getEmptyCol()
+    f = deck.newNote()
+    f['Front'] = "1"
+    deck.addNote(f)
+    deck.close()
+    folder = tempfile.mkdtemp()
+    backups = IncrementalBackups(folder)
+    first = os.path.join(folder, "backup-1.colinc")
+    metrics = backups.save(deck.path, [first])
+    assert metrics['newBlocks'] == metrics['blocks']
+    # nothing changed, nothing to save
+    second = os.path.join(folder, "backup-2.colinc")
+    metrics = backups.save(deck.path, [second])
+    assert metrics['newBlocks'] == 0
+    deck = aopen(deck.path)
+    f = deck.newNote()
+    f['Front'] = "2"
+    deck.addNote(f)
+    deck.close()
+    # saved in a thread, from a snapshot, pruning the unused blocks
+    os.unlink(second)
+    third = os.path.join(folder, "backup-3.colinc")
+    metrics = {}
+    thread = IncrementalBackupThread(backups, snapshot(deck.path), [third],
+                                     metrics)
+    thread.start()
+    thread.join()
+    assert metrics['newBlocks'] and metrics['prunedBlocks'] == 0
+    assert backups.verify() == []
+    # an unreadable manifest may refer to any block
+    second = os.path.join(folder, "backup-2.colinc")
+    with open(second, "w") as file:
+        file.write("{")
+    # restore the first backup
+    path = os.path.join(folder, "restored.anki2")
+    backups.restore(first, path)
+    assert aopen(path).noteCount() == 1
+    # deleting backups frees their blocks, unless a manifest is unreadable
+    assert backups.prune() == 0
+    os.unlink(third)
+    assert backups.prune() == 0
+    os.unlink(second)
+    assert backups.prune() > 0
+    assert backups.verify() == []
+    # a corrupt block is detected
+    for subfolder in os.listdir(backups.blocksFolder):
+        subfolderPath = os.path.join(backups.blocksFolder, subfolder)
+        for block in os.listdir(subfolderPath):
+            open(os.path.join(subfolderPath, block), "wb").close()
+    assert len(backups.verify()) == 1
+    assertException(Exception, lambda: backups.restore(first, path))
+
+def test_objectTables():
+    deck = getEmptyCol()
+    path = deck.path
+    deck.setObjectTables(True)
+    deck.save()
+    assert deck.db.scalar("select count() from models") == len(deck.models.models)
+    blob = deck.db.scalar("select models from col")
+    # saving a deck only writes its row
+    default = deck.decks.get(1)
+    default['desc'] = "changed"
+    default.save()
+    deck.save()
+    assert "changed" in deck.db.scalar("select data from decks where id = 1")
+    assert "changed" not in deck.db.scalar("select decks from col")
+    assert deck.db.scalar("select models from col") == blob
+    # the blobs are reassembled when the collection is closed
+    deck.close()
+    db = DB(path)
+    assert json.loads(db.scalar("select decks from col"))['1']['desc'] == "changed"
+    # as if an older client renamed the deck
+    decks = json.loads(db.scalar("select decks from col"))
+    decks['1']['desc'] = "older"
+    db.execute("update col set decks = ?", json.dumps(decks))
+    db.commit()
+    db.close()
+    deck = aopen(path)
+    assert deck.objectTables
+    assert deck.decks.get(1)['desc'] == "older"
+    assert "older" in deck.db.scalar("select data from decks where id = 1")
+    # back to the blobs only
+    deck.setObjectTables(False)
+    deck.close()
+    deck = aopen(path)
+    assert not deck.objectTables
+    assert deck.decks.get(1)['desc'] == "older"
+    deck.close()
+
+def test_fixIntegrity():
+    deck = getEmptyCol()
+    for i in range(3):
+        note = deck.newNote()
+        note['Front'] = "note %d" % i
+        deck.addNote(note)
+    n1, n2, n3 = deck.db.list("select id from notes order by id")
+    deck.db.execute("update notes set sfld = 'stale', guid = 'same' where id in (?, ?)", n1, n2)
+    deck.db.execute("delete from cards where nid = ?", n3)
+    deck.db.execute("update cards set ivl = 1.5 where nid = ?", n1)
+    deck.db.execute("update cards set type = 0, due = 2000005 where nid = ?", n2)
+    deck.save()
+    fixer = FixingManager(deck)
+    problems, ok = fixer.run()
+    assert not ok
+    assert "Deleted 1 note with no cards." in problems
+    assert "Fixed 1 cards with v2 scheduler bug." in problems
+    assert "Found 1 new cards with a due number >= 1,000,000" in problems
+    assert "The guid of note %d has been changed" % n2 in problems
+    assert deck.db.list("select id from notes order by id") == [n1, n2]
+    assert deck.db.scalar("select sfld from notes where id = ?", n1) == "note 0"
+    assert deck.db.scalar("select due from cards where nid = ?", n2) == 1000005
+    assert deck.conf['nextPos'] == 1000006
+    assert set(fixer.scans) <= set(fixer.timings)
+    # once fixed and repositioned, nothing is found
+    deck.db.execute("update cards set due = 5 where nid = ?", n2)
+    deck.save()
+    fixer.parallel = False
+    problems, ok = fixer.run()
+    assert ok, problems
+
+def test_basicCheckIncremental():
+    deck = getEmptyCol()
+    for i in range(2):
+        note = deck.newNote()
+        note['Front'] = "note %d" % i
+        deck.addNote(note)
+    n1, n2 = deck.db.list("select id from notes order by id")
+    # as if synced
+    deck.db.execute("update cards set usn = 0, mod = 0")
+    deck.db.execute("update notes set usn = 0, mod = 0")
+    deck._usn = 1
+    assert deck.basicCheck()
+    assert deck.conf['basicCheck']['usn'] == 1
+    # an unchanged row is only tested by a full check
+    deck.db.execute("delete from notes where id = ?", n1)
+    assert deck.basicCheck()
+    syncer = SimpleNamespace()
+    assert not deck.basicCheck(syncer, full=True)
+    assert "belongs to note %d" % n1 in syncer.errorMessages
+    # a changed row is tested by both
+    deck.db.execute("""
+insert into cards select id+1, nid, did, ord, mod, -1, type, queue, due, ivl,
+factor, reps, lapses, left, odue, odid, flags, data from cards where nid = ?""", n2)
+    for full in (False, True):
+        syncer = SimpleNamespace()
+        assert not deck.basicCheck(syncer, full=full)
+        assert ("Note %d has card at ord 0 repeated 2 times" % n2 in
+                syncer.errorMessages)
+        assert ("belongs to note %d" % n1 in syncer.errorMessages) == full
+    # a note whose last card is deleted is tested by both
+    deck.db.execute("delete from cards where nid = ? or usn = -1", n1)
+    assert deck.basicCheck(full=True)
+    deck._usn = 2
+    deck.remCards(deck.db.list("select id from cards where nid = ?", n2),
+                  notes=False)
+    for full in (False, True):
+        syncer = SimpleNamespace()
+        assert not deck.basicCheck(syncer, full=full)
+        assert "Note %d has no cards" % n2 in syncer.errorMessages
+
+def test_indexAdvisor():
+    deck = getEmptyCol()
+    path = deck.path
+    assert deck.db.scalar("pragma user_version") == INDEX_VERSION
+    # an older collection gets the newer indices when opened
+    deck.db.execute("drop index ix_notes_mid_csum")
+    deck.db.execute("pragma user_version = 0")
+    deck.close()
+    mod = deck.mod
+    deck = aopen(path)
+    assert deck.db.scalar(
+        "select 1 from sqlite_master where name = 'ix_notes_mid_csum'")
+    # without changing the collection, so it isn't synced again
+    deck.close()
+    deck = aopen(path)
+    assert deck.mod == mod
+    mid = deck.models.current().getId()
+    indexAdvisor.start()
+    try:
+        deck.db.all("select id from notes where mid = ?", mid)
+        for i in range(3):
+            deck.db.all("select id from notes where flds = ?", "")
+    finally:
+        report = indexAdvisor.stop()
+        indexAdvisor.statements = {}
+    assert "notes: select id from notes where flds = ?" in report
+    assert "where mid" not in report
+    deck.close()
+
+def test_dbProfiles():
+    deck = getEmptyCol()
+    path = deck.path
+    deck.close()
+    deck = aopen(path, dbProfile="fast")
+    for db in (deck.db, deck.media.db):
+        assert db.profile == "fast"
+        assert db.scalar("pragma cache_size") == -65536
+        if not isWin:
+            assert db.scalar("pragma journal_mode") == "wal"
+            # normal
+            assert db.scalar("pragma synchronous") == 1
+    deck.close()
+    deck.reopen()
+    assert deck.db.scalar("pragma cache_size") == -65536
+    deck.close()
+    deck = aopen(path, dbProfile="safe")
+    assert deck.db.scalar("pragma journal_mode") == "delete"
+    # full
+    assert deck.db.scalar("pragma synchronous") == 2
+    deck.close()
+    deck = aopen(path, dbProfile="unknown")
+    assert deck.db.profile == "default"
+    deck.close()
 
 def test_timestamps():
     deck = getEmptyCol()
@@ -1,11 +1,14 @@
 # coding: utf-8
 
+import json
 import os
 import tempfile
+import zipfile
 
 import nose
 
 from anki import Collection as aopen
+from anki.db import DB
 from anki.exporting import *
 from anki.importing import Anki2Importer
 
@@ -82,6 +85,60 @@ def test_export_ankipkg():
     os.unlink(newname)
     e.exportInto(newname)
 
+@nose.with_setup(setup1)
+def test_export_ankipkg_compression():
+    mdir = deck.media.dir()
+    with open(os.path.join(mdir, "a.svg"), "w") as f:
+        f.write("<svg></svg>" * 100)
+    with open(os.path.join(mdir, "b.png"), "w") as f:
+        f.write("x" * 1000)
+    with open(os.path.join(mdir, "c.unknown"), "w") as f:
+        f.write("y" * 1000)
+    n = deck.newNote()
+    n['Front'] = '<img src="a.svg"><img src="b.png"><img src="c.unknown">'
+    deck.addNote(n)
+    e = AnkiPackageExporter(deck)
+    fd, newname = tempfile.mkstemp(prefix="ankitest", suffix=".apkg")
+    os.close(fd)
+    os.unlink(newname)
+    e.exportInto(newname)
+    assert e.throughput['bytes'] == os.path.getsize(newname)
+    z = zipfile.ZipFile(newname)
+    media = json.loads(z.read("media").decode("utf8"))
+    types = {fname: z.getinfo(idx).compress_type for idx, fname in media.items()}
+    assert types == {"a.svg": zipfile.ZIP_DEFLATED,
+                     "b.png": zipfile.ZIP_STORED,
+                     "c.unknown": zipfile.ZIP_DEFLATED}
+
+@nose.with_setup(setup1)
+def test_export_colpkg():
+    deck.setObjectTables(True)
+    deck.save()
+    e = AnkiCollectionPackageExporter(deck)
+    fd, newname = tempfile.mkstemp(prefix="ankitest", suffix=".colpkg")
+    os.close(fd)
+    os.unlink(newname)
+    e.exportInto(newname)
+    # the tag index and the object tables are left out of the package
+    z = zipfile.ZipFile(newname)
+    name = [n for n in z.namelist() if n.startswith("collection.anki2")][-1]
+    path = os.path.join(tempfile.mkdtemp(), "collection.anki2")
+    with open(path, "wb") as file:
+        file.write(z.read(name))
+    db = DB(path)
+    names = db.list("select name from sqlite_master")
+    assert "note_tags" not in names and "models" not in names
+    db.close()
+    d2 = aopen(path)
+    assert d2.findNotes("tag:tag2")
+    assert d2.models.all()
+    d2.close()
+    # but not out of the collection exported
+    names = deck.db.list("select name from sqlite_master")
+    assert "note_tags" in names and "models" in names
+    assert deck.findNotes("tag:tag2")
+    deck.setObjectTables(False)
+
 @nose.with_setup(setup1)
 def test_export_anki_due():
     deck = getEmptyCol()
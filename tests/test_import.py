@@ -1,3 +1,9 @@
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
 import aqt
 from anki import (__init__, cards, collection, consts, db, deck, decks, errors,
                   exporting, fields, find, hooks, lang, latex, media, model,
@@ -26,3 +32,40 @@ if isWin:
 
 def test_import():
     pass
+
+def test_lazyStartupImports():
+    # dialogs are imported when first opened, not when anki starts
+    code = "import sys, aqt; print('\\n'.join(sys.modules))"
+    out = subprocess.check_output([sys.executable, "-c", code]).decode()
+    modules = out.split()
+    assert "aqt.main" in modules
+    for lazy in ("aqt.browser", "aqt.addcards", "aqt.editcurrent",
+                 "aqt.stats", "aqt.preferences", "aqt.about", "aqt.editor"):
+        assert lazy not in modules
+
+def _startupReport(code):
+    """The report of the startup profiler, started as runanki does, in
+    a new process running code."""
+    path = os.path.join(tempfile.mkdtemp(), "startup.txt")
+    env = dict(os.environ, ANKI_PROFILE_STARTUP=path)
+    subprocess.check_call([sys.executable, "-c", """
+from anki.profiler import startupProfiler
+startupProfiler.startFromEnv()
+%s
+startupProfiler.finish()""" % code], env=env)
+    with open(path, encoding="utf8") as file:
+        return file.read()
+
+def test_lazyStartupTime():
+    # importing the dialogs at startup, as before, takes measurably longer
+    dialogs = "aqt.browser, aqt.addcards, aqt.editcurrent, aqt.stats, aqt.preferences, aqt.about"
+    def measure(report):
+        seconds = float(re.match(r"Startup: ([\d.]+)s", report).group(1))
+        modules = int(re.search(r"Imports \((\d+) modules", report).group(1))
+        return seconds, modules
+    lazySeconds, lazyModules = min(
+        measure(_startupReport("import aqt")) for i in range(3))
+    eagerSeconds, eagerModules = min(
+        measure(_startupReport("import aqt, " + dialogs)) for i in range(3))
+    assert lazyModules < eagerModules
+    assert lazySeconds < eagerSeconds
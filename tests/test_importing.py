@@ -1,10 +1,12 @@
 # coding: utf-8
 
 import os
+import tempfile
 
 from anki.importing import (Anki2Importer, AnkiPackageImporter,
                             MnemosyneImporter, SupermemoXmlImporter,
                             TextImporter)
+from anki.hooks import addHook, remHook
 from anki.utils import ids2str
 from tests.shared import getEmptyCol, getUpgradeDeckPath
 
@@ -129,6 +131,51 @@ def test_anki2_updates():
     assert dst.noteCount() == 1
     assert dst.db.scalar("select flds from notes").startswith("goodbye")
 
+def test_anki2_streaming():
+    src = getEmptyCol()
+    for i in range(5):
+        note = src.newNote()
+        note['Front'] = "front%d" % i
+        src.addNote(note)
+    # a review card, whose revlog should follow it
+    src.reset()
+    src.sched.answerCard(src.sched.getCard(), 3)
+    src.close()
+    dst = getEmptyCol()
+    note = dst.newNote()
+    note['Front'] = "local"
+    dst.addNote(note)
+    imp = Anki2Importer(dst, src.path)
+    imp.streaming = True
+    imp.batchSize = 2
+    imp.run()
+    assert imp.added == 5
+    assert imp.dupes == 0
+    assert dst.noteCount() == 6
+    assert dst.cardCount() == 6
+    assert dst.db.scalar("select count() from revlog") == 1
+    assert "Notes added from file: 5" in imp.log
+    # importing again should be idempotent
+    imp = Anki2Importer(dst, src.path)
+    imp.streaming = True
+    imp.batchSize = 2
+    imp.run()
+    assert imp.added == 0
+    assert imp.dupes == 5
+    assert dst.noteCount() == 6
+    assert dst.cardCount() == 6
+    # and updates are found
+    dst = getEmptyCol()
+    imp = AnkiPackageImporter(dst, getUpgradeDeckPath("update1.apkg"))
+    imp.streaming = True
+    imp.run()
+    imp = AnkiPackageImporter(dst, getUpgradeDeckPath("update2.apkg"))
+    imp.streaming = True
+    imp.run()
+    assert imp.updated == 1
+    assert dst.noteCount() == 1
+    assert dst.db.scalar("select flds from notes").startswith("goodbye")
+
 def test_csv():
     deck = getEmptyCol()
     file = str(os.path.join(testDir, "support/text-2fields.txt"))
@@ -163,6 +210,83 @@ def test_csv():
     assert deck.cardCount() == 11
     deck.close()
 
+def test_csv_tagsUpdated():
+    deck = getEmptyCol()
+    fd, file = tempfile.mkstemp(suffix=".txt")
+    with os.fdopen(fd, "w") as f:
+        f.write("one\tback\ta b c\ntwo\tback\td e f\n")
+    i = TextImporter(deck, file)
+    i.initMapping()
+    i.mapping = ["Front", "Back", "_tags"]
+    i.run()
+    assert deck.findNotes("tag:b") != []
+    # the rows of the tags' index, or of the undo journal, aren't notes
+    # updated
+    deck.checkpoint("Import")
+    i.run()
+    assert i.updateCount == 0
+    assert "0 notes added, 0 notes updated, 2 notes unchanged." in i.log
+    with open(file, "w") as f:
+        f.write("one\tback2\ta b c\ntwo\tback\td e f\n")
+    i = TextImporter(deck, file)
+    i.initMapping()
+    i.mapping = ["Front", "Back", "_tags"]
+    i.run()
+    assert i.updateCount == 1
+    assert "0 notes added, 1 note updated, 1 note unchanged." in i.log
+    deck.close()
+
+def test_csv_batches():
+    # duplicates must be found across batches, in the file and in the
+    # collection
+    deck = getEmptyCol()
+    file = str(os.path.join(testDir, "support/text-2fields.txt"))
+    i = TextImporter(deck, file)
+    i.batchSize = 2
+    i.initMapping()
+    processed = []
+    addHook("importedNotes", processed.append)
+    try:
+        i.run()
+    finally:
+        remHook("importedNotes", processed.append)
+    assert len(i.log) == 5
+    assert i.total == 5
+    assert processed == [2, 4, 6, 7]
+    i.run()
+    assert len(i.log) == 10
+    assert i.total == 5
+    assert deck.cardCount() == 5
+    deck.close()
+
+def test_csv_streaming():
+    deck = getEmptyCol()
+    file = str(os.path.join(testDir, "support/text-2fields.txt"))
+    i = TextImporter(deck, file)
+    i.streaming = True
+    i.batchSize = 2
+    i.initMapping()
+    i.run()
+    assert len(i.log) == 5
+    assert i.total == 5
+    assert i.ignored == 2
+    i.run()
+    assert len(i.log) == 10
+    assert i.total == 5
+    assert deck.cardCount() == 5
+    # the tags header and comments are not imported
+    fd, file = tempfile.mkstemp(suffix=".txt")
+    with os.fdopen(fd, "w") as f:
+        f.write("tags:boom\n# a comment\nnew1\tback\nnew2\tback\n")
+    i = TextImporter(deck, file)
+    i.streaming = True
+    i.initMapping()
+    i.run()
+    n = deck.getNote(deck.db.scalar("select max(id) from notes"))
+    assert "boom" in n.tags
+    assert deck.noteCount() == 7
+    deck.close()
+
 def test_csv2():
     deck = getEmptyCol()
     mm = deck.models
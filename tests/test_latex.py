@@ -2,8 +2,11 @@
 
 import os
 import shutil
+import sys
+import tempfile
 
-from anki.utils import stripHTML
+from anki import Collection as aopen
+from anki.utils import checksum, stripHTML
 from tests.shared import getEmptyCol
 
 
@@ -27,7 +30,6 @@ def test_latex():
         print("aborting test; latex or dvipng is not installed")
         return
     # fix path
-    d.buggedLatex.clear()
     anki.latex.pngCommands[0][0] = "latex"
     # check media db should cause latex to be generated
     d.media.check()
@@ -94,3 +96,63 @@ def _test_includes_bad_command(bad):
     d.addNote(f)
     q = f.cards()[0].q()
     return ("'%s' is not allowed on cards" % bad in q, "Card content: %s" % q)
+
+def test_latexBuilder():
+    d = getEmptyCol()
+    runs = os.path.join(tempfile.mkdtemp(), "runs")
+    # fake commands, counting the compilations
+    import anki.latex
+    oldCommands = anki.latex.pngCommands
+    anki.latex.pngCommands = [
+        [sys.executable, "-c", "import sys; open(%r, 'a').write('x'); "
+         "sys.exit('bad' in open('tmp.tex').read() and 'LaTeX error')" % runs],
+        [sys.executable, "-c", "open('tmp.png', 'w').write('png')"]]
+    try:
+        for front in ("[$]a[/$]", "[$]a[/$] [$]b[/$]", "[$]bad[/$]"):
+            f = d.newNote()
+            f['Front'] = front
+            d.addNote(f)
+        # each expression is compiled once, when the notes were added
+        assert len(open(runs).read()) == 3
+        assert sorted(os.listdir(d.media.dir())) == sorted(
+            ["latex-%s.png" % checksum(text) for text in ("$a$", "$b$")])
+        # missing images are compiled again, but not the failures
+        for file in os.listdir(d.media.dir()):
+            os.unlink(os.path.join(d.media.dir(), file))
+        futures = d.latex.prerender()
+        assert len(futures) == 2
+        for future in futures:
+            assert future.result() == ("", True)
+        assert len(open(runs).read()) == 5
+        # the failure is remembered by the collection
+        assert "Error executing" in f.cards()[0].q()
+        path = d.path
+        d.close()
+        d = aopen(path)
+        assert "Error executing" in d.getNote(f.id).cards()[0].q()
+        assert not d.latex.prerender()
+        assert len(open(runs).read()) == 5
+        # until media are checked
+        d.media.check()
+        assert len(open(runs).read()) == 6
+    finally:
+        anki.latex.pngCommands = oldCommands
+
+def test_latexErrorsSaved():
+    d = getEmptyCol()
+    # a failure alone is saved, without changing the collection
+    d.latex._addError("key", "error", True)
+    d.latex.flush()
+    mod = d.mod
+    path = d.path
+    d.close()
+    d = aopen(path)
+    assert d.latex.error("key") == "error"
+    assert d.mod == mod
+    # and forgotten if rolled back
+    d.latex._addError("key2", "error", True)
+    d.latex.flush()
+    assert d.latex.error("key2") == "error"
+    d.rollback()
+    assert d.latex.error("key2") is None
+    assert d.latex.error("key") == "error"
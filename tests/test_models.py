@@ -1,7 +1,10 @@
 # coding: utf-8
 
+import json
+
 import anki.template
 from anki.consts import MODEL_CLOZE
+from anki.registry import LazyRegistry
 from anki.utils import joinFields, stripHTML
 from tests.shared import getEmptyCol
 
@@ -16,6 +19,29 @@ def test_modelDelete():
     deck.models.current().rem()
     assert deck.cardCount() == 0
 
+def test_lazyModels():
+    deck = getEmptyCol()
+    models = deck.models.models
+    # nothing is created when the collection is opened
+    assert models.loaded() == 0
+    assert deck.decks.dconf.loaded() == 0
+    basic = deck.models.get(deck.conf['curModel'])
+    assert models.loaded() == 1
+    assert deck.models.get(basic.getId()) is basic
+    # but the registry still behaves as a dict of models
+    assert len(deck.models.all()) == len(models) == models.loaded()
+    assert json.loads(json.dumps(models))[str(basic.getId())]['name'] == basic.getName()
+    # copies have every object, not None for those not yet created
+    for objects in (deck.models.models, deck.decks.dconf):
+        for copy in (dict, lambda r: {**r}, lambda r: r.copy()):
+            fresh = LazyRegistry(objects.create, json.dumps(objects))
+            assert all(obj is not None for obj in copy(fresh).values())
+        fresh = LazyRegistry(objects.create, json.dumps(objects))
+        assert fresh.setdefault(next(iter(fresh))) is not None
+        fresh = LazyRegistry(objects.create, json.dumps(objects))
+        assert fresh == dict(fresh) and fresh.loaded() == len(fresh)
+    assert set(deck.loadTimes) == {"read", "models", "decks", "tags"}
+
 def test_modelCopy():
     deck = getEmptyCol()
     m = deck.models.current()
@@ -299,6 +325,46 @@ def test_modelChange():
     assert str(f.mid) == basic['id']
     assert deck.db.scalar("select count() from cards where nid = ?", f.id) == 1
 
+def test_modelChangeBatches():
+    deck = getEmptyCol()
+    basic = deck.models.byName("Basic")
+    t = basic.newTemplate("Reverse", "{{Back}}", "{{Front}}")
+    basic.save()
+    nids = []
+    for i in range(5):
+        f = deck.newNote()
+        f['Front'] = 'f%d' % i
+        f['Back'] = 'b%d' % i
+        deck.addNote(f)
+        nids.append(f.id)
+    # swapping both the fields and the cards generates nothing
+    assert basic._ordsToGenerate(basic, {0: 1, 1: 0}, {0: 1, 1: 0}) == set()
+    # a template receiving no card, or the cards of a template with
+    # another requirement, may miss cards
+    assert basic._ordsToGenerate(basic, None, {0: None, 1: 1}) == {0}
+    assert basic._ordsToGenerate(basic, {0: 1, 1: 0}, None) == {0, 1}
+    basic.changeBatchSize = 2
+    calls = []
+    def cancel(done, total):
+        calls.append((done, total))
+        return done == 4
+    assert not basic.change(basic, nids, {0: 1, 1: 0}, {0: 1, 1: 0}, cancel)
+    assert calls == [(2, 5), (4, 5)]
+    # nothing was changed
+    assert deck.getNote(nids[0])['Front'] == 'f0'
+    assert deck.db.scalar("select count() from cards where ord = 0 and id in "
+                          "(select min(id) from cards group by nid)") == 5
+    del calls[:]
+    assert basic.change(basic, nids, {0: 1, 1: 0}, {0: 1, 1: 0},
+                        lambda done, total: calls.append(done))
+    assert calls == [2, 4, 5]
+    f = deck.getNote(nids[4])
+    assert f['Front'] == 'b4'
+    # the first card still shows the old front, as its second card
+    assert f.cards()[1].q().endswith("f4")
+    assert f.cards()[1].id < f.cards()[0].id
+    assert deck.cardCount() == 10
+
 def test_templates():
     d = dict(Foo="x", Bar="y")
     assert anki.template.render("{{Foo}}", d) == "x"
@@ -1,6 +1,7 @@
 # coding: utf-8
 
 import os
+import threading
 
 from tests.shared import getEmptyCol
 
@@ -23,6 +24,33 @@ def test_graphs_empty():
     d = getEmptyCol()
     assert d.stats().report()
 
+def test_graphs_parallel():
+    d = getEmptyCol()
+    f = d.newNote()
+    f['Front'] = "foo"
+    d.addNote(f)
+    d.reset()
+    c = d.sched.getCard()
+    d.sched.answerCard(c, 3)
+    d.save()
+    g = d.stats()
+    assert g._canParallelize()
+    # the decks are only read on the calling thread
+    threads = set()
+    for name in ("active", "all", "current"):
+        def record(*args, method=getattr(d.decks, name)):
+            threads.add(threading.get_ident())
+            return method(*args)
+        setattr(d.decks, name, record)
+    parts = []
+    rep = g.report(onSection=parts.append)
+    assert threads == {threading.get_ident()}
+    assert set(g.timings) == set(g.sections)
+    assert rep == "<center>%s</center>" % "".join(parts)
+    # same sections as when computed on the main connection
+    g.parallel = False
+    assert list(g.reportSections())[:-1] == parts[1:-1]
+
 def test_graphs():
     from anki import Collection as aopen
     d = aopen(os.path.expanduser("~/test.anki2"))
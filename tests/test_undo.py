@@ -21,10 +21,12 @@ def test_op():
     d.undo()
     assert not d.undoName()
     assert 'abc' not in d.conf
-    # an (auto)save will clear the undo
+    # an (auto)save commits, but the action can still be undone
     d.save("foo")
     assert d.undoName() == "foo"
     d.save()
+    assert d.undoName() == "foo"
+    d.undo()
     assert not d.undoName()
     # and a review will, too
     d.save("add")
@@ -86,4 +88,129 @@ def test_review():
     d.save("foo")
     assert d.undoName() == "foo"
     d.undo()
+    # the review is the previous action
+    assert d.undoName() == "Review"
+    d.undo()
+    d.reset()
+    assert d.sched.counts() == (2, 0, 0)
+    assert not d.undoName()
+
+def test_redo():
+    d = getEmptyCol()
+    d.checkpoint("add")
+    f = d.newNote()
+    f['Front'] = "one"
+    d.addNote(f)
+    d.save()
+    d.checkpoint("edit")
+    f['Front'] = "two"
+    f.addTag("edited")
+    f.flush()
+    assert d.findNotes("tag:edited") == [f.id]
+    # undo the edit, then the addition
+    d.undo()
+    assert d.undoName() == "add"
+    assert d.redoName() == "edit"
+    f.load()
+    assert f['Front'] == "one"
+    assert d.findNotes("tag:edited") == []
+    d.undo()
+    assert not d.undoName()
+    assert d.noteCount() == 0 and d.cardCount() == 0
+    # and redo both
+    d.redo()
+    assert d.noteCount() == 1 and d.cardCount() == 1
+    assert d.redoName() == "edit"
+    d.redo()
+    assert not d.redoName()
+    assert d.undoName() == "edit"
+    f.load()
+    assert f['Front'] == "two"
+    assert d.findNotes("tag:edited") == [f.id]
+    # a new change after an undo prevents redoing
+    d.undo()
+    f['Front'] = "three"
+    f.flush()
+    assert not d.redoName()
+    assert d.undoName() == "add"
+
+
+def test_undoBounded():
+    d = getEmptyCol()
+    journal = d._undo
+    # nothing is logged before a step starts
+    f = d.newNote()
+    f['Front'] = "one"
+    d.addNote(f)
+    assert not d.db.scalar("select count() from undolog")
+    # a step outgrowing maxSize is forgotten as it is logged
+    journal.maxSize = 2000
+    d.checkpoint("add")
+    for i in range(100):
+        f = d.newNote()
+        f['Front'] = "note %d" % i
+        d.addNote(f)
+    assert journal._size() <= journal.maxSize + 100
+    assert not d.undoName()
+    assert d.noteCount() == 101
+    # a smaller step can still be undone
+    d.checkpoint("edit")
+    f['Front'] = "edited"
+    f.flush()
+    assert d.undoName() == "edit"
+    d.undo()
+    f.load()
+    assert f['Front'] == "note 99"
+    # a bulk operation isn't journaled
+    d.checkpoint("edit")
+    f['Front'] = "edited"
+    f.flush()
+    with d.withoutUndo():
+        d.db.execute("update notes set usn = usn")
+        d.remNotes([f.id])
     assert not d.undoName()
+    assert not d.db.scalar("select count() from undolog")
+    assert d.noteCount() == 100
+    # and the journal works again after
+    d.checkpoint("edit")
+    f = d.getNote(d.db.scalar("select id from notes limit 1"))
+    f['Front'] = "edited"
+    f.flush()
+    d.undo()
+    f.load()
+    assert f['Front'] != "edited"
+
+
+def test_reviewLogSize():
+    d = getEmptyCol()
+    # many decks, whose blob is big
+    for i in range(300):
+        d.decks.id("deck %d" % i)
+    for i in range(10):
+        f = d.newNote()
+        f['Front'] = "note %d" % i
+        d.addNote(f)
+    d.save()
+    d.reset()
+    assert len(d.db.scalar("select decks from col")) > 50000
+    deck = d.decks.get(1)
+    newToday = deck['newToday'][1]
+    c = d.sched.getCard()
+    d.sched.answerCard(c, 3)
+    size = d._undo._size()
+    for i in range(5):
+        c = d.sched.getCard()
+        d.sched.answerCard(c, 3)
+    # the decks are not logged for each review
+    assert (d._undo._size() - size) / 5 < 2000
+    assert deck['newToday'][1] == newToday + 6
+    # but their counts are undone and redone
+    d.undo()
+    d.undo()
+    assert d.decks.get(1)['newToday'][1] == newToday + 4
+    d.redo()
+    assert d.decks.get(1)['newToday'][1] == newToday + 5
+    d.undo()
+    d.reset()
+    assert d.decks.get(1)['newToday'][1] == newToday + 4
+    assert d.sched.counts()[0] == 6
@@ -1,8 +1,126 @@
 # coding: utf-8
 
-from anki.utils import fmtTimeSpan
+import os
+import sys
+import tempfile
+import time
+from difflib import SequenceMatcher
+
+from anki.diff import matchingBlocks
+from anki.hooks import (addHook, hookProfile, hookProfileJson, remHook,
+                        runFilter, runHook, startHookProfile, stopHookProfile)
+from anki.profiler import StartupProfiler
+from anki.utils import call, fmtTimeSpan
 
 
 def test_fmtTimeSpan():
     assert fmtTimeSpan(5) == "5 seconds"
     assert fmtTimeSpan(5, inTime=True) == "in 5 seconds"
+
+def test_matchingBlocks():
+    def check(a, b):
+        blocks = matchingBlocks(a, b)
+        assert blocks[-1] == (len(a), len(b), 0)
+        i = j = 0
+        for x, y, n in blocks[:-1]:
+            assert n and x >= i and y >= j and a[x:x+n] == b[y:y+n]
+            i, j = x + n, y + n
+        return blocks
+    for a, b in (("", ""), ("abc", ""), ("", "abc"), ("abc", "abc"),
+                 ("helo", "hello"), ("the quick fox", "the quick brown fox")):
+        assert check(a, b) == SequenceMatcher(None, a, b, autojunk=False).get_matching_blocks()
+    # a longest common subsequence
+    assert sum(n for _, _, n in check("abcabba", "cbabac")) == 4
+    # a long answer with typos is compared without a quadratic search
+    correct = "".join("line %d: print(value[%d])\n" % (i, i) for i in range(200))
+    given = correct.replace("print", "prnit").replace("[1", "[")
+    start = time.time()
+    blocks = check(given, correct)
+    assert time.time() - start < 1
+    assert sum(n for _, _, n in blocks) > len(given) - 600
+    # and so are strings with little in common
+    check("x" * 500 + "ab" * 500, "y" * 500 + "ba" * 500)
+
+def test_startupProfiler():
+    folder = tempfile.mkdtemp()
+    os.mkdir(os.path.join(folder, "profiledpkg"))
+    open(os.path.join(folder, "profiledpkg", "__init__.py"), "w").close()
+    with open(os.path.join(folder, "profiledpkg", "slow.py"), "w") as f:
+        f.write("import time\ntime.sleep(0.05)\n")
+    with open(os.path.join(folder, "profiledmod.py"), "w") as f:
+        f.write("import profiledpkg\nfrom profiledpkg import slow\n")
+    sys.path.insert(0, folder)
+    profiler = StartupProfiler()
+    try:
+        profiler.start(os.path.join(folder, "report.txt"))
+        with profiler.phase("outer"):
+            with profiler.phase("inner"):
+                import profiledmod
+        profiler.finish()
+    finally:
+        sys.path.remove(folder)
+    assert not profiler.enabled
+    assert profiler.importedModules() == [
+        "profiledmod", "profiledpkg", "profiledpkg.(slow)"]
+    (_, modSeconds, modSelf, modDepth), _, (_, seconds, _, depth) = profiler.imports
+    assert seconds >= 0.05 and modSeconds >= seconds
+    # the time of the nested import is not counted twice
+    assert modSelf < 0.05
+    assert (modDepth, depth) == (0, 1)
+    assert [(name, depth) for name, _, depth in profiler.phases] == [("outer", 0), ("inner", 1)]
+    report = open(os.path.join(folder, "report.txt")).read()
+    assert "profiledpkg.(slow)" in report and "inner" in report
+    # once stopped, nothing is measured
+    with profiler.phase("late"):
+        pass
+    assert len(profiler.phases) == 2
+
+def test_hookProfile():
+    calls = []
+    def onHook(x):
+        calls.append(x)
+    def onFilter(x):
+        return x + 1
+    addHook("testProfile", onHook)
+    assert hookProfile() == []
+    startHookProfile()
+    addHook("testProfileFilter", onFilter)
+    # the function is found on the hook while profiled
+    addHook("testProfile", onHook)
+    runHook("testProfile", 1)
+    runHook("testProfile", 2)
+    assert runFilter("testProfileFilter", 1) == 2
+    assert calls == [1, 2]
+    records = {record['hook']: record for record in hookProfile()}
+    assert records['testProfile']['calls'] == 2
+    assert records['testProfile']['function'] == "test_hookProfile.<locals>.onHook"
+    # defined in tests, not in anki or aqt: considered as an add-on
+    assert records['testProfile']['addon'] == "tests"
+    assert records['testProfileFilter']['calls'] == 1
+    assert "testProfileFilter" in hookProfileJson()
+    remHook("testProfileFilter", onFilter)
+    assert stopHookProfile()
+    # the original functions are back
+    runHook("testProfile", 3)
+    assert calls == [1, 2, 3]
+    assert hookProfile() == []
+    remHook("testProfile", onHook)
+
+def test_callWithoutBundledLibs():
+    old = os.environ.get("LD_LIBRARY_PATH")
+    os.environ["LD_LIBRARY_PATH"] = "/bundled"
+    try:
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        assert call([sys.executable, "-c",
+                     "import os; open(%r, 'w').write(os.environ.get("
+                     "'LD_LIBRARY_PATH', 'unset'))" % path]) == 0
+        assert open(path).read() == "unset"
+        # without changing the environment of the process meanwhile
+        assert os.environ["LD_LIBRARY_PATH"] == "/bundled"
+        os.unlink(path)
+    finally:
+        if old is None:
+            del os.environ["LD_LIBRARY_PATH"]
+        else:
+            os.environ["LD_LIBRARY_PATH"] = old
@@ -15,9 +15,11 @@ fi
 mkdir -p aqt/forms
 
 init=aqt/forms/__init__.py
-temp=aqt/forms/scratch
-rm -f $init $temp
+rm -f $init
 echo "# This file auto-generated by build_ui.sh. Don't edit." > $init
+echo "import importlib" >> $init
+echo "import sys" >> $init
+echo "import types" >> $init
 echo "__all__ = [" >> $init
 
 echo "Generating forms.."
@@ -26,7 +28,6 @@ do
     base=$(basename $i .ui)
     py="aqt/forms/${base}.py"
     echo "	\"$base\"," >> $init
-    echo "from . import $base" >> $temp
     if [ $i -nt $py ]; then
         echo " * "$py
         pyuic5 --from-imports $i -o $py.tmp
@@ -39,8 +40,19 @@ EOF
     fi
 done
 echo "]" >> $init
-cat $temp >> $init
-rm $temp
+# forms are imported when first used, not all at startup. A module
+# level __getattr__ would need Python 3.7.
+cat >> $init <<EOF
+
+class _LazyForms(types.ModuleType):
+    def __getattr__(self, name):
+        if name not in __all__:
+            raise AttributeError(name)
+        # importing the form sets it as an attribute of this module
+        return importlib.import_module("." + name, __name__)
+
+sys.modules[__name__].__class__ = _LazyForms
+EOF
 
 echo "Building resources.."
 pyrcc5 designer/icons.qrc -o aqt/forms/icons_rc.py